@@ -1,27 +1,242 @@
-"""Модуль расчета контрольной цифры для EAN-13"""
-
-
-def ean13_checksum(first_12_digits):
-    """
-    Расчет контрольной цифры для EAN-13
-    
-    Args:
-        first_12_digits: Первые 12 цифр штрих-кода (строка)
-        
-    Returns:
-        tuple: (checksum, even_sum, odd_sum, total) - контрольная цифра, сумма четных, сумма нечетных, общая сумма
-    """
-    if len(first_12_digits) != 12:
-        raise ValueError("Должно быть ровно 12 цифр")
-    
-    # Четные позиции (2, 4, 6, 8, 10, 12) - индексы 1, 3, 5, 7, 9, 11
-    even_sum = sum(int(first_12_digits[i]) for i in range(1, 12, 2))
-    
-    # Нечетные позиции (1, 3, 5, 7, 9, 11) - индексы 0, 2, 4, 6, 8, 10
-    odd_sum = sum(int(first_12_digits[i]) for i in range(0, 12, 2))
-    
-    total = odd_sum + even_sum * 3
-    checksum = (10 - (total % 10)) % 10
-    
-    return checksum, even_sum, odd_sum, total
-
+"""Модуль расчета контрольных цифр штрих-кодов (EAN-13, EAN-8, UPC-A, ITF-14, GTIN)"""
+
+import io
+from functools import lru_cache
+from itertools import chain, compress, islice
+
+import numpy as np
+
+
+def ean13_checksum(first_12_digits):
+    """
+    Расчет контрольной цифры для EAN-13
+    
+    Args:
+        first_12_digits: Первые 12 цифр штрих-кода (строка)
+        
+    Returns:
+        tuple: (checksum, even_sum, odd_sum, total) - контрольная цифра, сумма четных, сумма нечетных, общая сумма
+    """
+    if len(first_12_digits) != 12:
+        raise ValueError("Должно быть ровно 12 цифр")
+    
+    # Четные позиции (2, 4, 6, 8, 10, 12) - индексы 1, 3, 5, 7, 9, 11
+    even_sum = sum(int(first_12_digits[i]) for i in range(1, 12, 2))
+    
+    # Нечетные позиции (1, 3, 5, 7, 9, 11) - индексы 0, 2, 4, 6, 8, 10
+    odd_sum = sum(int(first_12_digits[i]) for i in range(0, 12, 2))
+    
+    total = odd_sum + even_sum * 3
+    checksum = (10 - (total % 10)) % 10
+    
+    return checksum, even_sum, odd_sum, total
+
+
+
+# ========== ПАКЕТНЫЙ РАСЧЕТ (GS1) ==========
+
+# Допустимые длины полного кода (с контрольной цифрой) для каждой символики
+BARCODE_SYMBOLOGIES = {
+    "EAN-13": (13,),
+    "EAN-8": (8,),
+    "UPC-A": (12,),
+    "ITF-14": (14,),
+    "GTIN": (8, 12, 13, 14),
+}
+
+# Количество строк, обрабатываемых за один проход
+BARCODE_CHUNK_SIZE = 65536
+
+# Статусы строк пакета
+BARCODE_OK = 0            # Контрольная цифра верна (или рассчитана)
+BARCODE_WRONG_CHECK = 1   # Контрольная цифра не совпадает
+BARCODE_MALFORMED = 2     # Строка не является кодом нужной длины
+
+
+@lru_cache(maxsize=None)
+def gs1_weights(width):
+    """
+    Веса GS1 для кода заданной длины (с контрольной цифрой)
+    
+    Справа налево: контрольная цифра — 1, затем 3, 1, 3, ...
+    Дополнение нулями слева сумму не меняет, поэтому веса общие для всех символик.
+    
+    Args:
+        width: Длина кода вместе с контрольной цифрой
+        
+    Returns:
+        numpy.ndarray: Веса позиций (int32)
+    """
+    weights = np.where(np.arange(width)[::-1] % 2 == 1, 3, 1).astype(np.int32)
+    weights.setflags(write=False)
+    return weights
+
+
+def _code_width(symbology):
+    """Ширина строки матрицы (максимальная длина кода) для символики"""
+    if symbology not in BARCODE_SYMBOLOGIES:
+        raise ValueError(f"Неизвестная символика: {symbology}")
+    return max(BARCODE_SYMBOLOGIES[symbology])
+
+
+def digits_matrix(lines):
+    """
+    Матрица цифр из строк одинаковой длины
+    
+    Args:
+        lines: Список строк из цифр
+        
+    Returns:
+        numpy.ndarray: Матрица (N, k) из uint8
+    """
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    width = len(lines[0])
+    buffer = ''.join(lines).encode('ascii', errors='replace')
+    return (np.frombuffer(buffer, dtype=np.uint8) - ord('0')).reshape(len(lines), width)
+
+
+def complete_checksums(matrix, symbology="EAN-13"):
+    """
+    Расчет контрольных цифр для матрицы кодов без контрольной цифры
+    
+    Args:
+        matrix: Матрица цифр (N, k), где k — длина кода без контрольной цифры
+        symbology: Символика из BARCODE_SYMBOLOGIES
+        
+    Returns:
+        numpy.ndarray: Контрольные цифры (N,)
+    """
+    width = _code_width(symbology)
+    weights = gs1_weights(width)[width - 1 - matrix.shape[1]:width - 1]
+    return (-(matrix @ weights)) % 10
+
+
+def validate_checksums(matrix, symbology="EAN-13"):
+    """
+    Проверка матрицы полных кодов
+    
+    При весе 1 у контрольной цифры корректный код дает сумму, кратную 10,
+    поэтому проверка и расчет ожидаемой цифры — одно скалярное произведение.
+    
+    Args:
+        matrix: Матрица цифр (N, k), где k — длина кода с контрольной цифрой
+        symbology: Символика из BARCODE_SYMBOLOGIES
+        
+    Returns:
+        tuple: (valid, expected) - признаки корректности и ожидаемые контрольные цифры
+    """
+    width = _code_width(symbology)
+    totals = (matrix @ gs1_weights(width)[width - matrix.shape[1]:]) % 10
+    expected = (matrix[:, -1] - totals) % 10
+    return totals == 0, expected
+
+
+def _check_chunk(lines, symbology, complete):
+    """Проверка одного блока строк: (check_digits, status)"""
+    lengths = BARCODE_SYMBOLOGIES[symbology]
+    offset = 1 if complete else 0
+    width = max(lengths) - offset
+    
+    codes = list(map(str.strip, lines))
+    accepted = [length - offset for length in lengths]
+    well_sized = np.isin(np.fromiter(map(len, codes), dtype=np.int64, count=len(codes)), accepted)
+    
+    check_digits = np.full(len(codes), -1, dtype=np.int8)
+    status = np.full(len(codes), BARCODE_MALFORMED, dtype=np.int8)
+    
+    rows = np.flatnonzero(well_sized)
+    if not len(rows):
+        return check_digits, status
+    
+    selected = codes if len(rows) == len(codes) else list(compress(codes, well_sized))
+    if len(accepted) > 1:
+        selected = [code.zfill(width) for code in selected]
+    matrix = digits_matrix(selected)
+    
+    # Символы вне '0'-'9' после вычитания '0' дают значения больше 9
+    digits_ok = (matrix <= 9).all(axis=1)
+    rows, matrix = rows[digits_ok], matrix[digits_ok]
+    
+    if complete:
+        check_digits[rows] = complete_checksums(matrix, symbology)
+        status[rows] = BARCODE_OK
+    else:
+        valid, expected = validate_checksums(matrix, symbology)
+        check_digits[rows] = expected
+        status[rows] = np.where(valid, BARCODE_OK, BARCODE_WRONG_CHECK)
+    return check_digits, status
+
+
+def check_barcode_lines(lines, symbology="EAN-13", complete=False, chunk_size=BARCODE_CHUNK_SIZE):
+    """
+    Пакетная проверка или дополнение кодов контрольными цифрами
+    
+    Строки читаются блоками, поэтому источником может быть открытый файл.
+    
+    Args:
+        lines: Итерируемый набор строк (список, файл)
+        symbology: Символика из BARCODE_SYMBOLOGIES
+        complete: True — строки без контрольной цифры (рассчитать),
+            False — полные коды (проверить)
+        chunk_size: Количество строк в блоке
+        
+    Returns:
+        tuple: (check_digits, status) - контрольные цифры (рассчитанные или ожидаемые,
+            -1 для некорректных строк) и статусы строк (BARCODE_OK и др.)
+    """
+    _code_width(symbology)
+    iterator = iter(lines)
+    digit_chunks, status_chunks = [], []
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        check_digits, status = _check_chunk(chunk, symbology, complete)
+        digit_chunks.append(check_digits)
+        status_chunks.append(status)
+    
+    if not status_chunks:
+        return np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int8)
+    return np.concatenate(digit_chunks), np.concatenate(status_chunks)
+
+
+def check_barcode_batch(source, symbology="EAN-13", complete=False, preview_size=20):
+    """
+    Пакетная проверка кодов из текста или загруженного файла
+    
+    Файл читается построчно, в памяти остаются только первые строки для вывода.
+    
+    Args:
+        source: Текст (строки через перевод строки) или файл в памяти (BytesIO, UTF-8)
+        symbology: Символика из BARCODE_SYMBOLOGIES
+        complete: True — рассчитать контрольные цифры, False — проверить полные коды
+        preview_size: Сколько первых строк вернуть для вывода
+        
+    Returns:
+        tuple: (preview, check_digits, status) - первые строки и результаты check_barcode_lines
+    """
+    if isinstance(source, str):
+        lines = iter(source.splitlines())
+    else:
+        lines = io.TextIOWrapper(source, encoding="utf-8", errors="replace")
+    preview = list(islice(lines, preview_size))
+    check_digits, status = check_barcode_lines(chain(preview, lines), symbology, complete)
+    return preview, check_digits, status
+
+
+def barcode_batch_summary(status):
+    """
+    Сводка по результатам пакета
+    
+    Args:
+        status: Статусы строк из check_barcode_lines
+        
+    Returns:
+        tuple: (total, ok_count, wrong_rows, malformed_rows) - количество строк,
+            количество корректных и номера строк (с 1) с ошибками
+    """
+    counts = np.bincount(status, minlength=3)
+    wrong_rows = np.flatnonzero(status == BARCODE_WRONG_CHECK) + 1
+    malformed_rows = np.flatnonzero(status == BARCODE_MALFORMED) + 1
+    return len(status), int(counts[BARCODE_OK]), wrong_rows, malformed_rows
@@ -0,0 +1,169 @@
+"""Компактный битовый вектор для модулей вычислений"""
+
+
+# Таблица разворота битов в байте (для быстрого перевода из bytes)
+_REVERSED_BYTES = bytes(int(format(value, '08b')[::-1], 2) for value in range(256))
+
+
+class BitVector:
+    """
+    Битовая последовательность, упакованная в целое число
+
+    Бит i числа value соответствует i-му символу строкового представления,
+    поэтому индексация и срезы совпадают со срезами строки из '0' и '1'.
+    Подсчет единиц, XOR, инверсия и конкатенация выполняются операциями
+    над целым числом, а не циклом по символам.
+
+    Attributes:
+        value: Целое число с битами последовательности
+        length: Длина последовательности в битах
+    """
+
+    __slots__ = ("value", "length")
+
+    def __init__(self, value=0, length=0):
+        if length < 0:
+            raise ValueError("Длина битового вектора не может быть отрицательной")
+        self.value = value & ((1 << length) - 1)
+        self.length = length
+
+    @classmethod
+    def from_str(cls, bits):
+        """
+        Создание вектора из строки '0'/'1'
+
+        Args:
+            bits: Двоичная строка
+
+        Returns:
+            BitVector: Битовый вектор
+        """
+        if not bits:
+            return cls()
+        return cls(int(bits[::-1], 2), len(bits))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Создание вектора из байтов (старший бит каждого байта идет первым)
+
+        Args:
+            data: Байты
+
+        Returns:
+            BitVector: Битовый вектор длиной 8 * len(data)
+        """
+        return cls(int.from_bytes(bytes(data).translate(_REVERSED_BYTES), 'little'), len(data) * 8)
+
+    @classmethod
+    def from_int(cls, number, length):
+        """
+        Создание вектора из числа в обычной записи (старший бит первым)
+
+        Args:
+            number: Неотрицательное целое число
+            length: Количество разрядов
+
+        Returns:
+            BitVector: Битовый вектор
+        """
+        return cls.from_str(format(number, f'0{length}b')[-length:] if length else "")
+
+    @classmethod
+    def coerce(cls, bits):
+        """Приведение строки или вектора к BitVector"""
+        return bits if isinstance(bits, cls) else cls.from_str(bits)
+
+    def __str__(self):
+        if not self.length:
+            return ""
+        return format(self.value, f'0{self.length}b')[::-1]
+
+    def __repr__(self):
+        return f"BitVector('{self}')"
+
+    def __len__(self):
+        return self.length
+
+    def __int__(self):
+        """Число в обычной записи (первый бит — старший)"""
+        return int(str(self), 2) if self.length else 0
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return str(self) == other
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return self.length == other.length and self.value == other.value
+
+    def __hash__(self):
+        # Согласован с __eq__: вектор равен своей строке '0'/'1' и хэшируется так же
+        return hash(str(self))
+
+    def __iter__(self):
+        value = self.value
+        for _ in range(self.length):
+            yield value & 1
+            value >>= 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step != 1:
+                return BitVector.from_str(str(self)[key])
+            length = max(stop - start, 0)
+            return BitVector(self.value >> start, length)
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("Индекс бита вне диапазона")
+        return self.value >> key & 1
+
+    def __add__(self, other):
+        other = BitVector.coerce(other)
+        return BitVector(self.value | other.value << self.length, self.length + other.length)
+
+    def __xor__(self, other):
+        other = BitVector.coerce(other)
+        if other.length != self.length:
+            raise ValueError("Для XOR длины последовательностей должны совпадать")
+        return BitVector(self.value ^ other.value, self.length)
+
+    def __invert__(self):
+        return BitVector(~self.value, self.length)
+
+    def popcount(self):
+        """Количество единиц"""
+        return bin(self.value).count('1')
+
+    def parity(self):
+        """Бит четности (0 — четное число единиц)"""
+        return self.popcount() & 1
+
+    def repeat_to(self, length):
+        """
+        Циклическое повторение или обрезка вектора до заданной длины
+
+        Args:
+            length: Требуемая длина
+
+        Returns:
+            BitVector: Вектор длины length
+        """
+        if not self.length:
+            raise ValueError("Нельзя повторить пустую последовательность")
+        value, size = self.value, self.length
+        while size < length:
+            value |= value << size
+            size *= 2
+        return BitVector(value, length)
+
+    def chunks(self, size):
+        """Разбиение на блоки по size бит (последний блок может быть короче)"""
+        for start in range(0, self.length, size):
+            yield self[start:start + size]
+
+    def to_bytes(self):
+        """Байты (старший бит каждого байта первым, неполный байт дополняется нулями)"""
+        count = (self.length + 7) // 8
+        return self.value.to_bytes(count, 'little').translate(_REVERSED_BYTES)
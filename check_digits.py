@@ -0,0 +1,254 @@
+"""Модуль табличного расчета контрольных цифр (Luhn, Verhoeff, Damm, ISBN, mod 11)"""
+
+import numpy as np
+
+from calculators.barcode_calculator import (
+    digits_matrix, gs1_weights, BARCODE_OK, BARCODE_WRONG_CHECK, BARCODE_MALFORMED
+)
+
+# Символы контрольной цифры: значение 10 записывается как 'X'
+CHECK_SYMBOLS = "0123456789X"
+
+# Luhn: удвоенная цифра с вычитанием 9
+LUHN_DOUBLE = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.uint8)
+
+# Verhoeff: таблица умножения группы диэдра D5, перестановки и обратные элементы
+VERHOEFF_D = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+], dtype=np.uint8)
+VERHOEFF_INV = np.array([0, 4, 3, 2, 1, 5, 6, 7, 8, 9], dtype=np.uint8)
+
+
+def _build_verhoeff_permutations():
+    """Таблица перестановок Verhoeff: строка i — перестановка (1 5 8 9 4 2 7 0)(3 6) в степени i"""
+    base = [1, 5, 7, 6, 2, 8, 3, 0, 9, 4]
+    table = [list(range(10))]
+    for _ in range(7):
+        table.append([base[digit] for digit in table[-1]])
+    return np.array(table, dtype=np.uint8)
+
+
+VERHOEFF_P = _build_verhoeff_permutations()
+
+# Damm: слабо тотально антисимметричная квазигруппа порядка 10
+DAMM_TABLE = np.array([
+    [0, 3, 1, 7, 5, 9, 8, 6, 4, 2],
+    [7, 0, 9, 2, 1, 5, 4, 8, 6, 3],
+    [4, 2, 0, 6, 8, 7, 1, 3, 5, 9],
+    [1, 7, 5, 0, 9, 8, 3, 4, 2, 6],
+    [6, 1, 2, 3, 0, 4, 5, 9, 7, 8],
+    [3, 6, 7, 4, 2, 0, 9, 5, 8, 1],
+    [5, 8, 6, 9, 7, 2, 0, 1, 3, 4],
+    [8, 9, 4, 5, 3, 6, 2, 0, 1, 7],
+    [9, 4, 3, 8, 6, 1, 7, 2, 0, 5],
+    [2, 5, 8, 1, 4, 3, 6, 7, 9, 0],
+], dtype=np.uint8)
+
+# Плоские копии таблиц: элемент (a, b) находится по индексу 10 * a + b
+_VERHOEFF_D_FLAT = VERHOEFF_D.ravel()
+_DAMM_FLAT = DAMM_TABLE.ravel()
+
+for _table in (LUHN_DOUBLE, VERHOEFF_D, VERHOEFF_INV, VERHOEFF_P, DAMM_TABLE):
+    _table.setflags(write=False)
+
+
+def _luhn_batch(matrix):
+    """Luhn: каждая вторая цифра справа (начиная с крайней) удваивается по таблице"""
+    k = matrix.shape[1]
+    doubled = (k - 1 - np.arange(k)) % 2 == 0
+    total = np.where(doubled, LUHN_DOUBLE[matrix], matrix).sum(axis=1, dtype=np.int64)
+    return (-total) % 10
+
+
+def _verhoeff_batch(matrix):
+    """Verhoeff: свертка по таблицам D и P, контрольная цифра — обратный элемент"""
+    k = matrix.shape[1]
+    check = np.zeros(len(matrix), dtype=np.uint8)
+    for j, column in enumerate(np.ascontiguousarray(matrix.T)):
+        check = _VERHOEFF_D_FLAT[check * np.uint8(10) + VERHOEFF_P[(k - j) % 8][column]]
+    return VERHOEFF_INV[check]
+
+
+def _damm_batch(matrix):
+    """Damm: последовательный проход по таблице квазигруппы"""
+    check = np.zeros(len(matrix), dtype=np.uint8)
+    for column in np.ascontiguousarray(matrix.T):
+        check = _DAMM_FLAT[check * np.uint8(10) + column]
+    return check
+
+
+def _isbn10_batch(matrix):
+    """ISBN-10: веса 10, 9, ..., 2, контрольная цифра по модулю 11 (10 — 'X')"""
+    weights = np.arange(matrix.shape[1] + 1, 1, -1)
+    return (-(matrix @ weights)) % 11
+
+
+def _isbn13_batch(matrix):
+    """ISBN-13: веса 1 и 3, как у EAN-13"""
+    return (-(matrix @ gs1_weights(matrix.shape[1] + 1)[:-1])) % 10
+
+
+def _mod11_batch(matrix):
+    """Модуль 11: веса 2, 3, ..., 7 по кругу справа налево (10 — 'X')"""
+    k = matrix.shape[1]
+    weights = 2 + (k - 1 - np.arange(k)) % 6
+    return (-(matrix @ weights)) % 11
+
+
+# Реестр алгоритмов: имя -> (название, пакетная функция, допустимые длины данных или None)
+CHECK_DIGIT_ALGORITHMS = {
+    "luhn": ("Luhn", _luhn_batch, None),
+    "verhoeff": ("Verhoeff", _verhoeff_batch, None),
+    "damm": ("Damm", _damm_batch, None),
+    "isbn10": ("ISBN-10", _isbn10_batch, (9,)),
+    "isbn13": ("ISBN-13", _isbn13_batch, (12,)),
+    "mod11": ("Модуль 11", _mod11_batch, None),
+}
+
+
+def register_check_digit(name, title, batch, lengths=None):
+    """
+    Регистрация алгоритма контрольной цифры
+
+    Args:
+        name: Имя алгоритма
+        title: Название для вывода
+        batch: Функция (N, k) матрица цифр -> (N,) контрольные значения (0-10)
+        lengths: Допустимые длины данных без контрольной цифры (None — любые)
+    """
+    CHECK_DIGIT_ALGORITHMS[name] = (title, batch, lengths)
+
+
+def _algorithm(name):
+    """Поиск алгоритма в реестре"""
+    if name not in CHECK_DIGIT_ALGORITHMS:
+        raise ValueError(f"Неизвестный алгоритм: {name}")
+    return CHECK_DIGIT_ALGORITHMS[name]
+
+
+def code_matrix(lines):
+    """
+    Матрица значений символов из строк одинаковой длины ('X' и 'x' -> 10)
+
+    Args:
+        lines: Список строк
+
+    Returns:
+        numpy.ndarray: Матрица (N, k) из uint8, символы вне '0'-'9' и 'X' дают значения больше 10
+    """
+    matrix = digits_matrix(lines).copy()
+    matrix[(matrix == ord('X') - ord('0')) | (matrix == ord('x') - ord('0'))] = 10
+    return matrix
+
+
+def check_digits_batch(matrix, algorithm="luhn"):
+    """
+    Контрольные цифры для матрицы данных
+
+    Args:
+        matrix: Матрица цифр (N, k) без контрольной цифры
+        algorithm: Имя алгоритма из CHECK_DIGIT_ALGORITHMS
+
+    Returns:
+        numpy.ndarray: Контрольные значения (N,), 10 соответствует 'X'
+    """
+    _, batch, _ = _algorithm(algorithm)
+    return batch(np.asarray(matrix, dtype=np.uint8))
+
+
+def validate_batch(matrix, algorithm="luhn"):
+    """
+    Проверка матрицы полных кодов (последний столбец — контрольная цифра)
+
+    Args:
+        matrix: Матрица (N, k+1) значений символов
+        algorithm: Имя алгоритма из CHECK_DIGIT_ALGORITHMS
+
+    Returns:
+        tuple: (valid, expected) - признаки корректности и ожидаемые контрольные значения
+    """
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    expected = check_digits_batch(matrix[:, :-1], algorithm)
+    return expected == matrix[:, -1], expected
+
+
+def check_digit(payload, algorithm="luhn"):
+    """
+    Контрольная цифра для строки цифр
+
+    Args:
+        payload: Строка цифр без контрольной цифры
+        algorithm: Имя алгоритма из CHECK_DIGIT_ALGORITHMS
+
+    Returns:
+        str: Контрольный символ ('0'-'9' или 'X')
+    """
+    title, _, lengths = _algorithm(algorithm)
+    if not payload or not payload.isdigit():
+        raise ValueError("Данные должны состоять из цифр")
+    if lengths and len(payload) not in lengths:
+        raise ValueError(f"{title}: требуется цифр без контрольной: {', '.join(map(str, lengths))}")
+    return CHECK_SYMBOLS[int(check_digits_batch(digits_matrix([payload]), algorithm)[0])]
+
+
+def validate_check_digit(code, algorithm="luhn"):
+    """
+    Проверка кода с контрольной цифрой в конце
+
+    Args:
+        code: Строка с кодом
+        algorithm: Имя алгоритма из CHECK_DIGIT_ALGORITHMS
+
+    Returns:
+        bool: True, если контрольная цифра верна
+    """
+    if len(code) < 2:
+        return False
+    try:
+        return check_digit(code[:-1], algorithm) == code[-1].upper()
+    except ValueError:
+        return False
+
+
+def validate_lines(lines, algorithm="luhn"):
+    """
+    Пакетная проверка строк с кодами разной длины
+
+    Строки группируются по длине, каждая группа проверяется одной матричной операцией.
+
+    Args:
+        lines: Список строк
+        algorithm: Имя алгоритма из CHECK_DIGIT_ALGORITHMS
+
+    Returns:
+        tuple: (expected, status) - ожидаемые контрольные значения (-1 для некорректных строк)
+            и статусы строк (BARCODE_OK, BARCODE_WRONG_CHECK, BARCODE_MALFORMED)
+    """
+    _, _, lengths = _algorithm(algorithm)
+    codes = [line.strip() for line in lines]
+    code_lengths = np.fromiter(map(len, codes), dtype=np.int64, count=len(codes))
+
+    expected = np.full(len(codes), -1, dtype=np.int8)
+    status = np.full(len(codes), BARCODE_MALFORMED, dtype=np.int8)
+
+    for length in np.unique(code_lengths):
+        if length < 2 or (lengths and length - 1 not in lengths):
+            continue
+        rows = np.flatnonzero(code_lengths == length)
+        matrix = code_matrix([codes[i] for i in rows])
+        # 'X' допустим только на месте контрольной цифры
+        well_formed = (matrix[:, :-1] <= 9).all(axis=1) & (matrix[:, -1] <= 10)
+        rows, matrix = rows[well_formed], matrix[well_formed]
+        valid, group_expected = validate_batch(matrix, algorithm)
+        expected[rows] = group_expected
+        status[rows] = np.where(valid, BARCODE_OK, BARCODE_WRONG_CHECK)
+    return expected, status
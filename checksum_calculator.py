@@ -1,96 +1,442 @@
-"""Модуль расчета контрольных сумм и кодов обнаружения ошибок"""
-
-
-def parity_check(data_bits):
-    """
-    Проверка на четность
-    
-    Args:
-        data_bits: Строка с битами данных
-        
-    Returns:
-        tuple: (encoded, ones_count, parity_bit) - закодированная последовательность, количество единиц, бит четности
-    """
-    ones_count = data_bits.count('1')
-    parity_bit = '0' if ones_count % 2 == 0 else '1'
-    encoded = data_bits + parity_bit
-    return encoded, ones_count, parity_bit
-
-
-def constant_weight_code(data_bits, weight):
-    """
-    Код с постоянным весом
-    
-    Args:
-        data_bits: Строка с битами данных
-        weight: Требуемый вес (количество единиц)
-        
-    Returns:
-        tuple: (encoded, current_weight, check_bits) - закодированная последовательность, текущий вес, проверочные биты
-    """
-    current_weight = data_bits.count('1')
-    needed_ones = weight - current_weight
-    
-    if needed_ones < 0:
-        # Нужно уменьшить количество единиц
-        check_bits = '0' * abs(needed_ones)
-    elif needed_ones > 0:
-        # Нужно увеличить количество единиц
-        check_bits = '1' * needed_ones
-    else:
-        check_bits = '0'
-    
-    encoded = data_bits + check_bits
-    return encoded, current_weight, check_bits
-
-
-def inverse_code(data_bits):
-    """
-    Инверсный код
-    
-    Args:
-        data_bits: Строка с битами данных
-        
-    Returns:
-        tuple: (encoded, ones_count, check_bits) - закодированная последовательность, количество единиц, проверочные биты
-    """
-    ones_count = data_bits.count('1')
-    
-    if ones_count % 2 == 0:
-        check_bits = data_bits
-    else:
-        # Инвертировать все биты
-        check_bits = ''.join('1' if bit == '0' else '0' for bit in data_bits)
-    
-    encoded = data_bits + check_bits
-    return encoded, ones_count, check_bits
-
-
-def calculate_control_number(number, weights=None, modulus=9):
-    """
-    Расчет контрольного числа
-    
-    Args:
-        number: Число для расчета
-        weights: Веса для позиций (по умолчанию 1, 2, 3, ...)
-        modulus: Модуль для расчета (по умолчанию 9)
-        
-    Returns:
-        tuple: (control_digit, weighted_sum, weights) - контрольная цифра, взвешенная сумма, использованные веса
-    """
-    number_str = str(number)
-    
-    if weights is None:
-        weights = list(range(1, len(number_str) + 1))
-    else:
-        # Дополнить веса до нужной длины
-        while len(weights) < len(number_str):
-            weights.append(1)
-        weights = weights[:len(number_str)]
-    
-    digits = [int(d) for d in number_str]
-    weighted_sum = sum(digit * weight for digit, weight in zip(digits, weights))
-    control_digit = weighted_sum % modulus
-    
-    return control_digit, weighted_sum, weights
-
+"""Модуль расчета контрольных сумм и кодов обнаружения ошибок"""
+
+import binascii
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from calculators.bitvector import BitVector
+from calculators.steps import LazySteps
+
+
+def parity_check(data_bits):
+    """
+    Проверка на четность
+    
+    Args:
+        data_bits: Строка с битами данных или BitVector
+        
+    Returns:
+        tuple: (encoded, ones_count, parity_bit) - закодированная последовательность, количество единиц,
+            бит четности (BitVector)
+    """
+    bits = BitVector.coerce(data_bits)
+    ones_count = bits.popcount()
+    parity_bit = BitVector(ones_count & 1, 1)
+    return bits + parity_bit, ones_count, parity_bit
+
+
+def constant_weight_code(data_bits, weight):
+    """
+    Код с постоянным весом
+    
+    Args:
+        data_bits: Строка с битами данных
+        weight: Требуемый вес (количество единиц)
+        
+    Returns:
+        tuple: (encoded, current_weight, check_bits) - закодированная последовательность, текущий вес, проверочные биты
+    """
+    current_weight = data_bits.count('1')
+    needed_ones = weight - current_weight
+    
+    if needed_ones < 0:
+        # Нужно уменьшить количество единиц
+        check_bits = '0' * abs(needed_ones)
+    elif needed_ones > 0:
+        # Нужно увеличить количество единиц
+        check_bits = '1' * needed_ones
+    else:
+        check_bits = '0'
+    
+    encoded = data_bits + check_bits
+    return encoded, current_weight, check_bits
+
+
+def inverse_code(data_bits):
+    """
+    Инверсный код
+    
+    Args:
+        data_bits: Строка с битами данных или BitVector
+        
+    Returns:
+        tuple: (encoded, ones_count, check_bits) - закодированная последовательность, количество единиц,
+            проверочные биты (BitVector)
+    """
+    bits = BitVector.coerce(data_bits)
+    ones_count = bits.popcount()
+    
+    if ones_count % 2 == 0:
+        check_bits = bits
+    else:
+        # Инвертировать все биты
+        check_bits = ~bits
+    
+    encoded = bits + check_bits
+    return encoded, ones_count, check_bits
+
+
+def calculate_control_number(number, weights=None, modulus=9):
+    """
+    Расчет контрольного числа
+    
+    Args:
+        number: Число для расчета
+        weights: Веса для позиций (по умолчанию 1, 2, 3, ...)
+        modulus: Модуль для расчета (по умолчанию 9)
+        
+    Returns:
+        tuple: (control_digit, weighted_sum, weights) - контрольная цифра, взвешенная сумма, использованные веса
+    """
+    number_str = str(number)
+    
+    if weights is None:
+        weights = list(range(1, len(number_str) + 1))
+    else:
+        # Дополнить веса единицами до нужной длины (список вызывающего не изменяется)
+        weights = (list(weights) + [1] * len(number_str))[:len(number_str)]
+    
+    digits = [int(d) for d in number_str]
+    weighted_sum = sum(digit * weight for digit, weight in zip(digits, weights))
+    control_digit = weighted_sum % modulus
+    
+    return control_digit, weighted_sum, weights
+
+
+
+# ========== ЦИКЛИЧЕСКИЙ ИЗБЫТОЧНЫЙ КОД (CRC) ==========
+
+# Параметры CRC: (ширина, полином, начальное значение, отражение входа/выхода, XOR на выходе)
+CRC_PRESETS = {
+    "CRC-8": (8, 0x07, 0x00, False, 0x00),
+    "CRC-8/MAXIM": (8, 0x31, 0x00, True, 0x00),
+    "CRC-16/ARC": (16, 0x8005, 0x0000, True, 0x0000),
+    "CRC-16/XMODEM": (16, 0x1021, 0x0000, False, 0x0000),
+    "CRC-16/CCITT-FALSE": (16, 0x1021, 0xFFFF, False, 0x0000),
+    "CRC-32": (32, 0x04C11DB7, 0xFFFFFFFF, True, 0xFFFFFFFF),
+    "CRC-32C": (32, 0x1EDC6F41, 0xFFFFFFFF, True, 0xFFFFFFFF),
+}
+
+# Максимальная длина сообщения (в битах), для которой строится трассировка деления
+CRC_TRACE_LIMIT = 64
+
+# Параллельный расчет: длина участка одного потока и минимальный размер данных
+CRC_LANE_LENGTH = 1024
+CRC_LANES_MIN_SIZE = 1 << 16
+
+
+def _reflect(value, width):
+    """Зеркальное отражение width младших битов числа"""
+    return int(format(value, f'0{width}b')[::-1], 2)
+
+
+def _crc_preset(name):
+    """Параметры CRC по имени"""
+    if name not in CRC_PRESETS:
+        raise ValueError(f"Неизвестный вариант CRC: {name}")
+    return CRC_PRESETS[name]
+
+
+@lru_cache(maxsize=None)
+def crc_tables(name):
+    """
+    Таблицы CRC для обработки по 8 байт за шаг (slicing-by-8)
+    
+    Строятся при первом обращении к варианту CRC и кэшируются.
+    Таблица k описывает вклад байта, за которым следуют еще k байтов.
+    
+    Args:
+        name: Имя варианта из CRC_PRESETS
+        
+    Returns:
+        tuple: 8 кортежей по 256 значений
+    """
+    width, poly, _, reflected, _ = _crc_preset(name)
+    mask = (1 << width) - 1
+    
+    first = []
+    if reflected:
+        poly = _reflect(poly, width)
+        for byte in range(256):
+            crc = byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+            first.append(crc)
+    else:
+        top = 1 << (width - 1)
+        for byte in range(256):
+            crc = byte << (width - 8) if width >= 8 else byte
+            for _ in range(8):
+                crc = ((crc << 1) ^ poly) & mask if crc & top else (crc << 1) & mask
+            first.append(crc)
+    
+    tables = [tuple(first)]
+    for _ in range(7):
+        previous = tables[-1]
+        if reflected:
+            tables.append(tuple((crc >> 8) ^ first[crc & 0xFF] for crc in previous))
+        else:
+            tables.append(tuple(((crc << 8) & mask) ^ first[crc >> (width - 8)] for crc in previous))
+    return tuple(tables)
+
+
+def _crc_update(register, data, name):
+    """
+    Обработка байтов: регистр CRC до XOR на выходе
+    
+    Для CRC-32 и CRC-16 с полиномом 0x1021 используются функции zlib/binascii,
+    для остальных — таблицы slicing-by-8.
+    """
+    width, poly, _, reflected, _ = _crc_preset(name)
+    if name == "CRC-32":
+        return zlib.crc32(data, register ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+    if width == 16 and poly == 0x1021 and not reflected:
+        return binascii.crc_hqx(data, register)
+    
+    if len(data) >= CRC_LANES_MIN_SIZE:
+        return _crc_update_lanes(register, data, name)
+    
+    t0, t1, t2, t3, t4, t5, t6, t7 = crc_tables(name)
+    view = memoryview(data)
+    blocks = len(view) // 8 * 8
+    if reflected:
+        for i in range(0, blocks, 8):
+            x = int.from_bytes(view[i:i + 8], 'little') ^ register
+            register = (
+                t7[x & 0xFF] ^ t6[x >> 8 & 0xFF] ^ t5[x >> 16 & 0xFF] ^ t4[x >> 24 & 0xFF]
+                ^ t3[x >> 32 & 0xFF] ^ t2[x >> 40 & 0xFF] ^ t1[x >> 48 & 0xFF] ^ t0[x >> 56]
+            )
+        for byte in view[blocks:]:
+            register = (register >> 8) ^ t0[(register ^ byte) & 0xFF]
+    else:
+        shift = 64 - width
+        mask = (1 << width) - 1
+        for i in range(0, blocks, 8):
+            x = int.from_bytes(view[i:i + 8], 'big') ^ (register << shift)
+            register = (
+                t7[x >> 56] ^ t6[x >> 48 & 0xFF] ^ t5[x >> 40 & 0xFF] ^ t4[x >> 32 & 0xFF]
+                ^ t3[x >> 24 & 0xFF] ^ t2[x >> 16 & 0xFF] ^ t1[x >> 8 & 0xFF] ^ t0[x & 0xFF]
+            )
+        for byte in view[blocks:]:
+            register = ((register << 8) & mask) ^ t0[(register >> (width - 8)) ^ byte]
+    return register
+
+
+@lru_cache(maxsize=None)
+def _crc_numpy_table(name):
+    """Первая таблица CRC как массив NumPy"""
+    return np.array(crc_tables(name)[0], dtype=np.uint64)
+
+
+def _crc_lanes(registers, columns, name):
+    """Побайтовая обработка сразу нескольких независимых потоков (столбец — по байту на поток)"""
+    width, _, _, reflected, _ = _crc_preset(name)
+    table = _crc_numpy_table(name)
+    mask = np.uint64((1 << width) - 1)
+    eight, top = np.uint64(8), np.uint64(width - 8)
+    for column in columns:
+        if reflected:
+            registers = (registers >> eight) ^ table[(registers ^ column) & np.uint64(0xFF)]
+        else:
+            registers = ((registers << eight) & mask) ^ table[(registers >> top) ^ column]
+    return registers
+
+
+def _apply_operator(operator, registers):
+    """Применение линейного оператора (образы базисных битов) к массиву регистров"""
+    result = np.zeros_like(registers)
+    for bit, image in enumerate(operator):
+        result ^= np.where(registers >> np.uint64(bit) & np.uint64(1), image, np.uint64(0))
+    return result
+
+
+@lru_cache(maxsize=None)
+def _crc_shift_operator(name, length):
+    """Оператор сдвига регистра на length нулевых байтов (образы базисных битов)"""
+    width = _crc_preset(name)[0]
+    if length == CRC_LANE_LENGTH:
+        basis = np.uint64(1) << np.arange(width, dtype=np.uint64)
+        return _crc_lanes(basis, np.zeros((length, 1), dtype=np.uint8), name)
+    half = _crc_shift_operator(name, length // 2)
+    return _apply_operator(half, half)
+
+
+def _crc_update_lanes(register, data, name):
+    """
+    Параллельный расчет CRC для больших данных
+    
+    Данные делятся на 2^k участков по CRC_LANE_LENGTH байт, которые считаются
+    одновременно с нулевого регистра. CRC линеен, поэтому результаты сворачиваются
+    попарно: CRC(A + B) = сдвиг(CRC(A), len(B)) XOR CRC(B).
+    """
+    lanes = 1 << ((len(data) // CRC_LANE_LENGTH).bit_length() - 1)
+    size = lanes * CRC_LANE_LENGTH
+    matrix = np.frombuffer(data, dtype=np.uint8, count=size).reshape(lanes, CRC_LANE_LENGTH)
+    
+    registers = np.zeros(lanes, dtype=np.uint64)
+    registers[0] = register
+    registers = _crc_lanes(registers, np.ascontiguousarray(matrix.T), name)
+    
+    length = CRC_LANE_LENGTH
+    while len(registers) > 1:
+        registers = _apply_operator(_crc_shift_operator(name, length), registers[0::2]) ^ registers[1::2]
+        length *= 2
+    return _crc_update(int(registers[0]), data[size:], name)
+
+
+def _crc_start(name):
+    """Начальное значение регистра"""
+    width, _, init, reflected, _ = _crc_preset(name)
+    return _reflect(init, width) if reflected else init
+
+
+def crc_bytes(data, name="CRC-32"):
+    """
+    CRC для последовательности байтов
+    
+    Args:
+        data: Байты
+        name: Имя варианта из CRC_PRESETS
+        
+    Returns:
+        int: Значение CRC
+    """
+    _, _, _, _, xor_out = _crc_preset(name)
+    return _crc_update(_crc_start(name), data, name) ^ xor_out
+
+
+def crc_stream(stream, name="CRC-32", chunk_size=1 << 16):
+    """
+    CRC для файла, читаемого блоками
+    
+    Args:
+        stream: Двоичный поток с методом read
+        name: Имя варианта из CRC_PRESETS
+        chunk_size: Размер читаемого блока в байтах
+        
+    Returns:
+        tuple: (crc, size) - значение CRC и количество прочитанных байтов
+    """
+    _, _, _, _, xor_out = _crc_preset(name)
+    register = _crc_start(name)
+    size = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        register = _crc_update(register, chunk, name)
+        size += len(chunk)
+    return register ^ xor_out, size
+
+
+def crc_bits(data_bits, name="CRC-8"):
+    """
+    CRC для двоичной последовательности
+    
+    Полные байты обрабатываются табличным путем, оставшиеся биты — по одному
+    (только для вариантов без отражения).
+    
+    Args:
+        data_bits: Строка из '0' и '1' или BitVector
+        name: Имя варианта из CRC_PRESETS
+        
+    Returns:
+        tuple: (crc, width) - значение CRC и его разрядность
+    """
+    width, poly, _, reflected, xor_out = _crc_preset(name)
+    bits = BitVector.coerce(data_bits)
+    tail = len(bits) % 8
+    if tail and reflected:
+        raise ValueError(f"Для {name} длина последовательности должна быть кратна 8")
+    
+    full = len(bits) - tail
+    register = _crc_update(_crc_start(name), bits[:full].to_bytes(), name)
+    
+    mask = (1 << width) - 1
+    for bit in bits[full:]:
+        top = (register >> (width - 1)) ^ bit
+        register = (register << 1) & mask
+        if top:
+            register ^= poly
+    return register ^ xor_out, width
+
+
+def crc_calculate(data_bits, name="CRC-8"):
+    """
+    Расчет CRC с пошаговым делением полиномов для коротких сообщений
+    
+    Args:
+        data_bits: Строка из '0' и '1' или BitVector
+        name: Имя варианта из CRC_PRESETS
+        
+    Returns:
+        tuple: (crc, width, steps) - значение CRC, разрядность и ленивые шаги деления
+            (None, если сообщение длиннее CRC_TRACE_LIMIT)
+    """
+    crc, width = crc_bits(data_bits, name)
+    bits = BitVector.coerce(data_bits)
+    steps = LazySteps(_crc_division_steps, bits, name) if len(bits) <= CRC_TRACE_LIMIT else None
+    return crc, width, steps
+
+
+def crc_polynomial_text(name):
+    """Запись образующего полинома, например x^8 + x^2 + x + 1"""
+    width, poly, _, _, _ = _crc_preset(name)
+    full = poly | 1 << width
+    terms = []
+    for power in range(width, -1, -1):
+        if full >> power & 1:
+            terms.append("1" if power == 0 else "x" if power == 1 else f"x^{power}")
+    return " + ".join(terms)
+
+
+def _crc_division_steps(bits, name):
+    """
+    Генератор шагов деления дополненного сообщения на образующий полином
+    
+    Предзагрузка регистра init эквивалентна XOR первых width бит дополненного
+    сообщения с init, отражение входа — развороту битов в каждом байте.
+    """
+    width, poly, init, reflected, xor_out = _crc_preset(name)
+    generator = poly | 1 << width
+    
+    yield f"Образующий полином: {crc_polynomial_text(name)} → `{generator:0{width + 1}b}`"
+    
+    message = str(bits)
+    if reflected:
+        message = ''.join(message[i:i + 8][::-1] for i in range(0, len(message), 8))
+        yield f"Отражение битов в каждом байте: `{message}`"
+    
+    length = len(message) + width
+    dividend = int(message or '0', 2) << width
+    yield f"Сообщение, дополненное {width} нулями: `{dividend:0{length}b}`"
+    
+    if init:
+        dividend ^= init << (length - width)
+        yield f"XOR первых {width} бит с начальным значением {init:#x}: `{dividend:0{length}b}`"
+    
+    step = 0
+    for position in range(length - width):
+        shift = length - 1 - position - width
+        if dividend >> (length - 1 - position) & 1:
+            step += 1
+            window = dividend >> shift & ((1 << (width + 1)) - 1)
+            dividend ^= generator << shift
+            yield (
+                f"Шаг {step} (бит {position + 1}): `{window:0{width + 1}b}` XOR "
+                f"`{generator:0{width + 1}b}` = `{window ^ generator:0{width + 1}b}`"
+            )
+    
+    remainder = dividend
+    yield f"Остаток от деления: `{remainder:0{width}b}`"
+    
+    if reflected:
+        remainder = _reflect(remainder, width)
+        yield f"Отражение остатка: `{remainder:0{width}b}`"
+    if xor_out:
+        remainder ^= xor_out
+        yield f"XOR с {xor_out:#x}: `{remainder:0{width}b}`"
+    
+    yield f"CRC = `{remainder:0{width}b}` = {remainder:#0{width // 4 + 2}x}"
@@ -1,21 +1,50 @@
-import os
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Загрузить .env файл из директории проекта
-env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-ADMIN_IDS = list(map(int, os.getenv("ADMIN_IDS", "").split(","))) if os.getenv("ADMIN_IDS") else []
-
-SESSION_TIMEOUT = 600  # 10 минут
-
-ERROR_MESSAGES = {
-    "invalid_binary": "❌ Ошибка: Введенная последовательность содержит недопустимые символы. Используйте только 0 и 1.",
-    "invalid_number": "❌ Ошибка: Некорректное числовое значение.",
-    "timeout": "⏰ Сессия истекла. Пожалуйста, начните заново с команды /start",
-    "invalid_choice": "❌ Ошибка: Недопустимый выбор.",
-    "invalid_input": "❌ Ошибка: Некорректный ввод данных."
-}
-
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Загрузить .env файл из директории проекта
+env_path = Path(__file__).parent / '.env'
+load_dotenv(dotenv_path=env_path)
+
+BOT_TOKEN = os.getenv("BOT_TOKEN")
+ADMIN_IDS = list(map(int, os.getenv("ADMIN_IDS", "").split(","))) if os.getenv("ADMIN_IDS") else []
+
+SESSION_TIMEOUT = 600  # 10 минут
+SESSION_MAX_USERS = int(os.getenv("SESSION_MAX_USERS", "100000"))  # Наибольшее количество сессий в памяти
+SESSION_SWEEP_INTERVAL = 30  # Период очистки истекших сессий, секунды
+
+STEPS_PREVIEW_LIMIT = 30  # Сколько шагов решения показывать в одном сообщении
+
+BASE_FRACTION_PRECISION = 20  # Сколько дробных разрядов выводить при переводе систем счисления
+
+# Вынос тяжелых вычислений в пул процессов
+EXECUTOR_MAX_WORKERS = int(os.getenv("EXECUTOR_MAX_WORKERS", "2"))  # Процессов в пуле
+OFFLOAD_COST_THRESHOLD = int(os.getenv("OFFLOAD_COST_THRESHOLD", "10000"))  # Оценка стоимости (мкс), с которой вызов уходит в пул
+OFFLOAD_TIMEOUT = float(os.getenv("OFFLOAD_TIMEOUT", "30"))  # Наибольшее время вынесенного вычисления, секунды
+
+# Хранилище состояний FSM: "memory" (в памяти процесса) или "sqlite" (файл базы, переживает перезапуск)
+FSM_STORAGE = os.getenv("FSM_STORAGE", "memory")
+FSM_SQLITE_PATH = os.getenv("FSM_SQLITE_PATH", str(Path(__file__).parent / "fsm.sqlite3"))
+FSM_FLUSH_INTERVAL = float(os.getenv("FSM_FLUSH_INTERVAL", "1.0"))  # Период записи буфера в базу, секунды
+FSM_FLUSH_BATCH = int(os.getenv("FSM_FLUSH_BATCH", "200"))  # Сколько изменений копить до записи
+FSM_CACHE_SIZE = int(os.getenv("FSM_CACHE_SIZE", "10000"))  # Записей в кэше чтения
+FSM_CACHE_TTL = float(os.getenv("FSM_CACHE_TTL", "5"))  # Секунды доверия кэшу (другие процессы могли изменить запись)
+
+# Режим получения обновлений: "polling" (long polling) или "webhook" (веб-сервер aiohttp)
+BOT_MODE = os.getenv("BOT_MODE", "polling")
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")  # Внешний адрес (https://...); пустой — webhook в Telegram не регистрируется
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")  # Заголовок X-Telegram-Bot-Api-Secret-Token (обязателен при WEBHOOK_URL)
+WEBHOOK_MAX_CONCURRENCY = int(os.getenv("WEBHOOK_MAX_CONCURRENCY", "32"))  # Одновременно обрабатываемых обновлений
+
+ERROR_MESSAGES = {
+    "invalid_binary": "❌ Ошибка: Введенная последовательность содержит недопустимые символы. Используйте только 0 и 1.",
+    "invalid_number": "❌ Ошибка: Некорректное числовое значение.",
+    "timeout": "⏰ Сессия истекла. Пожалуйста, начните заново с команды /start",
+    "invalid_choice": "❌ Ошибка: Недопустимый выбор.",
+    "invalid_input": "❌ Ошибка: Некорректный ввод данных.",
+    "calculation_timeout": "⏱ Вычисление заняло слишком много времени. Попробуйте уменьшить объем входных данных."
+}
+
@@ -1,103 +1,103 @@
-"""Улучшенные сообщения об ошибках с примерами"""
-
-
-def format_error_with_example(error_message, example, field_name=None):
-    """
-    Форматирование сообщения об ошибке с примером
-    
-    Args:
-        error_message: Основное сообщение об ошибке
-        example: Пример корректного ввода
-        field_name: Название поля (опционально)
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    if field_name:
-        return f"""
-❌ **Ошибка ввода: {field_name}**
-
-{error_message}
-
-💡 **Пример корректного ввода:**
-`{example}`
-
-Пожалуйста, попробуйте снова:
-"""
-    else:
-        return f"""
-❌ **Ошибка ввода**
-
-{error_message}
-
-💡 **Пример корректного ввода:**
-`{example}`
-
-Пожалуйста, попробуйте снова:
-"""
-
-
-def get_binary_error():
-    """Сообщение об ошибке для двоичной последовательности"""
-    return format_error_with_example(
-        "Введенная последовательность содержит недопустимые символы.\n"
-        "Используйте только символы 0 и 1.",
-        "1010",
-        "Двоичная последовательность"
-    )
-
-
-def get_number_error(min_val=None, max_val=None):
-    """Сообщение об ошибке для числового значения"""
-    constraints = []
-    if min_val is not None:
-        constraints.append(f"не меньше {min_val}")
-    if max_val is not None:
-        constraints.append(f"не больше {max_val}")
-    
-    constraint_text = f" (должно быть {', '.join(constraints)})" if constraints else ""
-    
-    return format_error_with_example(
-        f"Некорректное числовое значение{constraint_text}.",
-        "123" if min_val is None else str(min_val),
-        "Число"
-    )
-
-
-def get_digits_error(length=None):
-    """Сообщение об ошибке для строки из цифр"""
-    length_text = f" (должно быть {length} цифр)" if length else ""
-    
-    return format_error_with_example(
-        f"Строка должна содержать только цифры{length_text}.",
-        "123456789" if length is None else "1" * length,
-        "Цифры"
-    )
-
-
-def get_float_error(min_val=None, max_val=None):
-    """Сообщение об ошибке для вещественного числа"""
-    constraints = []
-    if min_val is not None:
-        constraints.append(f"не меньше {min_val}")
-    if max_val is not None:
-        constraints.append(f"не больше {max_val}")
-    
-    constraint_text = f" (должно быть {', '.join(constraints)})" if constraints else ""
-    
-    return format_error_with_example(
-        f"Некорректное вещественное число{constraint_text}.",
-        "12.375" if min_val is None else str(min_val),
-        "Число с плавающей запятой"
-    )
-
-
-def get_qr_alphanumeric_error():
-    """Сообщение об ошибке для буквенно-цифрового QR-кода"""
-    return format_error_with_example(
-        "Текст содержит недопустимые символы.\n"
-        "Используйте только латинские буквы, цифры, пробелы и символы: $%*+-./:",
-        "HELLO WORLD 123",
-        "Текст для QR-кода"
-    )
-
+"""Улучшенные сообщения об ошибках с примерами"""
+
+
+def format_error_with_example(error_message, example, field_name=None):
+    """
+    Форматирование сообщения об ошибке с примером
+    
+    Args:
+        error_message: Основное сообщение об ошибке
+        example: Пример корректного ввода
+        field_name: Название поля (опционально)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    if field_name:
+        return f"""
+❌ **Ошибка ввода: {field_name}**
+
+{error_message}
+
+💡 **Пример корректного ввода:**
+`{example}`
+
+Пожалуйста, попробуйте снова:
+"""
+    else:
+        return f"""
+❌ **Ошибка ввода**
+
+{error_message}
+
+💡 **Пример корректного ввода:**
+`{example}`
+
+Пожалуйста, попробуйте снова:
+"""
+
+
+def get_binary_error():
+    """Сообщение об ошибке для двоичной последовательности"""
+    return format_error_with_example(
+        "Введенная последовательность содержит недопустимые символы.\n"
+        "Используйте только символы 0 и 1.",
+        "1010",
+        "Двоичная последовательность"
+    )
+
+
+def get_number_error(min_val=None, max_val=None):
+    """Сообщение об ошибке для числового значения"""
+    constraints = []
+    if min_val is not None:
+        constraints.append(f"не меньше {min_val}")
+    if max_val is not None:
+        constraints.append(f"не больше {max_val}")
+    
+    constraint_text = f" (должно быть {', '.join(constraints)})" if constraints else ""
+    
+    return format_error_with_example(
+        f"Некорректное числовое значение{constraint_text}.",
+        "123" if min_val is None else str(min_val),
+        "Число"
+    )
+
+
+def get_digits_error(length=None):
+    """Сообщение об ошибке для строки из цифр"""
+    length_text = f" (должно быть {length} цифр)" if length else ""
+    
+    return format_error_with_example(
+        f"Строка должна содержать только цифры{length_text}.",
+        "123456789" if length is None else "1" * length,
+        "Цифры"
+    )
+
+
+def get_float_error(min_val=None, max_val=None):
+    """Сообщение об ошибке для вещественного числа"""
+    constraints = []
+    if min_val is not None:
+        constraints.append(f"не меньше {min_val}")
+    if max_val is not None:
+        constraints.append(f"не больше {max_val}")
+    
+    constraint_text = f" (должно быть {', '.join(constraints)})" if constraints else ""
+    
+    return format_error_with_example(
+        f"Некорректное вещественное число{constraint_text}.",
+        "12.375" if min_val is None else str(min_val),
+        "Число с плавающей запятой"
+    )
+
+
+def get_qr_alphanumeric_error():
+    """Сообщение об ошибке для буквенно-цифрового QR-кода"""
+    return format_error_with_example(
+        "Текст содержит недопустимые символы.\n"
+        "Используйте только латинские буквы, цифры, пробелы и символы: $%*+-./:",
+        "HELLO WORLD 123",
+        "Текст для QR-кода"
+    )
+
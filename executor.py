@@ -0,0 +1,265 @@
+"""Выполнение вычислений: на цикле событий или в пуле процессов"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
+
+from config import EXECUTOR_MAX_WORKERS, OFFLOAD_COST_THRESHOLD, OFFLOAD_TIMEOUT
+
+# Пользователь, для которого выполняется текущее обновление (задает SessionMiddleware)
+current_user = ContextVar("current_user", default=None)
+
+
+def _digits_cost(number):
+    """Стоимость разбора и перевода числа: длинная арифметика квадратична по числу цифр"""
+    n = len(str(number))
+    return n + n * n // 20000
+
+
+def _parity_2d_cells(bits, block_size=8, rows=None, encoded=False):
+    """Количество ячеек блоков двумерной четности (с дополнением и битами четности)"""
+    rows = rows or block_size
+    cells = (rows + 1) * (block_size + 1)
+    if encoded:
+        return max(len(bits), cells)
+    blocks = max(-(-len(bits) // (rows * block_size)), 1)
+    return blocks * cells
+
+
+def _source_size(source):
+    """Размер текста или файла в памяти (BytesIO)"""
+    return len(source) if isinstance(source, str) else source.getbuffer().nbytes
+
+
+def _sweep_rows(values):
+    """Количество строк таблицы перебора (произведение числа значений параметров)"""
+    rows = 1
+    for array in values.values():
+        rows *= len(array)
+    return rows
+
+
+# Оценка стоимости вызова в микросекундах по размеру входных данных.
+# Ключ — имя функции-вычислителя, значение — функция от тех же аргументов.
+# Вычислители, которых нет в таблице, всегда выполняются на цикле событий.
+CALCULATOR_COSTS = {
+    "hamming_encode_fast": lambda bits: len(bits) // 8,
+    "hamming_decode_fast": lambda bits: len(bits) // 8,
+    "extended_hamming_encode": lambda bits: len(bits) // 8,
+    "extended_hamming_decode": lambda bits: len(bits) // 8,
+    "hamming_decode_batch": lambda matrix: matrix.size // 64,
+    "crc_calculate": lambda bits, *args: len(bits) // 25,
+    "crc_stream": lambda stream, *args: stream.getbuffer().nbytes // 10,
+    "block_parity_2d_encode": lambda bits, *args, **kwargs: _parity_2d_cells(bits, *args, **kwargs) // 10,
+    "block_parity_2d_decode": lambda bits, *args, **kwargs: (
+        _parity_2d_cells(bits, *args, encoded=True, **kwargs) // 10
+    ),
+    "convert_base": lambda number, *args, **kwargs: _digits_cost(number),
+    "convert_to_bases": lambda number, from_base, to_bases=None, **kwargs: (
+        _digits_cost(number) * len(to_bases or range(2, 37)) // 3
+    ),
+    "encode_batch": lambda values, bits, kind: len(values) * (bits if bits <= 64 else 8 * bits) // 500,
+    "ieee754_batch": lambda values, fmt: len(values) // 15,
+    "validate_lines": lambda lines, algorithm: len(lines),
+    "check_barcode_batch": lambda source, *args, **kwargs: _source_size(source) // 30,
+    # Каждая строка описания разворачивается не более чем в SWEEP_MAX_ROWS значений
+    "parse_sweep_spec": lambda text, target: text.count('=') * 1500,
+    "audio_sweep": lambda target, **values: _sweep_rows(values) // 20,
+    "sweep_to_csv": lambda target, names, columns, result: len(result) * (len(columns) + 2),
+}
+
+
+class CalculationTimeout(Exception):
+    """Вычисление в пуле процессов не уложилось в отведенное время"""
+
+
+class CalculationCancelled(asyncio.CancelledError):
+    """Вычисление отменено пользователем (кнопка «Меню»)"""
+
+
+class CalculationExecutor:
+    """
+    Исполнитель вычислений с выбором места выполнения по стоимости
+
+    Стоимость вызова оценивается по размеру входных данных (CALCULATOR_COSTS).
+    Дешевые вызовы выполняются сразу на цикле событий, дорогие отправляются
+    в ProcessPoolExecutor, а обработчик ожидает результат, не блокируя
+    остальных пользователей.
+
+    Вынесенный вызов ограничен по времени и может быть отменен по ID
+    пользователя. Вызов из очереди снимается сразу; уже запущенный в процессе
+    досчитывается, но его результат отбрасывается.
+    """
+
+    def __init__(self, max_workers=EXECUTOR_MAX_WORKERS, threshold=OFFLOAD_COST_THRESHOLD,
+                 timeout=OFFLOAD_TIMEOUT):
+        """
+        Args:
+            max_workers: Количество процессов пула
+            threshold: Стоимость (микросекунды), начиная с которой вызов выносится в пул
+            timeout: Наибольшее время ожидания вынесенного вызова (секунды)
+        """
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.timeout = timeout
+        self._pool = None
+        # Отправленные в пул и еще не завершенные вызовы
+        self._futures = set()
+        # ID пользователя -> ожидаемые вызовы
+        self._user_calls = {}
+        self.inline_calls = 0
+        self.offloaded_calls = 0
+        self.timeouts = 0
+        self.cancellations = 0
+
+    def _get_pool(self):
+        """Пул процессов (создается при первом вынесенном вызове)"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    @staticmethod
+    def estimate_cost(func, args, kwargs):
+        """
+        Оценка стоимости вызова
+
+        Returns:
+            int: Оценка в микросекундах (0 для вычислителей без оценки)
+        """
+        estimator = CALCULATOR_COSTS.get(func.__name__)
+        return estimator(*args, **kwargs) if estimator else 0
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Выполнение вычислителя func(*args, **kwargs)
+
+        Returns:
+            Результат func
+
+        Raises:
+            CalculationTimeout: Вынесенный вызов не завершился за timeout секунд
+            CalculationCancelled: Вызов отменен методом cancel_user
+        """
+        if self.estimate_cost(func, args, kwargs) < self.threshold:
+            self.inline_calls += 1
+            return func(*args, **kwargs)
+
+        try:
+            future = self._get_pool().submit(func, *args, **kwargs)
+        except BrokenProcessPool:
+            # Процесс пула аварийно завершился — пул пересоздается
+            self._pool = None
+            future = self._get_pool().submit(func, *args, **kwargs)
+        self.offloaded_calls += 1
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+        waiter = asyncio.wrap_future(future)
+        user_id = current_user.get()
+        calls = self._user_calls.setdefault(user_id, {})
+        calls[waiter] = False
+        try:
+            return await asyncio.wait_for(waiter, self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise CalculationTimeout(f"Вычисление {func.__name__} дольше {self.timeout:g} с") from None
+        except asyncio.CancelledError:
+            if calls.get(waiter):
+                self.cancellations += 1
+                raise CalculationCancelled() from None
+            raise
+        finally:
+            calls.pop(waiter, None)
+            if not calls:
+                self._user_calls.pop(user_id, None)
+
+    def cancel_user(self, user_id):
+        """
+        Отмена вынесенных вызовов пользователя
+
+        Returns:
+            int: Количество отмененных вызовов
+        """
+        calls = self._user_calls.get(user_id, {})
+        for waiter in calls:
+            calls[waiter] = True
+            waiter.cancel()
+        return len(calls)
+
+    def gauges(self):
+        """
+        Показатели исполнителя
+
+        Returns:
+            dict: in_flight (вызовы в пуле), queued (ожидают свободного процесса),
+                max_workers и счетчики вызовов, таймаутов и отмен
+        """
+        futures = list(self._futures)
+        running = sum(future.running() for future in futures)
+        return {
+            "in_flight": len(futures),
+            "queued": len(futures) - running,
+            "max_workers": self.max_workers,
+            "inline_calls": self.inline_calls,
+            "offloaded_calls": self.offloaded_calls,
+            "timeouts": self.timeouts,
+            "cancellations": self.cancellations,
+        }
+
+    def shutdown(self):
+        """Остановка пула без ожидания: вызовы из очереди отменяются"""
+        for future in list(self._futures):
+            future.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+# Исполнитель вычислений процесса бота
+executor = CalculationExecutor()
+
+
+async def run_calculation(func, *args, **kwargs):
+    """
+    Выполнить вычислитель на цикле событий или в пуле процессов (по стоимости)
+
+    Args:
+        func: Функция-вычислитель (функция модуля calculators)
+        *args, **kwargs: Аргументы вычислителя
+
+    Returns:
+        Результат func
+    """
+    return await executor.run(func, *args, **kwargs)
+
+
+def cancel_user_calculations(user_id):
+    """
+    Отменить вынесенные вычисления пользователя
+
+    Args:
+        user_id: ID пользователя
+
+    Returns:
+        int: Количество отмененных вызовов
+    """
+    return executor.cancel_user(user_id)
+
+
+def executor_gauges():
+    """
+    Показатели исполнителя вычислений
+
+    Returns:
+        dict: Глубина очереди и счетчики вызовов
+    """
+    return executor.gauges()
+
+
+def shutdown_executor():
+    """Остановить пул процессов"""
+    executor.shutdown()
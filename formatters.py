@@ -1,275 +1,830 @@
-"""Модуль форматирования вывода"""
-
-
-def format_audio_result(frequency, depth, duration, channels, total_bytes, kb, mb):
-    """
-    Форматирование результата расчета объема звукового файла
-    
-    Args:
-        frequency: Частота дискретизации
-        depth: Глубина кодирования в битах
-        duration: Длительность в секундах
-        channels: Количество каналов
-        total_bytes: Общий объем в байтах
-        kb: Объем в килобайтах
-        mb: Объем в мегабайтах
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    channel_type = 'стерео' if channels == 2 else 'моно'
-    bytes_per_sample = depth // 8
-    
-    return f"""
-🔊 **РАСЧЕТ ОБЪЕМА ЗВУКОВОГО ФАЙЛА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**📋 ВХОДНЫЕ ДАННЫЕ:**
-
-• Частота дискретизации: {frequency} Гц
-• Глубина кодирования: {depth} бит ({bytes_per_sample} байт на сэмпл)
-• Длительность: {duration} сек
-• Количество каналов: {channels} ({channel_type})
-
-**📊 ПОШАГОВЫЙ РАСЧЕТ:**
-
-**Шаг 1:** Расчет байт на секунду
-`{frequency} Гц × {bytes_per_sample} байт = {frequency * bytes_per_sample} байт/сек`
-
-**Шаг 2:** Умножение на длительность
-`{frequency * bytes_per_sample} байт/сек × {duration} сек = {frequency * bytes_per_sample * duration} байт`
-
-**Шаг 3:** Учет количества каналов
-`{frequency * bytes_per_sample * duration} байт × {channels} канал(ов) = {total_bytes} байт`
-
-**Шаг 4:** Преобразование в килобайты
-`{total_bytes} байт ÷ 1024 = {kb:.2f} КБ`
-
-**Шаг 5:** Преобразование в мегабайты
-`{kb:.2f} КБ ÷ 1024 = {mb:.2f} МБ`
-
-**💾 ИТОГОВЫЙ РЕЗУЛЬТАТ: {mb:.2f} МБ**
-"""
-
-
-def format_number_code_result(number, code, code_type):
-    """
-    Форматирование результата кодирования числа
-    
-    Args:
-        number: Исходное число
-        code: Закодированное представление
-        code_type: Тип кода (прямой, обратный, дополнительный)
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    code_names = {
-        'reverse': 'Обратный код',
-        'additional': 'Дополнительный код'
-    }
-    
-    return f"""
-🔢 **{code_names.get(code_type, 'Кодирование числа')}**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходное число:** {number}
-
-**Результат:** `{code}`
-"""
-
-
-def format_float_number_result(number, steps, result):
-    """
-    Форматирование результата преобразования числа с плавающей запятой
-    
-    Args:
-        number: Исходное число
-        steps: Список шагов преобразования
-        result: Итоговый результат
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    steps_text = "\n".join([f"{i+1}. {step}" for i, step in enumerate(steps)])
-    
-    return f"""
-🔢 **ПРЕОБРАЗОВАНИЕ ЧИСЛА {number}**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-{steps_text}
-
-**Результат:** `{result}`
-"""
-
-
-def format_parity_result(data_bits, ones_count, parity_bit, encoded):
-    """
-    Форматирование результата проверки на четность
-    
-    Args:
-        data_bits: Исходные биты данных
-        ones_count: Количество единиц
-        parity_bit: Бит четности
-        encoded: Закодированная последовательность
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    return f"""
-🔍 **ПРОВЕРКА НА ЧЕТНОСТЬ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходные данные:** `{data_bits}`
-
-**Количество единиц:** {ones_count}
-**Четность:** {'четное' if ones_count % 2 == 0 else 'нечетное'}
-**Бит четности:** `{parity_bit}`
-
-**Результат:** `{encoded}`
-"""
-
-
-def format_hamming_encode_result(data_bits, encoded, r, n):
-    """
-    Форматирование результата кодирования Хэмминга
-    
-    Args:
-        data_bits: Исходные биты данных
-        encoded: Закодированная последовательность
-        r: Количество контрольных битов
-        n: Общая длина кода
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    return f"""
-🔧 **КОДИРОВАНИЕ ХЭММИНГА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходные данные:** `{data_bits}`
-
-**Количество контрольных битов:** {r}
-**Общая длина кода:** {n}
-
-**Закодированная последовательность:** `{encoded}`
-"""
-
-
-def format_hamming_decode_result(received, data_bits, error_pos, corrected):
-    """
-    Форматирование результата декодирования Хэмминга
-    
-    Args:
-        received: Принятая последовательность
-        data_bits: Извлеченные данные
-        error_pos: Позиция ошибки (0 если нет)
-        corrected: Исправленная последовательность
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    error_info = f"Ошибка обнаружена в позиции {error_pos}" if error_pos > 0 else "Ошибок не обнаружено"
-    
-    return f"""
-🔧 **ДЕКОДИРОВАНИЕ ХЭММИНГА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Принятая последовательность:** `{received}`
-
-**{error_info}**
-{f'**Исправленная последовательность:** `{corrected}`' if error_pos > 0 else ''}
-
-**Извлеченные данные:** `{data_bits}`
-"""
-
-
-def format_ean13_result(first_12, even_sum, odd_sum, total, checksum, full_code):
-    """
-    Форматирование результата расчета EAN-13
-    
-    Args:
-        first_12: Первые 12 цифр
-        even_sum: Сумма четных позиций
-        odd_sum: Сумма нечетных позиций
-        total: Общая сумма
-        checksum: Контрольная цифра
-        full_code: Полный код
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    return f"""
-📊 **РАСЧЕТ EAN-13 ДЛЯ: {first_12}**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**1. Четные позиции (2,4,6,8,10,12):** {', '.join([first_12[i] for i in range(1, 12, 2)])}
-   Сумма четных: {even_sum}
-   ×3 = {even_sum * 3}
-
-**2. Нечетные позиции (1,3,5,7,9,11):** {', '.join([first_12[i] for i in range(0, 12, 2)])}
-   Сумма нечетных: {odd_sum}
-
-**3. Общая сумма:** {even_sum * 3} + {odd_sum} = {total}
-**4. Контрольная цифра:** (10 - ({total} % 10)) % 10 = {checksum}
-
-🎯 **ПОЛНЫЙ КОД: {full_code}**
-"""
-
-
-def format_qr_numeric_result(digits, encoded_bits, steps):
-    """
-    Форматирование результата цифрового QR-кодирования
-    
-    Args:
-        digits: Исходные цифры
-        encoded_bits: Закодированные биты
-        steps: Список шагов кодирования
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    steps_text = "\n".join([f"• {step}" for step in steps])
-    
-    return f"""
-🔲 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходные данные:** {digits}
-
-**Шаги кодирования:**
-{steps_text}
-
-**Результат:** `{encoded_bits}`
-"""
-
-
-def format_qr_alphanumeric_result(text, encoded_bits, steps):
-    """
-    Форматирование результата буквенно-цифрового QR-кодирования (КОИ-8)
-    
-    Args:
-        text: Исходный текст
-        encoded_bits: Закодированные биты
-        steps: Список шагов кодирования
-        
-    Returns:
-        str: Отформатированное сообщение
-    """
-    steps_text = "\n".join([f"{step}" for step in steps])
-    
-    return f"""
-🔲 **БУКВЕННО-ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходный текст:** {text}
-
-**Шаги кодирования (КОИ-8):**
-{steps_text}
-
-**Результат:** `{encoded_bits}`
-**Длина:** {len(encoded_bits)} бит ({len(encoded_bits)//8} байт)
-"""
-
+"""Модуль форматирования вывода"""
+
+from itertools import islice
+
+from config import STEPS_PREVIEW_LIMIT
+
+# Блоки двумерной четности с большей длиной строки выводятся сводкой, а не таблицами
+PARITY_GRID_MAX = 16
+
+
+def format_steps(steps, prefix="", numbered=False, limit=STEPS_PREVIEW_LIMIT):
+    """
+    Форматирование первых шагов решения со сводкой об остальных
+    
+    Шаги могут быть ленивыми (LazySteps): генерируются только выводимые шаги.
+    
+    Args:
+        steps: Последовательность шагов (список или LazySteps)
+        prefix: Префикс каждой строки (например, "• ")
+        numbered: Нумеровать шаги
+        limit: Максимальное количество выводимых шагов
+        
+    Returns:
+        str: Текст шагов
+    """
+    iterator = iter(steps)
+    lines = [
+        f"{prefix}{i}. {step}" if numbered else f"{prefix}{step}"
+        for i, step in enumerate(islice(iterator, limit), 1)
+    ]
+    
+    if next(iterator, None) is not None:
+        total = len(steps) if isinstance(steps, list) else getattr(steps, "total", None)
+        if total:
+            lines.append(f"{prefix}... (еще шагов: {total - limit})")
+        else:
+            lines.append(f"{prefix}... (остальные шаги опущены)")
+    
+    return "\n".join(lines)
+
+
+def printable_text(text, placeholder='?'):
+    """
+    Замена непечатаемых символов для вывода в сообщении
+    
+    Args:
+        text: Исходный текст
+        placeholder: Символ-заменитель
+        
+    Returns:
+        str: Текст, пригодный для отображения
+    """
+    return ''.join(char if char.isprintable() else placeholder for char in text)
+
+
+def format_audio_result(frequency, depth, duration, channels, total_bytes, kb, mb):
+    """
+    Форматирование результата расчета объема звукового файла
+    
+    Args:
+        frequency: Частота дискретизации
+        depth: Глубина кодирования в битах
+        duration: Длительность в секундах
+        channels: Количество каналов
+        total_bytes: Общий объем в байтах
+        kb: Объем в килобайтах
+        mb: Объем в мегабайтах
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    channel_type = 'стерео' if channels == 2 else 'моно'
+    bytes_per_sample = depth // 8
+    
+    return f"""
+🔊 **РАСЧЕТ ОБЪЕМА ЗВУКОВОГО ФАЙЛА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**📋 ВХОДНЫЕ ДАННЫЕ:**
+
+• Частота дискретизации: {frequency} Гц
+• Глубина кодирования: {depth} бит ({bytes_per_sample} байт на сэмпл)
+• Длительность: {duration} сек
+• Количество каналов: {channels} ({channel_type})
+
+**📊 ПОШАГОВЫЙ РАСЧЕТ:**
+
+**Шаг 1:** Расчет байт на секунду
+`{frequency} Гц × {bytes_per_sample} байт = {frequency * bytes_per_sample} байт/сек`
+
+**Шаг 2:** Умножение на длительность
+`{frequency * bytes_per_sample} байт/сек × {duration} сек = {frequency * bytes_per_sample * duration} байт`
+
+**Шаг 3:** Учет количества каналов
+`{frequency * bytes_per_sample * duration} байт × {channels} канал(ов) = {total_bytes} байт`
+
+**Шаг 4:** Преобразование в килобайты
+`{total_bytes} байт ÷ 1024 = {kb:.2f} КБ`
+
+**Шаг 5:** Преобразование в мегабайты
+`{kb:.2f} КБ ÷ 1024 = {mb:.2f} МБ`
+
+**💾 ИТОГОВЫЙ РЕЗУЛЬТАТ: {mb:.2f} МБ**
+"""
+
+
+def format_number_code_result(number, code, code_type, bits=8, bounds=None):
+    """
+    Форматирование результата кодирования числа
+    
+    Args:
+        number: Исходное число
+        code: Закодированное представление ("" при переполнении)
+        code_type: Тип кода (прямой, обратный, дополнительный)
+        bits: Разрядность кода
+        bounds: Диапазон представимых чисел (low, high)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    code_names = {
+        'direct': 'Прямой код',
+        'reverse': 'Обратный код',
+        'additional': 'Дополнительный код'
+    }
+    
+    range_text = f"\n**Диапазон:** от {bounds[0]} до {bounds[1]}" if bounds else ""
+    if code:
+        result_text = f"**Результат:** `{code}`"
+    else:
+        result_text = f"⚠️ **Переполнение:** число не помещается в {bits} бит"
+    
+    return f"""
+🔢 **{code_names.get(code_type, 'Кодирование числа')}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходное число:** {number}
+**Разрядность:** {bits} бит{range_text}
+
+{result_text}
+"""
+
+
+def format_number_codes_batch_result(code_type, bits, bounds, values, codes, overflow, limit=20):
+    """
+    Форматирование результата пакетного кодирования чисел
+    
+    Args:
+        code_type: Тип кода (direct, reverse, additional)
+        bits: Разрядность кода
+        bounds: Диапазон представимых чисел (low, high)
+        values: Первые числа пакета (для подробного вывода)
+        codes: Коды первых чисел ("" при переполнении)
+        overflow: Признаки переполнения для всего пакета
+        limit: Сколько строк показать подробно
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    code_names = {
+        'direct': 'ПРЯМОЙ КОД',
+        'reverse': 'ОБРАТНЫЙ КОД',
+        'additional': 'ДОПОЛНИТЕЛЬНЫЙ КОД'
+    }
+    total = len(overflow)
+    overflow_count = int(overflow.sum())
+    
+    rows_text = []
+    for value, code in zip(values[:limit], codes[:limit]):
+        rows_text.append(f"`{value}` → `{code}`" if code else f"`{value}` ⚠️ переполнение")
+    if total > limit:
+        rows_text.append(f"... (еще {total - limit} чисел, полная таблица в файле)")
+    
+    return f"""
+🔢 **{code_names.get(code_type, 'КОДИРОВАНИЕ ЧИСЕЛ')} ({bits} БИТ)**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Чисел:** {total}
+**Диапазон:** от {bounds[0]} до {bounds[1]}
+**Переполнений:** {overflow_count}
+
+{chr(10).join(rows_text)}
+"""
+
+
+def format_float_number_result(number, steps, result):
+    """
+    Форматирование результата преобразования числа с плавающей запятой
+    
+    Args:
+        number: Исходное число
+        steps: Шаги преобразования (список или LazySteps)
+        result: Итоговый результат
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    steps_text = format_steps(steps, numbered=True)
+    
+    return f"""
+🔢 **ПРЕОБРАЗОВАНИЕ ЧИСЛА {number}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+{steps_text}
+
+**Результат:** `{result}`
+"""
+
+
+def format_ieee754_result(number, fmt, bits_text, stored, steps):
+    """
+    Форматирование результата кодирования числа в IEEE 754
+    
+    Args:
+        number: Исходное число
+        fmt: Формат (float16, float32, float64)
+        bits_text: Поля числа 'знак порядок мантисса'
+        stored: Фактически хранимое значение
+        steps: Шаги кодирования (список или LazySteps)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    steps_text = format_steps(steps, numbered=True)
+    
+    return f"""
+🧮 **IEEE 754 ({fmt})**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходное число:** {number!r}
+**Хранимое значение:** {stored!r}
+
+{steps_text}
+
+**Результат:** `{bits_text}`
+"""
+
+
+def format_ieee754_batch_result(fmt, values, bits_texts, total, limit=20):
+    """
+    Форматирование результата пакетного кодирования чисел в IEEE 754
+    
+    Args:
+        fmt: Формат (float16, float32, float64)
+        values: Первые числа пакета
+        bits_texts: Поля первых чисел 'знак порядок мантисса'
+        total: Всего чисел в пакете
+        limit: Сколько строк показать подробно
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    rows_text = [f"`{value!r}` → `{bits}`" for value, bits in zip(values[:limit], bits_texts[:limit])]
+    if total > limit:
+        rows_text.append(f"... (еще {total - limit} чисел, полная таблица в файле)")
+    
+    return f"""
+🧮 **ПАКЕТНОЕ КОДИРОВАНИЕ IEEE 754 ({fmt})**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Чисел:** {total}
+**Формат записи:** знак порядок мантисса
+
+{chr(10).join(rows_text)}
+"""
+
+
+def format_base_table_result(number, from_base, rows, width=48):
+    """
+    Форматирование перевода числа сразу в несколько систем счисления
+    
+    Args:
+        number: Исходное число
+        from_base: Исходная система счисления
+        rows: Пары (base, result)
+        width: Наибольшая длина записи в таблице (длинные записи сокращаются)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    half = (width - 1) // 2
+    rows_text = [
+        f"`{base:>2}` │ `{result if len(result) <= width else result[:half] + '…' + result[-half:]}`"
+        for base, result in rows
+    ]
+    
+    return f"""
+🔄 **ПЕРЕВОД В НЕСКОЛЬКО СИСТЕМ СЧИСЛЕНИЯ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходное число:** {number} ({from_base}-я система)
+
+{chr(10).join(rows_text)}
+"""
+
+
+def format_parity_result(data_bits, ones_count, parity_bit, encoded):
+    """
+    Форматирование результата проверки на четность
+    
+    Args:
+        data_bits: Исходные биты данных
+        ones_count: Количество единиц
+        parity_bit: Бит четности
+        encoded: Закодированная последовательность
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    return f"""
+🔍 **ПРОВЕРКА НА ЧЕТНОСТЬ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:** `{data_bits}`
+
+**Количество единиц:** {ones_count}
+**Четность:** {'четное' if ones_count % 2 == 0 else 'нечетное'}
+**Бит четности:** `{parity_bit}`
+
+**Результат:** `{encoded}`
+"""
+
+
+def format_hamming_encode_result(data_bits, encoded, r, n):
+    """
+    Форматирование результата кодирования Хэмминга
+    
+    Args:
+        data_bits: Исходные биты данных
+        encoded: Закодированная последовательность
+        r: Количество контрольных битов
+        n: Общая длина кода
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    return f"""
+🔧 **КОДИРОВАНИЕ ХЭММИНГА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:** `{data_bits}`
+
+**Количество контрольных битов:** {r}
+**Общая длина кода:** {n}
+
+**Закодированная последовательность:** `{encoded}`
+"""
+
+
+def format_hamming_decode_result(received, data_bits, error_pos, corrected):
+    """
+    Форматирование результата декодирования Хэмминга
+    
+    Args:
+        received: Принятая последовательность
+        data_bits: Извлеченные данные
+        error_pos: Позиция ошибки (0 если нет)
+        corrected: Исправленная последовательность
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    error_info = f"Ошибка обнаружена в позиции {error_pos}" if error_pos > 0 else "Ошибок не обнаружено"
+    
+    return f"""
+🔧 **ДЕКОДИРОВАНИЕ ХЭММИНГА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Принятая последовательность:** `{received}`
+
+**{error_info}**
+{f'**Исправленная последовательность:** `{corrected}`' if error_pos > 0 else ''}
+
+**Извлеченные данные:** `{data_bits}`
+"""
+
+
+def format_secded_decode_result(received, data_bits, error_pos, corrected, status):
+    """
+    Форматирование результата декодирования расширенного кода Хэмминга (SECDED)
+    
+    Args:
+        received: Принятая последовательность
+        data_bits: Извлеченные данные
+        error_pos: Позиция ошибки (0 если нет)
+        corrected: Исправленная последовательность
+        status: Статус декодирования (ok, corrected, parity, double)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    status_info = {
+        'ok': "Ошибок не обнаружено",
+        'corrected': f"Одиночная ошибка в позиции {error_pos} исправлена",
+        'parity': f"Ошибка в общем бите четности (позиция {error_pos}) исправлена",
+        'double': "Обнаружена двойная ошибка — исправление невозможно"
+    }
+    
+    if status == 'double':
+        data_line = "**Данные не могут быть восстановлены**"
+    else:
+        data_line = f"**Извлеченные данные:** `{data_bits}`"
+    
+    return f"""
+🛡️ **ДЕКОДИРОВАНИЕ РАСШИРЕННОГО КОДА ХЭММИНГА (SECDED)**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Принятая последовательность:** `{received}`
+
+**{status_info[status]}**
+{f'**Исправленная последовательность:** `{corrected}`' if error_pos > 0 else ''}
+
+{data_line}
+"""
+
+
+def format_hamming_batch_result(received, data_bits, error_positions, corrected, limit=20):
+    """
+    Форматирование результата пакетного декодирования Хэмминга
+    
+    Args:
+        received: Список принятых последовательностей
+        data_bits: Список извлеченных данных
+        error_positions: Позиции ошибок по строкам (0 если нет,
+            больше длины слова при многократной ошибке)
+        corrected: Список исправленных последовательностей
+        limit: Сколько строк показать подробно
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    total = len(received)
+    n = len(received[0]) if received else 0
+    errors_count = sum(1 for pos in error_positions if 0 < pos <= n)
+    uncorrectable_count = sum(1 for pos in error_positions if pos > n)
+    
+    rows_text = []
+    for i in range(min(total, limit)):
+        pos = int(error_positions[i])
+        if pos > n:
+            rows_text.append(f"{i+1}. `{received[i]}` → синдром {pos} вне слова → многократная ошибка, исправление невозможно")
+        elif pos > 0:
+            rows_text.append(f"{i+1}. `{received[i]}` → ошибка в позиции {pos} → `{corrected[i]}` → данные `{data_bits[i]}`")
+        else:
+            rows_text.append(f"{i+1}. `{received[i]}` → ошибок нет → данные `{data_bits[i]}`")
+    if total > limit:
+        rows_text.append(f"... (еще {total - limit} строк)")
+    
+    return f"""
+🔧 **ПАКЕТНОЕ ДЕКОДИРОВАНИЕ ХЭММИНГА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Кодовых слов:** {total}
+**Слов с исправленной ошибкой:** {errors_count}
+**Неисправимых слов:** {uncorrectable_count}
+
+{chr(10).join(rows_text)}
+"""
+
+
+def _row_numbers(rows, limit=20):
+    """Список номеров строк с ограничением длины"""
+    text = ', '.join(str(row) for row in rows[:limit])
+    if len(rows) > limit:
+        text += f" ... (еще {len(rows) - limit})"
+    return text
+
+
+def format_barcode_batch_result(symbology, complete, preview, check_digits, status, summary, limit=20):
+    """
+    Форматирование результата пакетной проверки штрих-кодов
+    
+    Args:
+        symbology: Символика (EAN-13, EAN-8, UPC-A, ITF-14, GTIN)
+        complete: True — рассчитывались контрольные цифры, False — проверялись коды
+        preview: Первые строки пакета (для подробного вывода)
+        check_digits: Рассчитанные или ожидаемые контрольные цифры (-1 для некорректных строк)
+        status: Статусы строк (0 - верно, 1 - неверная контрольная цифра, 2 - некорректная строка)
+        summary: Сводка (total, ok_count, wrong_rows, malformed_rows)
+        limit: Сколько строк показать подробно
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    total, ok_count, wrong_rows, malformed_rows = summary
+    
+    rows_text = []
+    for i, line in enumerate(preview[:limit]):
+        code = line.strip()
+        if status[i] == 2:
+            rows_text.append(f"{i+1}. {f'`{code}`' if code else '(пустая строка)'} ⚠️ некорректная строка")
+        elif status[i] == 1:
+            rows_text.append(f"{i+1}. `{code}` ❌ контрольная цифра {code[-1]}, ожидалась {check_digits[i]}")
+        elif complete:
+            rows_text.append(f"{i+1}. `{code}` → `{code}{check_digits[i]}`")
+        else:
+            rows_text.append(f"{i+1}. `{code}` ✅")
+    if total > limit:
+        rows_text.append(f"... (еще {total - limit} строк)")
+    
+    errors_text = ""
+    if len(wrong_rows):
+        errors_text += f"\n**Неверная контрольная цифра в строках:** {_row_numbers(wrong_rows)}"
+    if len(malformed_rows):
+        errors_text += f"\n**Некорректные строки:** {_row_numbers(malformed_rows)}"
+    
+    return f"""
+📦 **{'ПАКЕТНЫЙ РАСЧЕТ' if complete else 'ПАКЕТНАЯ ПРОВЕРКА'} {symbology}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Всего строк:** {total}
+**{'Рассчитано' if complete else 'Корректных кодов'}:** {ok_count}
+**С неверной контрольной цифрой:** {len(wrong_rows)}
+**Некорректных строк:** {len(malformed_rows)}
+{errors_text}
+
+{chr(10).join(rows_text)}
+"""
+
+
+def format_crc_result(name, polynomial, source, crc, width, steps=None):
+    """
+    Форматирование результата расчета CRC
+    
+    Args:
+        name: Вариант CRC
+        polynomial: Запись образующего полинома
+        source: Описание исходных данных (последовательность или файл)
+        crc: Значение CRC
+        width: Разрядность CRC
+        steps: Шаги деления (None для длинных сообщений)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    if steps is not None:
+        steps_text = f"**Деление полиномов:**\n{format_steps(steps, prefix='• ')}"
+    else:
+        steps_text = "Сообщение длинное — пошаговое деление не выводится."
+    
+    return f"""
+🔁 **ЦИКЛИЧЕСКИЙ КОД {name}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:** {source}
+**Образующий полином:** {polynomial}
+
+{steps_text}
+
+**CRC:** `{crc:0{width}b}` = `{crc:#0{width // 4 + 2}x}`
+"""
+
+
+def _format_parity_block(block):
+    """Блок двумерной четности в виде таблицы: данные | четность строк, ниже четность столбцов"""
+    lines = [f"`{''.join(map(str, row[:-1]))} | {row[-1]}`" for row in block[:-1]]
+    lines.append(f"`{'─' * (block.shape[1] - 1)} ┼ ─`")
+    lines.append(f"`{''.join(map(str, block[-1, :-1]))} | {block[-1, -1]}`")
+    return '\n'.join(lines)
+
+
+def format_block_parity_2d_result(length, block_size, blocks, padding, encoded, limit=3):
+    """
+    Форматирование результата двумерного кодирования с контролем четности
+    
+    Args:
+        length: Длина исходной последовательности
+        block_size: Длина строки блока
+        blocks: Массив блоков (B, rows + 1, block_size + 1)
+        padding: Количество добавленных нулей
+        encoded: Закодированная последовательность (блоки построчно)
+        limit: Сколько блоков показать (таблицами, если блок не больше PARITY_GRID_MAX)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    rows = blocks.shape[1] - 1
+    if block_size <= PARITY_GRID_MAX and rows <= PARITY_GRID_MAX:
+        blocks_text = [f"**Блок {i}:**\n{_format_parity_block(block)}" for i, block in enumerate(blocks[:limit], 1)]
+        if len(blocks) > limit:
+            blocks_text.append(f"... (еще блоков: {len(blocks) - limit})")
+    else:
+        # Таблицы больших блоков не помещаются в сообщение — только четность первого блока
+        first = blocks[0]
+        blocks_text = [
+            f"_Таблицы блоков больше {PARITY_GRID_MAX} × {PARITY_GRID_MAX} не выводятся._",
+            f"**Четность строк блока 1:** `{''.join(map(str, first[:-1, -1]))}`",
+            f"**Четность столбцов блока 1:** `{''.join(map(str, first[-1, :-1]))}` (угловой бит: {first[-1, -1]})",
+        ]
+    encoded_text = f"`{encoded}`" if len(encoded) <= 512 else f"{len(encoded)} бит"
+    
+    return f"""
+🔲 **ДВУМЕРНЫЙ КОНТРОЛЬ ЧЕТНОСТИ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Длина последовательности:** {length} бит (дополнено нулями: {padding})
+**Блок:** {rows} × {block_size} бит
+**Количество блоков:** {len(blocks)}
+**Проверочных битов:** {len(blocks) * (rows + block_size + 1)}
+
+{chr(10).join(blocks_text)}
+
+**Результат:** {encoded_text}
+"""
+
+
+def format_block_parity_2d_decode_result(block_size, error_rows, error_cols, status, data_bits, limit=20):
+    """
+    Форматирование результата проверки двумерного кода
+    
+    Args:
+        block_size: Длина строки данных в блоке
+        error_rows: Строка ошибки по блокам (-1 если нет)
+        error_cols: Столбец ошибки по блокам (-1 если нет)
+        status: Статусы блоков (0 - без ошибок, 1 - исправлено, 2 - не исправляется)
+        data_bits: Информационные биты после исправления
+        limit: Сколько исправлений показать
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    corrected = [i for i in range(len(status)) if status[i] == 1]
+    uncorrectable = [i for i in range(len(status)) if status[i] == 2]
+    
+    lines = []
+    for i in corrected[:limit]:
+        row, col = int(error_rows[i]), int(error_cols[i])
+        place = "угловой бит" if row == block_size and col == block_size else \
+            f"строка {row + 1}, столбец {col + 1}"
+        lines.append(f"• Блок {i + 1}: ошибка исправлена ({place})")
+    if len(corrected) > limit:
+        lines.append(f"... (еще исправлений: {len(corrected) - limit})")
+    if uncorrectable:
+        lines.append(f"⚠️ Неисправимые ошибки в блоках: {', '.join(str(i + 1) for i in uncorrectable[:limit])}")
+    details = '\n'.join(lines) if lines else "Ошибок не обнаружено ✅"
+    data_text = f"`{data_bits}`" if len(data_bits) <= 512 else f"{len(data_bits)} бит"
+    
+    return f"""
+🛠️ **ПРОВЕРКА ДВУМЕРНОГО КОДА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Блоков:** {len(status)}
+**Без ошибок:** {len(status) - len(corrected) - len(uncorrectable)}
+**Исправлено:** {len(corrected)}
+**Неисправимых:** {len(uncorrectable)}
+
+{details}
+
+**Данные:** {data_text}
+"""
+
+
+def format_audio_sweep_result(target, names, columns, result, limit=30):
+    """
+    Форматирование таблицы перебора параметров звука
+    
+    Args:
+        target: Вычисляемый параметр
+        names: Имена входных параметров
+        columns: Значения входных параметров по строкам
+        result: Вычисленные значения
+        limit: Максимальное количество строк в сообщении (иначе только сводка)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    letters = {"volume": "V", "frequency": "F", "depth": "B", "duration": "T", "channels": "C"}
+    rows = len(result)
+    
+    if rows <= limit:
+        header = [letters[name] for name in names] + [letters[target]]
+        cells = [[f"{value:g}" for value in column] for column in columns]
+        cells.append([f"{value:.10g}" for value in result])
+        if target == "volume":
+            header.append("МБ")
+            cells.append([f"{value / 1024 / 1024:.2f}" for value in result])
+        widths = [max(len(title), *(len(cell) for cell in column)) for title, column in zip(header, cells)]
+        lines = ["  ".join(title.rjust(width) for title, width in zip(header, widths))]
+        for i in range(rows):
+            lines.append("  ".join(column[i].rjust(width) for column, width in zip(cells, widths)))
+        table_text = "```\n" + "\n".join(lines) + "\n```"
+    else:
+        table_text = f"Таблица содержит {rows} строк — полная версия в CSV-файле."
+    
+    return f"""
+📊 **ТАБЛИЦА: {letters[target]} ДЛЯ ВСЕХ СОЧЕТАНИЙ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Строк:** {rows}
+**Минимум {letters[target]}:** {result.min():.10g}
+**Максимум {letters[target]}:** {result.max():.10g}
+
+{table_text}
+"""
+
+
+def format_ean13_result(first_12, even_sum, odd_sum, total, checksum, full_code):
+    """
+    Форматирование результата расчета EAN-13
+    
+    Args:
+        first_12: Первые 12 цифр
+        even_sum: Сумма четных позиций
+        odd_sum: Сумма нечетных позиций
+        total: Общая сумма
+        checksum: Контрольная цифра
+        full_code: Полный код
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    return f"""
+📊 **РАСЧЕТ EAN-13 ДЛЯ: {first_12}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**1. Четные позиции (2,4,6,8,10,12):** {', '.join([first_12[i] for i in range(1, 12, 2)])}
+   Сумма четных: {even_sum}
+   ×3 = {even_sum * 3}
+
+**2. Нечетные позиции (1,3,5,7,9,11):** {', '.join([first_12[i] for i in range(0, 12, 2)])}
+   Сумма нечетных: {odd_sum}
+
+**3. Общая сумма:** {even_sum * 3} + {odd_sum} = {total}
+**4. Контрольная цифра:** (10 - ({total} % 10)) % 10 = {checksum}
+
+🎯 **ПОЛНЫЙ КОД: {full_code}**
+"""
+
+
+def format_qr_numeric_result(digits, encoded_bits, steps):
+    """
+    Форматирование результата цифрового QR-кодирования
+    
+    Args:
+        digits: Исходные цифры
+        encoded_bits: Закодированные биты
+        steps: Шаги кодирования (список или LazySteps)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    steps_text = format_steps(steps, prefix="• ")
+    
+    return f"""
+🔲 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:** {digits}
+
+**Шаги кодирования:**
+{steps_text}
+
+**Результат:** `{encoded_bits}`
+"""
+
+
+def format_qr_full_result(text, level, version, mode, codewords, steps, best_mask=None, penalties=None):
+    """
+    Форматирование результата полного кодирования данных QR
+    
+    Args:
+        text: Исходные данные
+        level: Уровень коррекции ошибок
+        version: Версия QR-кода
+        mode: Режим кодирования
+        codewords: Итоговые кодовые слова
+        steps: Шаги кодирования (список или LazySteps)
+        best_mask: Номер выбранной маски (необязательно)
+        penalties: Штрафы масок по правилам 1-4, массив (8, 4)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    steps_text = format_steps(steps, prefix="• ")
+    codewords_text = ' '.join(str(codeword) for codeword in codewords)
+    
+    mask_text = ""
+    if penalties is not None:
+        lines = []
+        for mask, scores in enumerate(penalties):
+            marker = " ✅" if mask == best_mask else ""
+            parts = ' + '.join(str(int(score)) for score in scores)
+            lines.append(f"• Маска {mask}: {parts} = {int(scores.sum())}{marker}")
+        mask_text = "\n**Выбор маски (N1 + N2 + N3 + N4):**\n" + '\n'.join(lines) + "\n"
+    
+    return f"""
+🔲 **ПОЛНЫЙ ПОТОК ДАННЫХ QR**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:** {text}
+**Уровень коррекции:** {level}
+**Версия:** {version}
+
+**Шаги кодирования:**
+{steps_text}
+
+**Кодовые слова ({len(codewords)}):**
+`{codewords_text}`
+{mask_text}"""
+
+
+def format_qr_alphanumeric_result(text, encoded_bits, steps):
+    """
+    Форматирование результата буквенно-цифрового QR-кодирования (КОИ-8)
+    
+    Args:
+        text: Исходный текст
+        encoded_bits: Закодированные биты
+        steps: Шаги кодирования (список или LazySteps)
+        
+    Returns:
+        str: Отформатированное сообщение
+    """
+    steps_text = format_steps(steps)
+    
+    return f"""
+🔲 **БУКВЕННО-ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходный текст:** {text}
+
+**Шаги кодирования (КОИ-8):**
+{steps_text}
+
+**Результат:** `{encoded_bits}`
+**Длина:** {len(encoded_bits)} бит ({len(encoded_bits)//8} байт)
+"""
+
@@ -1,93 +1,417 @@
-"""Модуль работы с кодом Хэмминга"""
-
-
-def is_power_of_two(n):
-    """Проверка, является ли число степенью двойки"""
-    return n > 0 and (n & (n - 1)) == 0
-
-
-def hamming_encode(data_bits):
-    """
-    Кодирование данных кодом Хэмминга
-    
-    Args:
-        data_bits: Строка с битами данных
-        
-    Returns:
-        tuple: (encoded_code, r, n) - закодированный код, количество контрольных битов, общая длина
-    """
-    m = len(data_bits)
-    
-    # Определить количество контрольных битов
-    r = 1
-    while 2**r < m + r + 1:
-        r += 1
-    
-    # Создать заготовку с контрольными битами
-    n = m + r
-    code = ['0'] * n
-    
-    # Заполнить информационные биты (позиции, не являющиеся степенями двойки)
-    data_index = 0
-    for i in range(1, n + 1):
-        if not is_power_of_two(i):
-            if data_index < m:
-                code[i-1] = data_bits[data_index]
-                data_index += 1
-    
-    # Вычислить контрольные биты
-    for i in range(r):
-        pos = 2**i
-        parity = 0
-        for j in range(1, n + 1):
-            if j & pos:  # Проверяем, установлен ли i-й бит в позиции j
-                parity ^= int(code[j-1])
-        code[pos-1] = str(parity)
-    
-    return ''.join(code), r, n
-
-
-def hamming_decode(received_code):
-    """
-    Декодирование кода Хэмминга с обнаружением и исправлением ошибок
-    
-    Args:
-        received_code: Принятая последовательность битов
-        
-    Returns:
-        tuple: (data_bits, error_pos, corrected_code) - извлеченные данные, позиция ошибки, исправленный код
-    """
-    n = len(received_code)
-    
-    # Определить количество контрольных битов
-    r = 0
-    while 2**r < n:
-        r += 1
-    
-    # Проверить контрольные биты
-    error_pos = 0
-    for i in range(r):
-        pos = 2**i
-        parity = 0
-        for j in range(1, n + 1):
-            if j & pos:
-                parity ^= int(received_code[j-1])
-        if parity != 0:
-            error_pos += pos
-    
-    # Исправить ошибку
-    corrected = list(received_code)
-    if error_pos > 0 and error_pos <= n:
-        corrected[error_pos-1] = '1' if corrected[error_pos-1] == '0' else '0'
-        corrected_code = ''.join(corrected)
-    else:
-        corrected_code = received_code
-    
-    # Извлечь информационные биты
-    data_bits = []
-    for i in range(1, n + 1):
-        if not is_power_of_two(i):
-            data_bits.append(corrected_code[i-1])
-    
-    return ''.join(data_bits), error_pos, corrected_code
-
+"""Модуль работы с кодом Хэмминга"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+def is_power_of_two(n):
+    """Проверка, является ли число степенью двойки"""
+    return n > 0 and (n & (n - 1)) == 0
+
+
+def hamming_encode(data_bits):
+    """
+    Кодирование данных кодом Хэмминга
+    
+    Args:
+        data_bits: Строка с битами данных или BitVector
+        
+    Returns:
+        tuple: (encoded_code, r, n) - закодированный код (строка), количество контрольных битов, общая длина
+    """
+    return hamming_encode_fast(str(data_bits))
+
+
+def hamming_decode(received_code):
+    """
+    Декодирование кода Хэмминга с обнаружением и исправлением ошибок
+    
+    Args:
+        received_code: Принятая последовательность битов (строка или BitVector)
+        
+    Returns:
+        tuple: (data_bits, error_pos, corrected_code) - извлеченные данные, позиция ошибки, исправленный код
+    """
+    return hamming_decode_fast(str(received_code))
+
+
+# ========== БИТОВО-УПАКОВАННЫЙ ДВИЖОК ==========
+#
+# Кодовое слово хранится как целое число Python: бит с номером p соответствует
+# позиции p кода (бит 0 не используется). Контрольные биты считаются через
+# маски позиций и подсчет единиц, поэтому длинные последовательности
+# обрабатываются машинными словами, а не отдельными символами.
+
+
+def _popcount(value):
+    """Количество единичных битов в целом числе"""
+    return bin(value).count('1')
+
+
+@lru_cache(maxsize=32)
+def _position_masks(n, r):
+    """
+    Маски позиций для контрольных битов
+    
+    Args:
+        n: Общая длина кода
+        r: Количество контрольных битов
+        
+    Returns:
+        tuple: Маски, i-я маска содержит все позиции j (1..n), у которых установлен i-й бит
+    """
+    limit = (1 << (n + 1)) - 2  # Биты 1..n
+    masks = []
+    for i in range(r):
+        half = 1 << i
+        period = half << 1
+        mask = ((1 << half) - 1) << half
+        # Удваивать шаблон, пока он не покроет все позиции
+        while period <= n:
+            mask |= mask << period
+            period <<= 1
+        masks.append(mask & limit)
+    return tuple(masks)
+
+
+def _data_runs(n):
+    """
+    Непрерывные участки информационных позиций (не степеней двойки)
+    
+    Args:
+        n: Общая длина кода
+        
+    Returns:
+        list: Список пар (start, end) - границы участка включительно
+    """
+    runs = []
+    pos = 2
+    while pos < n:
+        runs.append((pos + 1, min(2 * pos - 1, n)))
+        pos *= 2
+    return runs
+
+
+def _bits_to_int(bits):
+    """Строка битов → целое число, где бит p соответствует позиции p"""
+    return int(bits[::-1], 2) << 1
+
+
+def _syndrome(code_int, n, r):
+    """Синдром кода: номер позиции ошибки (0 если ошибок нет)"""
+    syndrome = 0
+    for i, mask in enumerate(_position_masks(n, r)):
+        syndrome |= (_popcount(code_int & mask) & 1) << i
+    return syndrome
+
+
+def _extract_data(code, n):
+    """Извлечь информационные биты из строки кода срезами"""
+    return ''.join(code[start - 1:end] for start, end in _data_runs(n))
+
+
+def hamming_encode_fast(data_bits):
+    """
+    Кодирование данных кодом Хэмминга (битово-упакованный движок)
+    
+    Контрольные биты вычисляются масками позиций, поэтому длинные
+    последовательности кодируются быстро. hamming_encode — обертка над этой функцией.
+    
+    Args:
+        data_bits: Строка с битами данных
+        
+    Returns:
+        tuple: (encoded_code, r, n) - закодированный код, количество контрольных битов, общая длина
+    """
+    m = len(data_bits)
+    
+    r = 1
+    while 2**r < m + r + 1:
+        r += 1
+    n = m + r
+    
+    # Разложить данные по участкам между степенями двойки
+    chunks = []
+    data_index = 0
+    for start, end in _data_runs(n):
+        length = end - start + 1
+        chunks.append(data_bits[data_index:data_index + length])
+        data_index += length
+    
+    # Заготовка с нулями на месте контрольных битов
+    draft = '00' + '0'.join(chunks) if chunks else '0' * n
+    code_int = _bits_to_int(draft)
+    
+    # Контрольный бит i — четность позиций из маски i
+    parity_bits = [
+        str(_popcount(code_int & mask) & 1) for mask in _position_masks(n, r)
+    ]
+    
+    # Собрать код: контрольный бит, затем участок данных после него
+    pieces = []
+    for i, parity in enumerate(parity_bits):
+        pieces.append(parity)
+        if 1 <= i <= len(chunks):
+            pieces.append(chunks[i - 1])
+    
+    return ''.join(pieces), r, n
+
+
+def hamming_decode_fast(received_code):
+    """
+    Декодирование кода Хэмминга (битово-упакованный движок)
+    
+    Синдром строится за один проход по маскам позиций, исправление —
+    инверсия одного символа. hamming_decode — обертка над этой функцией.
+    
+    Args:
+        received_code: Принятая последовательность битов
+        
+    Returns:
+        tuple: (data_bits, error_pos, corrected_code) - извлеченные данные, позиция ошибки, исправленный код
+    """
+    n = len(received_code)
+    
+    r = 0
+    while 2**r < n:
+        r += 1
+    
+    error_pos = _syndrome(_bits_to_int(received_code), n, r)
+    
+    if 0 < error_pos <= n:
+        flipped = '1' if received_code[error_pos - 1] == '0' else '0'
+        corrected_code = received_code[:error_pos - 1] + flipped + received_code[error_pos:]
+    else:
+        corrected_code = received_code
+    
+    return _extract_data(corrected_code, n), error_pos, corrected_code
+
+
+# ========== ПАКЕТНОЕ ДЕКОДИРОВАНИЕ (NumPy) ==========
+
+
+@lru_cache(maxsize=32)
+def _parity_check_matrix(n):
+    """
+    Проверочная матрица кода Хэмминга длины n
+    
+    Args:
+        n: Длина кодового слова
+        
+    Returns:
+        tuple: (H, r) - матрица (n, r), где H[j, i] — i-й бит номера позиции j+1, и количество контрольных битов
+    """
+    r = 0
+    while 2**r < n:
+        r += 1
+    positions = np.arange(1, n + 1, dtype=np.int64)
+    H = ((positions[:, None] >> np.arange(r, dtype=np.int64)) & 1).astype(np.int32)
+    H.setflags(write=False)
+    return H, r
+
+
+def bits_matrix(lines):
+    """
+    Преобразовать строки одинаковой длины из '0'/'1' в матрицу (N, n) uint8
+    
+    Args:
+        lines: Список двоичных строк одинаковой длины
+        
+    Returns:
+        numpy.ndarray: Матрица битов
+    """
+    n = len(lines[0])
+    buffer = ''.join(lines).encode('ascii')
+    return (np.frombuffer(buffer, dtype=np.uint8) - ord('0')).reshape(len(lines), n)
+
+
+def matrix_to_lines(matrix):
+    """
+    Преобразовать матрицу битов (N, k) обратно в список строк '0'/'1'
+    
+    Args:
+        matrix: Матрица битов uint8
+        
+    Returns:
+        list: Список двоичных строк
+    """
+    if matrix.shape[1] == 0:
+        return [''] * matrix.shape[0]
+    text = (matrix.astype(np.uint8) + ord('0')).tobytes().decode('ascii')
+    k = matrix.shape[1]
+    return [text[i:i + k] for i in range(0, len(text), k)]
+
+
+def hamming_decode_batch(codewords, n=None):
+    """
+    Пакетное декодирование кодовых слов Хэмминга одинаковой длины
+    
+    Синдромы всех слов вычисляются одним матричным произведением с
+    проверочной матрицей по модулю 2, ошибочные биты инвертируются разом.
+    
+    Args:
+        codewords: Матрица (N, n) из 0/1 или упакованный буфер (bytes),
+            в котором каждое слово дополнено нулями до целого числа байт
+        n: Длина кодового слова (обязательна для упакованного буфера)
+        
+    Returns:
+        tuple: (data_bits, error_positions, corrected) - матрица информационных битов (N, m),
+            синдромы (N,) (0 если ошибок нет, больше n при многократной ошибке -
+            такие слова не исправляются), исправленные слова (N, n)
+    """
+    if isinstance(codewords, (bytes, bytearray, memoryview)):
+        if n is None:
+            raise ValueError("Для упакованного буфера нужно указать длину слова n")
+        row_bytes = (n + 7) // 8
+        packed = np.frombuffer(codewords, dtype=np.uint8)
+        if packed.size % row_bytes != 0:
+            raise ValueError("Размер буфера не кратен длине упакованного слова")
+        received = np.unpackbits(packed.reshape(-1, row_bytes), axis=1, count=n)
+    else:
+        received = np.asarray(codewords, dtype=np.uint8)
+        if received.ndim != 2:
+            raise ValueError("Ожидается матрица размера (N, n)")
+        n = received.shape[1]
+    
+    H, r = _parity_check_matrix(n)
+    
+    # Синдромы всех слов одним произведением матриц
+    syndromes = (received @ H) & 1
+    error_positions = syndromes @ (1 << np.arange(r, dtype=np.int64))
+    
+    # Исправить ошибки сразу во всех строках
+    corrected = received.copy()
+    rows = np.nonzero((error_positions > 0) & (error_positions <= n))[0]
+    corrected[rows, error_positions[rows] - 1] ^= 1
+    
+    positions = np.arange(1, n + 1)
+    data_columns = (positions & (positions - 1)) != 0
+    data_bits = corrected[:, data_columns]
+    
+    return data_bits, error_positions, corrected
+
+
+# ========== РАСШИРЕННЫЙ КОД ХЭММИНГА (SECDED) ==========
+#
+# К коду Хэмминга добавляется общий бит четности (последним символом),
+# что позволяет отличить одиночную ошибку от двойной. Для размеров
+# (7,4), (15,11) и (31,26) синдром собирается из побайтовых таблиц,
+# а решение берется из таблицы синдромов, построенной при импорте.
+
+SECDED_OK = "ok"                # Ошибок нет
+SECDED_CORRECTED = "corrected"  # Одиночная ошибка исправлена
+SECDED_PARITY = "parity"        # Ошибка в общем бите четности
+SECDED_DOUBLE = "double"        # Обнаружена двойная ошибка (не исправляется)
+
+# Длины кода Хэмминга с табличным декодированием
+SECDED_TABLE_SIZES = (7, 15, 31)
+
+
+def _secded_decision(syndrome, parity, n):
+    """
+    Решение декодера SECDED по синдрому и общей четности
+    
+    Args:
+        syndrome: Синдром кода Хэмминга
+        parity: Общая четность принятого слова (0 или 1)
+        n: Длина кода Хэмминга без общего бита четности
+        
+    Returns:
+        tuple: (error_pos, status) - позиция ошибки в слове (0 если нет), статус
+    """
+    if syndrome == 0:
+        return (0, SECDED_OK) if parity == 0 else (n + 1, SECDED_PARITY)
+    if parity == 1 and syndrome <= n:
+        return syndrome, SECDED_CORRECTED
+    return 0, SECDED_DOUBLE
+
+
+def _build_byte_syndromes():
+    """Вклад каждого байта в синдром для четырех байтовых дорожек 32-битного слова"""
+    tables = []
+    for lane in range(4):
+        table = []
+        for value in range(256):
+            syndrome = 0
+            for bit in range(8):
+                if value >> bit & 1:
+                    syndrome ^= lane * 8 + bit
+            table.append(syndrome)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def _build_secded_table(n):
+    """Таблица решений, индекс — (синдром << 1) | общая четность"""
+    r = 0
+    while 2**r < n + 1:
+        r += 1
+    return tuple(
+        _secded_decision(index >> 1, index & 1, n) for index in range(2 ** (r + 1))
+    )
+
+
+_SYNDROME_0, _SYNDROME_1, _SYNDROME_2, _SYNDROME_3 = _build_byte_syndromes()
+_BYTE_PARITY = tuple(_popcount(value) & 1 for value in range(256))
+_SECDED_TABLES = {n: _build_secded_table(n) for n in SECDED_TABLE_SIZES}
+
+
+def extended_hamming_encode(data_bits):
+    """
+    Кодирование расширенным кодом Хэмминга (SECDED)
+    
+    Args:
+        data_bits: Строка с битами данных
+        
+    Returns:
+        tuple: (encoded_code, r, n) - закодированный код с общим битом четности в конце,
+            количество контрольных битов (включая общий), общая длина
+    """
+    encoded, r, n = hamming_encode_fast(data_bits)
+    overall = encoded.count('1') & 1
+    return encoded + str(overall), r + 1, n + 1
+
+
+def extended_hamming_decode(received_code):
+    """
+    Декодирование расширенного кода Хэмминга (SECDED)
+    
+    Исправляет одиночные ошибки и обнаруживает двойные. Для длин 8, 16 и 32
+    (коды (7,4), (15,11), (31,26) с общим битом) используется таблица синдромов.
+    
+    Args:
+        received_code: Принятая последовательность (последний бит — общая четность)
+        
+    Returns:
+        tuple: (data_bits, error_pos, corrected_code, status) - извлеченные данные,
+            позиция ошибки (0 если нет), исправленный код, статус SECDED_*
+    """
+    if len(received_code) < 4:
+        raise ValueError("Длина расширенного кода Хэмминга должна быть не меньше 4")
+    
+    n = len(received_code) - 1
+    table = _SECDED_TABLES.get(n)
+    
+    if table is not None:
+        # Бит 0 — общая четность, бит p — позиция p кода Хэмминга
+        value = int(received_code[:n][::-1] + received_code[n], 2)
+        b0, b1, b2, b3 = value & 255, value >> 8 & 255, value >> 16 & 255, value >> 24
+        syndrome = _SYNDROME_0[b0] ^ _SYNDROME_1[b1] ^ _SYNDROME_2[b2] ^ _SYNDROME_3[b3]
+        parity = _BYTE_PARITY[b0] ^ _BYTE_PARITY[b1] ^ _BYTE_PARITY[b2] ^ _BYTE_PARITY[b3]
+        error_pos, status = table[syndrome << 1 | parity]
+    else:
+        r = 0
+        while 2**r < n:
+            r += 1
+        syndrome = _syndrome(_bits_to_int(received_code[:n]), n, r)
+        parity = received_code.count('1') & 1
+        error_pos, status = _secded_decision(syndrome, parity, n)
+    
+    if status in (SECDED_CORRECTED, SECDED_PARITY):
+        flipped = '1' if received_code[error_pos - 1] == '0' else '0'
+        corrected_code = received_code[:error_pos - 1] + flipped + received_code[error_pos:]
+    else:
+        corrected_code = received_code
+    
+    return _extract_data(corrected_code[:n], n), error_pos, corrected_code, status
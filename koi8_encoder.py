@@ -1,142 +1,278 @@
-"""Модуль работы с кодировкой КОИ-8"""
-
-# Таблица КОИ-8 для русских букв
-KOI8_TABLE = {
-    # Строчные буквы (192-223)
-    'ю': ('192', '11000000'), 'а': ('193', '11000001'),
-    'б': ('194', '11000010'), 'ц': ('195', '11000011'),
-    'д': ('196', '11000100'), 'е': ('197', '11000101'),
-    'ф': ('198', '11000110'), 'г': ('199', '11000111'),
-    'х': ('200', '11001000'), 'и': ('201', '11001001'),
-    'й': ('202', '11001010'), 'к': ('203', '11001011'),
-    'л': ('204', '11001100'), 'м': ('205', '11001101'),
-    'н': ('206', '11001110'), 'о': ('207', '11001111'),
-    'п': ('208', '11010000'), 'я': ('209', '11010001'),
-    'р': ('210', '11010010'), 'с': ('211', '11010011'),
-    'т': ('212', '11010100'), 'у': ('213', '11010101'),
-    'ж': ('214', '11010110'), 'в': ('215', '11010111'),
-    'ь': ('216', '11011000'), 'ы': ('217', '11011001'),
-    'з': ('218', '11011010'), 'ш': ('219', '11011011'),
-    'э': ('220', '11011100'), 'щ': ('221', '11011101'),
-    'ч': ('222', '11011110'), 'ё': ('223', '11011111'),
-    
-    # Прописные буквы (224-255)
-    'Ю': ('224', '11100000'), 'А': ('225', '11100001'),
-    'Б': ('226', '11100010'), 'Ц': ('227', '11100011'),
-    'Д': ('228', '11100100'), 'Е': ('229', '11100101'),
-    'Ф': ('230', '11100110'), 'Г': ('231', '11100111'),
-    'Х': ('232', '11101000'), 'И': ('233', '11101001'),
-    'Й': ('234', '11101010'), 'К': ('235', '11101011'),
-    'Л': ('236', '11101100'), 'М': ('237', '11101101'),
-    'Н': ('238', '11101110'), 'О': ('239', '11101111'),
-    'П': ('240', '11110000'), 'Я': ('241', '11110001'),
-    'Р': ('242', '11110010'), 'С': ('243', '11110011'),
-    'Т': ('244', '11110100'), 'У': ('245', '11110101'),
-    'Ж': ('246', '11110110'), 'В': ('247', '11110111'),
-    'Ь': ('248', '11111000'), 'Ы': ('249', '11111001'),
-    'З': ('250', '11111010'), 'Ш': ('251', '11111011'),
-    'Э': ('252', '11111100'), 'Щ': ('253', '11111101'),
-    'Ч': ('254', '11111110'), 'Ъ': ('255', '11111111')
-}
-
-# Обратная таблица для декодирования
-KOI8_REVERSE = {v[1]: k for k, v in KOI8_TABLE.items()}
-
-
-def koi8_encode(text):
-    """
-    Кодирование текста в КОИ-8
-    
-    Args:
-        text: Текст для кодирования
-        
-    Returns:
-        tuple: (encoded_binary, steps) - закодированный двоичный код и список шагов
-    """
-    encoded_binary = ""
-    steps = []
-    
-    for char in text:
-        if char in KOI8_TABLE:
-            decimal, binary = KOI8_TABLE[char]
-            encoded_binary += binary
-            steps.append(f"'{char}' → {decimal} (десятичное) → {binary} (двоичное)")
-        elif char.isascii():
-            # ASCII символы остаются как есть
-            ascii_code = ord(char)
-            binary = format(ascii_code, '08b')
-            encoded_binary += binary
-            steps.append(f"'{char}' → {ascii_code} (ASCII) → {binary} (двоичное)")
-        else:
-            # Неизвестный символ
-            steps.append(f"'{char}' → символ не найден в таблице КОИ-8")
-    
-    return encoded_binary, steps
-
-
-def koi8_decode(binary_string):
-    """
-    Декодирование двоичного кода из КОИ-8
-    
-    Args:
-        binary_string: Двоичная строка (длина должна быть кратна 8)
-        
-    Returns:
-        tuple: (decoded_text, steps) - декодированный текст и список шагов
-    """
-    decoded_text = ""
-    steps = []
-    
-    # Разбить на байты (по 8 бит)
-    for i in range(0, len(binary_string), 8):
-        byte = binary_string[i:i+8]
-        if len(byte) == 8:
-            if byte in KOI8_REVERSE:
-                char = KOI8_REVERSE[byte]
-                decimal = KOI8_TABLE[char][0]
-                decoded_text += char
-                steps.append(f"{byte} → {decimal} (десятичное) → '{char}'")
-            else:
-                # Попробовать как ASCII
-                try:
-                    decimal = int(byte, 2)
-                    if 32 <= decimal <= 126:  # Печатные ASCII символы
-                        char = chr(decimal)
-                        decoded_text += char
-                        steps.append(f"{byte} → {decimal} (ASCII) → '{char}'")
-                    else:
-                        decoded_text += '?'
-                        steps.append(f"{byte} → неизвестный символ")
-                except:
-                    decoded_text += '?'
-                    steps.append(f"{byte} → ошибка декодирования")
-    
-    return decoded_text, steps
-
-
-def block_parity_encode(binary_sequence, block_size=8):
-    """
-    Блочное кодирование с контролем четности
-    
-    Args:
-        binary_sequence: Двоичная последовательность
-        block_size: Размер блока (по умолчанию 8)
-        
-    Returns:
-        list: Список кортежей (block, ones_count, parity_bit, encoded_block)
-    """
-    results = []
-    
-    # Разбить на блоки
-    for i in range(0, len(binary_sequence), block_size):
-        block = binary_sequence[i:i+block_size]
-        
-        # Добавить бит четности
-        ones_count = block.count('1')
-        parity_bit = '0' if ones_count % 2 == 0 else '1'
-        encoded_block = block + parity_bit
-        
-        results.append((block, ones_count, parity_bit, encoded_block))
-    
-    return results
-
+"""Модуль работы с кодировкой КОИ-8"""
+
+import numpy as np
+
+from calculators.bitvector import BitVector
+from calculators.steps import LazySteps
+
+# Таблица КОИ-8 для русских букв
+KOI8_TABLE = {
+    # Строчные буквы (192-223)
+    'ю': ('192', '11000000'), 'а': ('193', '11000001'),
+    'б': ('194', '11000010'), 'ц': ('195', '11000011'),
+    'д': ('196', '11000100'), 'е': ('197', '11000101'),
+    'ф': ('198', '11000110'), 'г': ('199', '11000111'),
+    'х': ('200', '11001000'), 'и': ('201', '11001001'),
+    'й': ('202', '11001010'), 'к': ('203', '11001011'),
+    'л': ('204', '11001100'), 'м': ('205', '11001101'),
+    'н': ('206', '11001110'), 'о': ('207', '11001111'),
+    'п': ('208', '11010000'), 'я': ('209', '11010001'),
+    'р': ('210', '11010010'), 'с': ('211', '11010011'),
+    'т': ('212', '11010100'), 'у': ('213', '11010101'),
+    'ж': ('214', '11010110'), 'в': ('215', '11010111'),
+    'ь': ('216', '11011000'), 'ы': ('217', '11011001'),
+    'з': ('218', '11011010'), 'ш': ('219', '11011011'),
+    'э': ('220', '11011100'), 'щ': ('221', '11011101'),
+    'ч': ('222', '11011110'), 'ъ': ('223', '11011111'),
+    'ё': ('163', '10100011'), 'Ё': ('179', '10110011'),
+    
+    # Прописные буквы (224-255)
+    'Ю': ('224', '11100000'), 'А': ('225', '11100001'),
+    'Б': ('226', '11100010'), 'Ц': ('227', '11100011'),
+    'Д': ('228', '11100100'), 'Е': ('229', '11100101'),
+    'Ф': ('230', '11100110'), 'Г': ('231', '11100111'),
+    'Х': ('232', '11101000'), 'И': ('233', '11101001'),
+    'Й': ('234', '11101010'), 'К': ('235', '11101011'),
+    'Л': ('236', '11101100'), 'М': ('237', '11101101'),
+    'Н': ('238', '11101110'), 'О': ('239', '11101111'),
+    'П': ('240', '11110000'), 'Я': ('241', '11110001'),
+    'Р': ('242', '11110010'), 'С': ('243', '11110011'),
+    'Т': ('244', '11110100'), 'У': ('245', '11110101'),
+    'Ж': ('246', '11110110'), 'В': ('247', '11110111'),
+    'Ь': ('248', '11111000'), 'Ы': ('249', '11111001'),
+    'З': ('250', '11111010'), 'Ш': ('251', '11111011'),
+    'Э': ('252', '11111100'), 'Щ': ('253', '11111101'),
+    'Ч': ('254', '11111110'), 'Ъ': ('255', '11111111')
+}
+
+# Полная таблица КОИ-8 (KOI8-R): символ с индексом i имеет код i
+KOI8_CHARS = bytes(range(256)).decode('koi8_r')
+KOI8_CODES = {char: code for code, char in enumerate(KOI8_CHARS)}
+
+
+def koi8_encode(text):
+    """
+    Кодирование текста в КОИ-8
+    
+    Текст переводится в байты одним вызовом кодека KOI8-R (символы вне
+    таблицы пропускаются), а байты — в битовый вектор.
+    
+    Args:
+        text: Текст для кодирования
+        
+    Returns:
+        tuple: (encoded_binary, steps) - закодированный код (BitVector) и ленивая последовательность шагов
+    """
+    data = text.encode('koi8_r', errors='ignore')
+    return BitVector.from_bytes(data), LazySteps(_koi8_encode_steps, text, total=len(text))
+
+
+def _koi8_encode_steps(text):
+    """Генератор шагов кодирования КОИ-8"""
+    for char in text:
+        code = KOI8_CODES.get(char)
+        if code is None:
+            yield f"'{char}' → символ не найден в таблице КОИ-8"
+        elif code < 128:
+            yield f"'{char}' → {code} (ASCII) → {code:08b} (двоичное)"
+        else:
+            yield f"'{char}' → {code} (десятичное) → {code:08b} (двоичное)"
+
+
+def _build_decode_steps():
+    """
+    Готовые описания шагов декодирования для всех 256 байтов
+    
+    Returns:
+        tuple: Описания шагов; управляющие символы показываются кодом
+            Unicode, так как в сообщении они не отображаются
+    """
+    steps = []
+    for code, char in enumerate(KOI8_CHARS):
+        byte = format(code, '08b')
+        kind = 'ASCII' if code < 128 else 'десятичное'
+        if char.isprintable():
+            steps.append(f"{byte} → {code} ({kind}) → '{char}'")
+        else:
+            steps.append(f"{byte} → {code} ({kind}) → управляющий символ U+{ord(char):04X}")
+    return tuple(steps)
+
+
+KOI8_DECODE_STEPS = _build_decode_steps()
+
+
+def bits_to_bytes(binary_string):
+    """
+    Преобразование двоичной строки в байты (неполный последний байт отбрасывается)
+    
+    Args:
+        binary_string: Двоичная строка
+        
+    Returns:
+        bytes: Байтовая строка
+    """
+    full_bytes = len(binary_string) // 8
+    if full_bytes == 0:
+        return b""
+    return int(binary_string[:full_bytes * 8], 2).to_bytes(full_bytes, 'big')
+
+
+def koi8_decode(binary_string):
+    """
+    Декодирование двоичного кода из КОИ-8
+    
+    Вся строка переводится в байты одним вызовом int(..., 2), затем байты
+    декодируются кодеком KOI8-R целиком, без потери символов.
+    
+    Args:
+        binary_string: Двоичная строка (длина должна быть кратна 8)
+        
+    Returns:
+        tuple: (decoded_text, steps) - декодированный текст и ленивая последовательность шагов
+    """
+    data = bits_to_bytes(binary_string)
+    decoded_text = data.decode('koi8_r')
+    return decoded_text, LazySteps(_koi8_decode_steps, data, total=len(data))
+
+
+def _koi8_decode_steps(data):
+    """Генератор шагов декодирования КОИ-8"""
+    for code in data:
+        yield KOI8_DECODE_STEPS[code]
+
+
+def block_parity_encode(binary_sequence, block_size=8):
+    """
+    Блочное кодирование с контролем четности
+    
+    Args:
+        binary_sequence: Двоичная последовательность (строка или BitVector)
+        block_size: Размер блока (по умолчанию 8)
+        
+    Returns:
+        list: Список кортежей (block, ones_count, parity_bit, encoded_block) из BitVector
+    """
+    results = []
+    
+    # Разбить на блоки
+    for block in BitVector.coerce(binary_sequence).chunks(block_size):
+        # Добавить бит четности
+        ones_count = block.popcount()
+        parity_bit = BitVector(ones_count & 1, 1)
+        encoded_block = block + parity_bit
+        
+        results.append((block, ones_count, parity_bit, encoded_block))
+    
+    return results
+
+
+# ========== ДВУМЕРНЫЙ КОНТРОЛЬ ЧЕТНОСТИ ==========
+
+# Статусы блоков при проверке
+BLOCK_OK = 0             # Ошибок нет
+BLOCK_CORRECTED = 1      # Одиночная ошибка найдена и исправлена
+BLOCK_UNCORRECTABLE = 2  # Ошибка обнаружена, но не исправляется
+
+# Наибольшая длина строки и количество строк блока (блок дополняется нулями целиком)
+BLOCK_PARITY_2D_MAX_SIZE = 64
+
+
+def _bits_array(binary_sequence):
+    """Массив uint8 из строки '0'/'1' или BitVector"""
+    return np.frombuffer(str(binary_sequence).encode('ascii'), dtype=np.uint8) - ord('0')
+
+
+def _check_2d_size(block_size, rows):
+    """Проверка размеров блока двумерной четности"""
+    if not 1 <= block_size <= BLOCK_PARITY_2D_MAX_SIZE or not 1 <= rows <= BLOCK_PARITY_2D_MAX_SIZE:
+        raise ValueError(
+            f"Размер блока для двумерного контроля четности должен быть от 1 до {BLOCK_PARITY_2D_MAX_SIZE}"
+        )
+
+
+def blocks_to_bits(blocks):
+    """Двоичная строка из массива блоков (построчно)"""
+    return (blocks.ravel() + ord('0')).astype(np.uint8).tobytes().decode('ascii')
+
+
+def block_parity_2d_encode(binary_sequence, block_size=8, rows=None):
+    """
+    Двумерное кодирование с контролем четности по строкам и столбцам
+    
+    Последовательность делится на блоки rows × block_size (дополняется нулями),
+    к каждой строке добавляется бит четности, к блоку — строка четности столбцов
+    и общий угловой бит. Все блоки считаются одной операцией над массивом.
+    
+    Args:
+        binary_sequence: Двоичная последовательность (строка или BitVector)
+        block_size: Длина строки блока
+        rows: Количество строк в блоке (по умолчанию равно block_size)
+        
+    Returns:
+        tuple: (blocks, padding) - массив (B, rows + 1, block_size + 1) из uint8
+            и количество добавленных нулей
+    
+    Raises:
+        ValueError: Размер блока больше BLOCK_PARITY_2D_MAX_SIZE
+    """
+    rows = rows or block_size
+    _check_2d_size(block_size, rows)
+    bits = _bits_array(binary_sequence)
+    block_bits = rows * block_size
+    padding = -len(bits) % block_bits
+    data = np.concatenate([bits, np.zeros(padding, dtype=np.uint8)]).reshape(-1, rows, block_size)
+    
+    blocks = np.zeros((len(data), rows + 1, block_size + 1), dtype=np.uint8)
+    blocks[:, :rows, :block_size] = data
+    blocks[:, :rows, block_size] = data.sum(axis=2) & 1
+    blocks[:, rows, :] = blocks[:, :rows, :].sum(axis=1) & 1
+    return blocks, padding
+
+
+def block_parity_2d_decode(encoded_sequence, block_size=8, rows=None):
+    """
+    Проверка и исправление последовательности с двумерным контролем четности
+    
+    Одиночная ошибка дает ровно одну строку и один столбец с нечетной суммой,
+    их пересечение указывает на ошибочный бит (в том числе в битах четности).
+    
+    Args:
+        encoded_sequence: Принятая последовательность (блоки построчно, с битами четности)
+        block_size: Длина строки данных в блоке
+        rows: Количество строк данных в блоке (по умолчанию равно block_size)
+        
+    Returns:
+        tuple: (corrected, error_rows, error_cols, status) - исправленный массив блоков,
+            строка и столбец ошибки по блокам (-1 если нет) и статусы (BLOCK_OK и др.)
+    
+    Raises:
+        ValueError: Размер блока больше BLOCK_PARITY_2D_MAX_SIZE или длина не кратна блоку
+    """
+    rows = rows or block_size
+    _check_2d_size(block_size, rows)
+    bits = _bits_array(encoded_sequence)
+    block_bits = (rows + 1) * (block_size + 1)
+    if not len(bits) or len(bits) % block_bits:
+        raise ValueError(f"Длина последовательности должна быть кратна {block_bits}")
+    
+    blocks = bits.reshape(-1, rows + 1, block_size + 1).copy()
+    bad_rows = blocks.sum(axis=2) & 1
+    bad_cols = blocks.sum(axis=1) & 1
+    row_count = bad_rows.sum(axis=1)
+    col_count = bad_cols.sum(axis=1)
+    
+    single = (row_count == 1) & (col_count == 1)
+    status = np.where((row_count == 0) & (col_count == 0), BLOCK_OK,
+                      np.where(single, BLOCK_CORRECTED, BLOCK_UNCORRECTABLE)).astype(np.int8)
+    
+    error_rows = np.where(single, bad_rows.argmax(axis=1), -1)
+    error_cols = np.where(single, bad_cols.argmax(axis=1), -1)
+    fixed = np.flatnonzero(single)
+    blocks[fixed, error_rows[fixed], error_cols[fixed]] ^= 1
+    return blocks, error_rows, error_cols, status
+
+
+def block_parity_2d_data(blocks):
+    """Информационные биты блоков (без битов четности) одной строкой"""
+    return blocks_to_bits(blocks[:, :-1, :-1])
+
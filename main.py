@@ -1,38 +1,55 @@
-"""Точка входа для Telegram-бота CodeHelper Bot на aiogram"""
-
-import asyncio
-from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
-from aiogram.enums import ParseMode
-from aiogram.client.default import DefaultBotProperties  # type: ignore
-
-from config import BOT_TOKEN
-from handlers import menu_handlers, systems_conversion, codes_and_errors
-
-
-async def main():
-    """Основная функция запуска бота"""
-    if not BOT_TOKEN:
-        print("Ошибка: BOT_TOKEN не установлен. Создайте файл .env и добавьте BOT_TOKEN=ваш_токен")
-        return
-    
-    # Создать бота и диспетчер
-    bot = Bot(
-        token=BOT_TOKEN,
-        default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN)
-    )
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)    
-    
-    # Регистрация роутеров (menu_handlers первым для приоритета кнопки Меню)
-    dp.include_router(menu_handlers.router)
-    dp.include_router(systems_conversion.router)
-    dp.include_router(codes_and_errors.router)
-    
-    # Запуск бота
-    print("Бот запущен и готов к работе!")
-    await dp.start_polling(bot, allowed_updates=["message", "callback_query"])
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+"""Точка входа для Telegram-бота CodeHelper Bot на aiogram"""
+
+import asyncio
+from aiogram import Bot, Dispatcher
+from aiogram.enums import ParseMode
+from aiogram.client.default import DefaultBotProperties  # type: ignore
+
+from config import BOT_TOKEN, BOT_MODE
+from handlers import menu_handlers, systems_conversion, codes_and_errors
+from utils.storage import create_storage
+from utils.state_manager import start_session_sweeper
+from utils.middlewares import SessionMiddleware
+from utils.executor import shutdown_executor
+from utils.webhook import run_webhook, ALLOWED_UPDATES
+
+
+async def main():
+    """Основная функция запуска бота"""
+    if not BOT_TOKEN:
+        print("Ошибка: BOT_TOKEN не установлен. Создайте файл .env и добавьте BOT_TOKEN=ваш_токен")
+        return
+    
+    # Создать бота и диспетчер
+    bot = Bot(
+        token=BOT_TOKEN,
+        default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN)
+    )
+    storage = create_storage()
+    dp = Dispatcher(storage=storage)
+    
+    # Сессия и данные FSM разрешаются один раз на обновление (после FSMContextMiddleware)
+    dp.update.outer_middleware(SessionMiddleware())
+    
+    # Регистрация роутеров (menu_handlers первым для приоритета кнопки Меню)
+    dp.include_router(menu_handlers.router)
+    dp.include_router(systems_conversion.router)
+    dp.include_router(codes_and_errors.router)
+    
+    # Фоновая очистка истекших сессий
+    sweeper = start_session_sweeper()
+    
+    # Запуск бота
+    print("Бот запущен и готов к работе!")
+    try:
+        if BOT_MODE == "webhook":
+            await run_webhook(dp, bot)
+        else:
+            await dp.start_polling(bot, allowed_updates=ALLOWED_UPDATES)
+    finally:
+        sweeper.cancel()
+        shutdown_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""Промежуточные обработчики (middleware) бота"""
+
+from aiogram import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+
+from utils.state_manager import session_store
+from utils.executor import current_user, CalculationCancelled, CalculationTimeout
+from config import ERROR_MESSAGES
+
+# Сообщения, доступные и после истечения сессии (начинают работу заново)
+SESSION_ENTRY_TEXTS = ("🏠 Меню",)
+
+
+class BufferedFSMContext(FSMContext):
+    """
+    Контекст FSM с буферизацией в пределах одного обновления
+
+    Состояние и данные читаются из хранилища не более одного раза,
+    изменения копятся в памяти и записываются методом flush одним
+    обращением к хранилищу на каждое измененное поле.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, context, raw_state=_UNSET):
+        """
+        Args:
+            context: Исходный FSMContext
+            raw_state: Уже прочитанное состояние (из FSMContextMiddleware)
+        """
+        super().__init__(storage=context.storage, key=context.key)
+        self._state = raw_state
+        self._data = None
+        self._state_changed = False
+        self._data_changed = False
+
+    async def get_state(self):
+        if self._state is self._UNSET:
+            self._state = await self.storage.get_state(key=self.key)
+        return self._state
+
+    async def set_state(self, state=None):
+        self._state = state.state if isinstance(state, State) else state
+        self._state_changed = True
+
+    async def get_data(self):
+        if self._data is None:
+            self._data = await self.storage.get_data(key=self.key)
+        return self._data.copy()
+
+    async def set_data(self, data):
+        self._data = dict(data)
+        self._data_changed = True
+
+    async def update_data(self, data=None, **kwargs):
+        if data:
+            kwargs.update(data)
+        if self._data is None:
+            self._data = await self.storage.get_data(key=self.key)
+        self._data.update(kwargs)
+        self._data_changed = True
+        return self._data.copy()
+
+    async def flush(self):
+        """Запись накопленных изменений в хранилище"""
+        if self._state_changed:
+            await self.storage.set_state(key=self.key, state=self._state)
+            self._state_changed = False
+        if self._data_changed:
+            await self.storage.set_data(key=self.key, data=self._data)
+            self._data_changed = False
+
+    def discard(self):
+        """Отказ от накопленных изменений (обновление прервано)"""
+        self._state_changed = False
+        self._data_changed = False
+
+
+class SessionContext:
+    """
+    Сессия пользователя, разрешенная один раз на обновление
+
+    Attributes:
+        user_id: ID пользователя
+        user: Состояние пользователя (UserSession, None для истекшей сессии)
+        expired: Истекла ли сессия к началу обработки обновления
+    """
+
+    __slots__ = ("user_id", "user", "expired")
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.expired = session_store.is_expired(user_id)
+        self.user = None if self.expired else session_store.get(user_id)
+
+
+def _is_entry_point(update):
+    """Команды и кнопка «Меню» работают и при истекшей сессии"""
+    message = update.message
+    return message is not None and bool(message.text) and (
+        message.text.startswith("/") or message.text in SESSION_ENTRY_TEXTS
+    )
+
+
+class SessionMiddleware(BaseMiddleware):
+    """
+    Внешний middleware обновлений: сессия и FSM на одно обновление
+
+    Для каждого обновления сессия пользователя находится один раз и
+    передается обработчикам аргументом session, FSMContext заменяется на
+    BufferedFSMContext. Истекшая сессия обрабатывается здесь же: вместо
+    обработчика пользователь получает сообщение о таймауте. После обработки
+    время активности и данные FSM записываются один раз.
+
+    Здесь же обрабатываются прерванные вычисления (utils.executor): при отмене
+    кнопкой «Меню» изменения FSM отбрасываются, при превышении времени
+    пользователь получает сообщение об ошибке.
+
+    Регистрируется после FSMContextMiddleware (dp.update.outer_middleware).
+    """
+
+    async def __call__(self, handler, event, data):
+        user = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        session = SessionContext(user.id)
+        data["session"] = session
+
+        state = data.get("state")
+        if state is not None:
+            state = BufferedFSMContext(state, data.get("raw_state", BufferedFSMContext._UNSET))
+            data["state"] = state
+
+        token = current_user.set(user.id)
+        try:
+            if session.expired and not _is_entry_point(event):
+                await self._answer_timeout(event, state)
+                return None
+            result = await handler(event, data)
+            session_store.touch(user.id)
+            return result
+        except CalculationCancelled:
+            # Пользователь уже вернулся в меню — состояние этого обновления устарело
+            if state is not None:
+                state.discard()
+            return None
+        except CalculationTimeout:
+            await self._answer_error(event, ERROR_MESSAGES["calculation_timeout"])
+            if state is not None:
+                await state.clear()
+            return None
+        finally:
+            current_user.reset(token)
+            if state is not None:
+                await state.flush()
+
+    @staticmethod
+    async def _answer_timeout(update, state):
+        """Сообщение об истекшей сессии"""
+        if update.callback_query is not None:
+            await update.callback_query.answer(ERROR_MESSAGES["timeout"], show_alert=True)
+        elif update.message is not None:
+            await update.message.answer(ERROR_MESSAGES["timeout"])
+            if state is not None:
+                await state.clear()
+
+    @staticmethod
+    async def _answer_error(update, text):
+        """Сообщение об ошибке в чат обновления"""
+        if update.callback_query is not None and update.callback_query.message is not None:
+            await update.callback_query.message.answer(text)
+        elif update.message is not None:
+            await update.message.answer(text)
@@ -1,134 +1,528 @@
-"""Модуль преобразования чисел в различные коды"""
-
-
-def direct_code(number, bits=8):
-    """
-    Прямой код числа
-    
-    Args:
-        number: Число для кодирования
-        bits: Количество бит (по умолчанию 8)
-        
-    Returns:
-        str: Двоичное представление в прямом коде
-    """
-    if number >= 0:
-        return f"0{bin(number)[2:].zfill(bits-1)}"
-    else:
-        return f"1{bin(abs(number))[2:].zfill(bits-1)}"
-
-
-def reverse_code(number, bits=8):
-    """
-    Обратный код числа
-    
-    Args:
-        number: Число для кодирования
-        bits: Количество бит (по умолчанию 8)
-        
-    Returns:
-        str: Двоичное представление в обратном коде
-    """
-    if number >= 0:
-        return direct_code(number, bits)
-    else:
-        positive = direct_code(abs(number), bits)
-        # Инвертировать все биты кроме знакового
-        inverted = ''.join('1' if bit == '0' else '0' for bit in positive[1:])
-        return f"1{inverted}"
-
-
-def additional_code(number, bits=8):
-    """
-    Дополнительный код числа
-    
-    Args:
-        number: Число для кодирования
-        bits: Количество бит (по умолчанию 8)
-        
-    Returns:
-        str: Двоичное представление в дополнительном коде
-    """
-    if number >= 0:
-        return direct_code(number, bits)
-    else:
-        # Получить обратный код
-        reverse = reverse_code(number, bits)
-        
-        # Добавить 1 к обратному коду
-        result = list(reverse)
-        carry = 1
-        for i in range(len(result) - 1, 0, -1):
-            if result[i] == '0' and carry == 1:
-                result[i] = '1'
-                carry = 0
-                break
-            elif result[i] == '1' and carry == 1:
-                result[i] = '0'
-                carry = 1
-        
-        return ''.join(result)
-
-
-def float_to_binary(number):
-    """
-    Преобразование числа с плавающей запятой в двоичный формат
-    
-    Args:
-        number: Вещественное число
-        
-    Returns:
-        tuple: (steps, result) - список шагов и результат
-    """
-    steps = []
-    
-    # Разделить на целую и дробную части
-    integer_part = int(abs(number))
-    fractional_part = abs(number) - integer_part
-    
-    # Преобразовать целую часть
-    integer_binary = bin(integer_part)[2:]
-    steps.append(f"Целая часть: {integer_part} → {integer_binary}")
-    
-    # Преобразовать дробную часть
-    fractional_binary = ""
-    if fractional_part > 0:
-        steps.append(f"Дробная часть: {fractional_part}")
-        temp = fractional_part
-        for i in range(10):  # Ограничение до 10 знаков после запятой
-            temp *= 2
-            bit = int(temp)
-            fractional_binary += str(bit)
-            steps.append(f"  {temp/2:.6f} × 2 = {temp:.6f} (целая {bit})")
-            temp -= bit
-            if temp == 0:
-                break
-    
-    # Объединить части
-    if fractional_binary:
-        full_binary = f"{integer_binary}.{fractional_binary}"
-    else:
-        full_binary = integer_binary
-    
-    # Нормализация
-    if integer_binary:
-        # Найти позицию первой единицы
-        exp = len(integer_binary) - 1
-        mantissa = integer_binary[1:] + fractional_binary
-        normalized = f"1.{mantissa} × 2^{exp}"
-        steps.append(f"Нормализация: {normalized}")
-        result = normalized
-    else:
-        # Найти первую единицу в дробной части
-        first_one_pos = fractional_binary.find('1')
-        if first_one_pos != -1:
-            exp = -(first_one_pos + 1)
-            mantissa = fractional_binary[first_one_pos + 1:]
-            normalized = f"1.{mantissa} × 2^{exp}"
-            steps.append(f"Нормализация: {normalized}")
-            result = normalized
-        else:
-            result = "0"
-    
-    return steps, result
-
+"""Модуль преобразования чисел в различные коды"""
+
+import math
+import struct
+
+import numpy as np
+
+from calculators.steps import LazySteps
+from calculators.systems_converter import fraction_expansion, fraction_expansion_steps, expansion_text
+
+
+# Допустимая разрядность кодов
+MIN_CODE_BITS = 4
+MAX_CODE_BITS = 128
+
+# Виды кодов целых чисел
+CODE_KINDS = {
+    "direct": "Прямой код",
+    "reverse": "Обратный код",
+    "additional": "Дополнительный код",
+}
+
+# Стандартные разрядности для автоматического выбора
+STANDARD_CODE_BITS = (8, 16, 32, 64, 128)
+
+# Максимальное количество значений в одном пакете
+CODE_BATCH_MAX = 100000
+
+
+def _check_code_params(bits, kind):
+    """Проверка разрядности и вида кода"""
+    if kind not in CODE_KINDS:
+        raise ValueError(f"Неизвестный вид кода: {kind}")
+    if not MIN_CODE_BITS <= bits <= MAX_CODE_BITS:
+        raise ValueError(f"Разрядность должна быть от {MIN_CODE_BITS} до {MAX_CODE_BITS} бит")
+
+
+def code_range(bits=8, kind="additional"):
+    """
+    Диапазон чисел, представимых кодом заданной разрядности
+    
+    Args:
+        bits: Количество бит (от 4 до 128)
+        kind: Вид кода (direct, reverse, additional)
+        
+    Returns:
+        tuple: (low, high) - наименьшее и наибольшее представимые числа
+    """
+    _check_code_params(bits, kind)
+    high = (1 << (bits - 1)) - 1
+    return (-high - 1 if kind == "additional" else -high), high
+
+
+def minimal_code_bits(low, high, kind="additional"):
+    """
+    Наименьшая стандартная разрядность (8, 16, 32, 64, 128), вмещающая диапазон
+    
+    Args:
+        low: Наименьшее кодируемое число
+        high: Наибольшее кодируемое число
+        kind: Вид кода
+        
+    Returns:
+        int: Разрядность или None, если диапазон не помещается в 128 бит
+    """
+    for bits in STANDARD_CODE_BITS:
+        code_low, code_high = code_range(bits, kind)
+        if code_low <= low and high <= code_high:
+            return bits
+    return None
+
+
+def encode_value(number, bits=8, kind="additional"):
+    """
+    Код целого числа в виде беззнакового целого (битовой маски)
+    
+    Args:
+        number: Целое число
+        bits: Количество бит (от 4 до 128)
+        kind: Вид кода (direct, reverse, additional)
+        
+    Returns:
+        int: Значение кода от 0 до 2^bits - 1
+    """
+    low, high = code_range(bits, kind)
+    if not low <= number <= high:
+        raise ValueError(f"Число {number} не помещается в {bits} бит: допустимо от {low} до {high}")
+    if number >= 0:
+        return number
+    mask = (1 << bits) - 1
+    if kind == "direct":
+        return 1 << (bits - 1) | -number
+    if kind == "reverse":
+        return mask + number  # инверсия модуля: mask ^ |number|
+    return number & mask
+
+
+def direct_code(number, bits=8):
+    """
+    Прямой код числа
+    
+    Args:
+        number: Число для кодирования
+        bits: Количество бит (по умолчанию 8)
+        
+    Returns:
+        str: Двоичное представление в прямом коде
+    """
+    return format(encode_value(number, bits, "direct"), f'0{bits}b')
+
+
+def reverse_code(number, bits=8):
+    """
+    Обратный код числа
+    
+    Args:
+        number: Число для кодирования
+        bits: Количество бит (по умолчанию 8)
+        
+    Returns:
+        str: Двоичное представление в обратном коде
+    """
+    return format(encode_value(number, bits, "reverse"), f'0{bits}b')
+
+
+def additional_code(number, bits=8):
+    """
+    Дополнительный код числа
+    
+    Args:
+        number: Число для кодирования
+        bits: Количество бит (по умолчанию 8)
+        
+    Returns:
+        str: Двоичное представление в дополнительном коде
+    """
+    return format(encode_value(number, bits, "additional"), f'0{bits}b')
+
+
+def decode_code(code, kind="additional"):
+    """
+    Декодирование числа из прямого, обратного или дополнительного кода
+    
+    Разрядность определяется длиной кода. Для прямого и обратного кода
+    "отрицательный ноль" декодируется как 0.
+    
+    Args:
+        code: Двоичная строка кода (от 4 до 128 бит)
+        kind: Вид кода (direct, reverse, additional)
+        
+    Returns:
+        int: Декодированное число
+    """
+    bits = len(code)
+    _check_code_params(bits, kind)
+    value = int(code, 2)
+    if not value >> (bits - 1):
+        return value
+    if kind == "direct":
+        return -(value ^ 1 << (bits - 1))
+    if kind == "reverse":
+        return value - ((1 << bits) - 1)
+    return value - (1 << bits)
+
+
+def decode_batch(codes, kind="additional"):
+    """
+    Пакетное декодирование кодов
+    
+    Args:
+        codes: Список двоичных строк
+        kind: Вид кода
+        
+    Returns:
+        list: Декодированные числа
+    """
+    return [decode_code(code, kind) for code in codes]
+
+
+def parse_code_values(text):
+    """
+    Разбор чисел для пакетного кодирования
+    
+    Примеры: "10", "-5, 7, 12", "-8..7" (диапазон включительно)
+    
+    Args:
+        text: Строка с числами
+        
+    Returns:
+        list или range: Числа для кодирования
+    """
+    text = text.strip()
+    if '..' in text:
+        start, _, stop = text.partition('..')
+        start, stop = int(start), int(stop)
+        if stop < start:
+            raise ValueError("Конец диапазона меньше начала")
+        # Размер проверяется арифметикой: len(range) не работает для диапазонов больше sys.maxsize
+        if stop - start + 1 > CODE_BATCH_MAX:
+            raise ValueError(f"Слишком много чисел: не более {CODE_BATCH_MAX}")
+        values = range(start, stop + 1)
+    else:
+        values = [int(part) for part in text.replace(',', ' ').split()]
+    if not len(values):
+        raise ValueError("Не указаны числа")
+    if len(values) > CODE_BATCH_MAX:
+        raise ValueError(f"Слишком много чисел: не более {CODE_BATCH_MAX}")
+    return values
+
+
+def _int64_values(values):
+    """Массив int64 из списка или диапазона (None, если числа не помещаются в int64)"""
+    try:
+        if isinstance(values, range):
+            return np.arange(values.start, values.stop, values.step, dtype=np.int64)
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+def _encode_batch_int64(values, bits, kind):
+    """Кодирование массива int64 (разрядность до 64 бит)"""
+    low, high = code_range(bits, kind)
+    overflow = (values < low) | (values > high)
+    values = np.where(overflow, 0, values)
+    negative = values < 0
+    mask = np.uint64((1 << bits) - 1)
+    
+    if kind == "additional":
+        codes = values.astype(np.uint64) & mask
+    else:
+        magnitude = np.abs(values).astype(np.uint64)
+        if kind == "direct":
+            codes = np.where(negative, magnitude | np.uint64(1 << (bits - 1)), magnitude)
+        else:
+            codes = np.where(negative, mask - magnitude, magnitude)
+    return codes, overflow
+
+
+def encode_batch(values, bits=8, kind="additional"):
+    """
+    Пакетное кодирование целых чисел в прямой, обратный или дополнительный код
+    
+    При разрядности до 64 бит числа кодируются векторно (маскированием
+    массива int64), диапазон range переводится в массив без цикла по числам.
+    Для больших разрядностей используется маскирование целых чисел Python.
+    
+    Args:
+        values: Список чисел или range
+        bits: Количество бит (от 4 до 128)
+        kind: Вид кода (direct, reverse, additional)
+        
+    Returns:
+        tuple: (codes, overflow) - массив кодов (uint64 или object для разрядности
+            больше 64 бит, 0 для не помещающихся чисел) и массив признаков переполнения
+    """
+    low, high = code_range(bits, kind)
+    array = _int64_values(values) if bits <= 64 else None
+    if array is not None:
+        return _encode_batch_int64(array, bits, kind)
+    
+    overflow = np.fromiter((not low <= number <= high for number in values),
+                           dtype=bool, count=len(values))
+    codes = np.array([
+        0 if out else encode_value(number, bits, kind)
+        for number, out in zip(values, overflow)
+    ], dtype=object)
+    return codes, overflow
+
+
+def code_strings(codes, bits, overflow=None):
+    """
+    Двоичные строки кодов
+    
+    Коды uint64 раскладываются в матрицу битов одной операцией над массивом.
+    
+    Args:
+        codes: Массив кодов из encode_batch
+        bits: Разрядность
+        overflow: Признаки переполнения (для них возвращается "")
+        
+    Returns:
+        list: Двоичные строки длины bits
+    """
+    codes = np.asarray(codes)
+    if codes.dtype == object:
+        strings = [format(code, f'0{bits}b') for code in codes]
+    else:
+        shifts = np.arange(bits - 1, -1, -1, dtype=np.uint64)
+        matrix = ((codes[:, None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord('0')
+        strings = matrix.view(f'S{bits}').ravel().astype(f'U{bits}').tolist()
+    
+    if overflow is not None:
+        for i in np.flatnonzero(overflow):
+            strings[i] = ""
+    return strings
+
+
+def float_to_binary(number, exact=False, base=2):
+    """
+    Преобразование числа с плавающей запятой в двоичный формат
+    
+    В точном режиме число разбирается как десятичная дробь ("0.3", "12.375")
+    и раскладывается в системе base без потери точности, период выделяется
+    скобками: 0.1 → "0.0(0011)".
+    
+    Args:
+        number: Вещественное число (в точном режиме также строка)
+        exact: Точный режим через рациональные числа
+        base: Система счисления для точного режима (2-36)
+        
+    Returns:
+        tuple: (steps, result) - ленивая последовательность шагов и результат
+    """
+    if exact:
+        return fraction_expansion_steps(number, base), expansion_text(fraction_expansion(number, base))
+    
+    # Разделить на целую и дробную части
+    integer_part = int(abs(number))
+    fractional_part = abs(number) - integer_part
+    integer_binary = bin(integer_part)[2:]
+    
+    # Преобразовать дробную часть
+    fractional_binary = ""
+    temp = fractional_part
+    if fractional_part > 0:
+        for i in range(10):  # Ограничение до 10 знаков после запятой
+            temp *= 2
+            bit = int(temp)
+            fractional_binary += str(bit)
+            temp -= bit
+            if temp == 0:
+                break
+    
+    # Нормализация
+    result = _normalize_binary(integer_binary, fractional_binary)
+    return LazySteps(_float_to_binary_steps, number, result), result
+
+
+def _normalize_binary(integer_binary, fractional_binary):
+    """Нормализованная запись 1.xxx × 2^e (или "0")"""
+    if integer_binary:
+        # Найти позицию первой единицы
+        exp = len(integer_binary) - 1
+        mantissa = integer_binary[1:] + fractional_binary
+        return f"1.{mantissa} × 2^{exp}"
+    
+    # Найти первую единицу в дробной части
+    first_one_pos = fractional_binary.find('1')
+    if first_one_pos == -1:
+        return "0"
+    exp = -(first_one_pos + 1)
+    mantissa = fractional_binary[first_one_pos + 1:]
+    return f"1.{mantissa} × 2^{exp}"
+
+
+def _float_to_binary_steps(number, result):
+    """Генератор шагов преобразования вещественного числа"""
+    integer_part = int(abs(number))
+    fractional_part = abs(number) - integer_part
+    yield f"Целая часть: {integer_part} → {bin(integer_part)[2:]}"
+    
+    if fractional_part > 0:
+        yield f"Дробная часть: {fractional_part}"
+        temp = fractional_part
+        for i in range(10):
+            temp *= 2
+            bit = int(temp)
+            yield f"  {temp/2:.6f} × 2 = {temp:.6f} (целая {bit})"
+            temp -= bit
+            if temp == 0:
+                break
+    
+    if result != "0":
+        yield f"Нормализация: {result}"
+
+
+# ========== IEEE 754 ==========
+
+# Форматы: имя -> (всего бит, бит порядка, бит мантиссы, формат struct, тип NumPy, целый тип NumPy)
+IEEE754_FORMATS = {
+    "float16": (16, 5, 10, 'e', np.float16, np.uint16),
+    "float32": (32, 8, 23, 'f', np.float32, np.uint32),
+    "float64": (64, 11, 52, 'd', np.float64, np.uint64),
+}
+
+
+def _ieee754_format(fmt):
+    """Поиск формата IEEE 754"""
+    if fmt not in IEEE754_FORMATS:
+        raise ValueError(f"Неизвестный формат: {fmt}")
+    return IEEE754_FORMATS[fmt]
+
+
+def ieee754_pack(number, fmt="float32"):
+    """
+    Битовое представление числа в формате IEEE 754
+    
+    Число округляется к ближайшему представимому модулем struct; значения
+    вне диапазона формата становятся бесконечностью, как при IEEE-округлении.
+    
+    Args:
+        number: Вещественное число
+        fmt: Формат (float16, float32, float64)
+        
+    Returns:
+        tuple: (bits, stored) - целое с битами числа и фактически хранимое значение
+    """
+    _, _, _, code, _, _ = _ieee754_format(fmt)
+    number = float(number)
+    try:
+        packed = struct.pack(f'>{code}', number)
+    except OverflowError:
+        packed = struct.pack(f'>{code}', math.copysign(math.inf, number))
+    return int.from_bytes(packed, 'big'), struct.unpack(f'>{code}', packed)[0]
+
+
+def ieee754_split(bits, fmt="float32"):
+    """
+    Разделение битов IEEE 754 на поля
+    
+    Args:
+        bits: Целое число или массив целых с битами
+        fmt: Формат (float16, float32, float64)
+        
+    Returns:
+        tuple: (sign, exponent, mantissa) - знак, смещенный порядок и дробная часть мантиссы
+    """
+    _, exp_bits, man_bits, _, _, _ = _ieee754_format(fmt)
+    return (bits >> (exp_bits + man_bits),
+            (bits >> man_bits) & ((1 << exp_bits) - 1),
+            bits & ((1 << man_bits) - 1))
+
+
+def ieee754_encode(number, fmt="float32"):
+    """
+    Кодирование числа в формат IEEE 754 с пошаговым объяснением
+    
+    Args:
+        number: Вещественное число
+        fmt: Формат (float16, float32, float64)
+        
+    Returns:
+        tuple: (sign, exponent, mantissa, stored, steps) - поля числа, хранимое значение
+            и ленивая последовательность шагов
+    """
+    bits, stored = ieee754_pack(number, fmt)
+    sign, exponent, mantissa = ieee754_split(bits, fmt)
+    steps = LazySteps(_ieee754_steps, number, fmt, sign, exponent, mantissa, stored)
+    return sign, exponent, mantissa, stored, steps
+
+
+def ieee754_batch(values, fmt="float32"):
+    """
+    Пакетное кодирование чисел в IEEE 754
+    
+    Массив приводится к типу формата и переинтерпретируется как целые
+    одним вызовом view, поля выделяются сдвигами и масками над массивом.
+    
+    Args:
+        values: Список или массив чисел
+        fmt: Формат (float16, float32, float64)
+        
+    Returns:
+        tuple: (sign, exponent, mantissa) - массивы полей
+    """
+    _, _, _, _, float_type, int_type = _ieee754_format(fmt)
+    with np.errstate(over='ignore'):
+        bits = np.asarray(values, dtype=np.float64).astype(float_type).view(int_type)
+    return ieee754_split(bits.astype(np.uint64), fmt)
+
+
+def parse_float_values(text):
+    """
+    Разбор вещественных чисел, разделенных пробелами, переводами строк или ';'
+    
+    Args:
+        text: Строка с числами (допускается десятичная запятая)
+        
+    Returns:
+        list: Числа
+    """
+    values = [float(part.replace(',', '.')) for part in text.replace(';', ' ').split()]
+    if not values:
+        raise ValueError("Не указаны числа")
+    if len(values) > CODE_BATCH_MAX:
+        raise ValueError(f"Слишком много чисел: не более {CODE_BATCH_MAX}")
+    return values
+
+
+def ieee754_bits_text(sign, exponent, mantissa, fmt="float32"):
+    """Запись полей IEEE 754 двоичными группами 'знак порядок мантисса'"""
+    _, exp_bits, man_bits, _, _, _ = _ieee754_format(fmt)
+    return f"{int(sign)} {int(exponent):0{exp_bits}b} {int(mantissa):0{man_bits}b}"
+
+
+def _ieee754_steps(number, fmt, sign, exponent, mantissa, stored):
+    """Генератор шагов кодирования IEEE 754"""
+    total_bits, exp_bits, man_bits, _, _, _ = _ieee754_format(fmt)
+    bias = (1 << (exp_bits - 1)) - 1
+    exp_max = (1 << exp_bits) - 1
+    
+    yield f"Формат {fmt}: 1 бит знака, {exp_bits} бит порядка, {man_bits} бит мантиссы, смещение {bias}"
+    yield f"Знак: {'минус' if sign else 'плюс'} → {sign}"
+    
+    if exponent == exp_max:
+        if not mantissa and not math.isinf(number):
+            yield "|x| больше наибольшего числа формата → округление до бесконечности"
+        kind = "NaN" if mantissa else "бесконечность"
+        yield f"Порядок из одних единиц ({exponent:0{exp_bits}b}) → {kind}"
+    elif exponent == 0 and mantissa == 0:
+        yield "Порядок и мантисса равны нулю → ноль"
+    else:
+        magnitude = abs(stored)
+        if exponent == 0:
+            yield f"Число меньше наименьшего нормализованного → денормализованное, порядок 1 - {bias} = {1 - bias}"
+            yield f"Мантисса 0.{mantissa:0{man_bits}b} (без скрытой единицы)"
+        else:
+            power = exponent - bias
+            yield f"Нормализация: |x| = 1.{mantissa:0{man_bits}b} × 2^{power}"
+            yield f"Смещенный порядок: {power} + {bias} = {exponent} → {exponent:0{exp_bits}b}"
+            yield f"Мантисса без скрытой единицы: {mantissa:0{man_bits}b}"
+        yield f"Хранимое значение: {magnitude.hex()} = {magnitude!r}"
+        if stored != number and not math.isnan(number):
+            yield f"Ошибка округления: {abs(stored - number):.3g}"
+    
+    bits = (sign << (total_bits - 1)) | (exponent << man_bits) | mantissa
+    yield f"Итог: {ieee754_bits_text(sign, exponent, mantissa, fmt)} = 0x{bits:0{total_bits // 4}X}"
@@ -1,129 +1,612 @@
-"""Модуль QR-кодирования"""
-
-from calculators.koi8_encoder import koi8_encode
-
-
-def numeric_qr_encode(digits):
-    """
-    Цифровое QR-кодирование
-    
-    Args:
-        digits: Строка с цифрами
-        
-    Returns:
-        tuple: (encoded_bits, steps) - закодированные биты и список шагов
-    """
-    result_bits = ""
-    steps = []
-    
-    # Обработать группы по 3 цифры
-    i = 0
-    while i < len(digits):
-        group = digits[i:i+3]
-        
-        if len(group) == 3:
-            # 3 цифры → 10 бит
-            value = int(group)
-            bits = format(value, '010b')
-            result_bits += bits
-            steps.append(f"Группа '{group}' → {value} → {bits} (10 бит)")
-            i += 3
-        elif len(group) == 2:
-            # 2 цифры → 7 бит
-            value = int(group)
-            bits = format(value, '07b')
-            result_bits += bits
-            steps.append(f"Группа '{group}' → {value} → {bits} (7 бит)")
-            i += 2
-        else:
-            # 1 цифра → 4 бита
-            value = int(group)
-            bits = format(value, '04b')
-            result_bits += bits
-            steps.append(f"Группа '{group}' → {value} → {bits} (4 бита)")
-            i += 1
-    
-    return result_bits, steps
-
-
-def alphanumeric_qr_encode(text):
-    """
-    Буквенно-цифровое QR-кодирование с использованием КОИ-8
-    
-    Args:
-        text: Текст для кодирования
-        
-    Returns:
-        tuple: (encoded_bits, steps) - закодированные биты и список шагов
-    """
-    # Используем КОИ-8 кодирование
-    encoded_bits, koi8_steps = koi8_encode(text)
-    
-    # Форматируем шаги для QR-кодирования
-    steps = []
-    steps.append("**Использована кодировка КОИ-8:**")
-    steps.extend([f"  {step}" for step in koi8_steps])
-    steps.append(f"\n**Результат:** `{encoded_bits}`")
-    
-    return encoded_bits, steps
-
-
-def numeric_qr_encode_with_mask(digits, mask):
-    """
-    Цифровое QR-кодирование с наложением маски
-    
-    Args:
-        digits: Строка с цифрами
-        mask: Двоичная маска для наложения
-        
-    Returns:
-        tuple: (encoded_bits, masked_bits, steps) - закодированные биты, результат с маской, список шагов
-    """
-    # Сначала закодировать число
-    encoded_bits, encode_steps = numeric_qr_encode(digits)
-    
-    steps = []
-    steps.append("**Шаг 1: Кодирование числа**")
-    steps.extend([f"  {step}" for step in encode_steps])
-    steps.append(f"  **Результат:** `{encoded_bits}`")
-    
-    # Наложить маску (XOR)
-    steps.append(f"\n**Шаг 2: Наложение маски**")
-    steps.append(f"  **Маска:** `{mask}`")
-    
-    # Выровнять длину маски под длину закодированных битов
-    if len(mask) < len(encoded_bits):
-        # Повторить маску
-        mask_extended = (mask * ((len(encoded_bits) // len(mask)) + 1))[:len(encoded_bits)]
-    elif len(mask) > len(encoded_bits):
-        # Обрезать маску
-        mask_extended = mask[:len(encoded_bits)]
-    else:
-        mask_extended = mask
-    
-    steps.append(f"  **Выровненная маска:** `{mask_extended}`")
-    
-    # Применить XOR
-    masked_bits = ""
-    xor_steps = []
-    for i in range(len(encoded_bits)):
-        bit1 = int(encoded_bits[i])
-        bit2 = int(mask_extended[i])
-        result_bit = bit1 ^ bit2
-        masked_bits += str(result_bit)
-        if i < 8:  # Показать первые 8 бит для примера
-            xor_steps.append(f"  Бит {i+1}: {bit1} XOR {bit2} = {result_bit}")
-    
-    if len(encoded_bits) > 8:
-        xor_steps.append(f"  ... (аналогично для остальных {len(encoded_bits) - 8} бит)")
-    
-    steps.extend(xor_steps)
-    steps.append(f"  **Результат с маской:** `{masked_bits}`")
-    
-    # Преобразовать в десятичное
-    decimal_result = int(masked_bits, 2)
-    steps.append(f"\n**Шаг 3: Преобразование в десятичное**")
-    steps.append(f"  `{masked_bits}` (двоичное) = `{decimal_result}` (десятичное)")
-    
-    return encoded_bits, masked_bits, steps
-
+"""Модуль QR-кодирования"""
+
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+from calculators.bitvector import BitVector
+from calculators.koi8_encoder import koi8_encode
+from calculators.steps import LazySteps
+
+
+# Длина группы цифр → (количество бит, подпись)
+NUMERIC_GROUP_BITS = {
+    3: (10, "10 бит"),
+    2: (7, "7 бит"),
+    1: (4, "4 бита"),
+}
+
+
+def numeric_qr_encode(digits):
+    """
+    Цифровое QR-кодирование
+    
+    Args:
+        digits: Строка с цифрами
+        
+    Returns:
+        tuple: (encoded_bits, steps) - закодированные биты и ленивая последовательность шагов
+    """
+    # Группы по 3 цифры → 10 бит, остаток из 2 цифр → 7 бит, из 1 цифры → 4 бита
+    result_bits = ''.join(
+        format(int(digits[i:i+3]), f'0{NUMERIC_GROUP_BITS[len(digits[i:i+3])][0]}b')
+        for i in range(0, len(digits), 3)
+    )
+    
+    return result_bits, LazySteps(_numeric_qr_steps, digits, total=(len(digits) + 2) // 3)
+
+
+def _numeric_qr_steps(digits):
+    """Генератор шагов цифрового QR-кодирования"""
+    for i in range(0, len(digits), 3):
+        group = digits[i:i+3]
+        width, label = NUMERIC_GROUP_BITS[len(group)]
+        value = int(group)
+        yield f"Группа '{group}' → {value} → {format(value, f'0{width}b')} ({label})"
+
+
+def alphanumeric_qr_encode(text):
+    """
+    Буквенно-цифровое QR-кодирование с использованием КОИ-8
+    
+    Args:
+        text: Текст для кодирования
+        
+    Returns:
+        tuple: (encoded_bits, steps) - закодированные биты и ленивая последовательность шагов
+    """
+    # Используем КОИ-8 кодирование
+    encoded_bits, koi8_steps = koi8_encode(text)
+    
+    total = koi8_steps.total + 2 if koi8_steps.total is not None else None
+    return encoded_bits, LazySteps(_alphanumeric_qr_steps, encoded_bits, koi8_steps, total=total)
+
+
+def _alphanumeric_qr_steps(encoded_bits, koi8_steps):
+    """Генератор шагов буквенно-цифрового QR-кодирования (шаги КОИ-8 с отступом)"""
+    yield "**Использована кодировка КОИ-8:**"
+    for step in koi8_steps:
+        yield f"  {step}"
+    yield f"\n**Результат:** `{encoded_bits}`"
+
+
+def numeric_qr_encode_with_mask(digits, mask):
+    """
+    Цифровое QR-кодирование с наложением маски
+    
+    Args:
+        digits: Строка с цифрами
+        mask: Двоичная маска для наложения (строка или BitVector)
+        
+    Returns:
+        tuple: (encoded_bits, masked_bits, steps) - закодированные биты, результат с маской (BitVector), список шагов
+    """
+    # Сначала закодировать число
+    encoded_bits, encode_steps = numeric_qr_encode(digits)
+    
+    steps = []
+    steps.append("**Шаг 1: Кодирование числа**")
+    steps.extend([f"  {step}" for step in encode_steps])
+    steps.append(f"  **Результат:** `{encoded_bits}`")
+    
+    # Наложить маску (XOR)
+    steps.append(f"\n**Шаг 2: Наложение маски**")
+    steps.append(f"  **Маска:** `{mask}`")
+    
+    # Выровнять длину маски под длину закодированных битов (повторить или обрезать)
+    encoded_vector = BitVector.from_str(encoded_bits)
+    mask_extended = BitVector.coerce(mask).repeat_to(len(encoded_vector))
+    
+    steps.append(f"  **Выровненная маска:** `{mask_extended}`")
+    
+    # Применить XOR
+    masked_bits = encoded_vector ^ mask_extended
+    xor_steps = []
+    for i in range(min(len(encoded_bits), 8)):  # Показать первые 8 бит для примера
+        xor_steps.append(f"  Бит {i+1}: {encoded_vector[i]} XOR {mask_extended[i]} = {masked_bits[i]}")
+    
+    if len(encoded_bits) > 8:
+        xor_steps.append(f"  ... (аналогично для остальных {len(encoded_bits) - 8} бит)")
+    
+    steps.extend(xor_steps)
+    steps.append(f"  **Результат с маской:** `{masked_bits}`")
+    
+    # Преобразовать в десятичное
+    decimal_result = int(masked_bits)
+    steps.append(f"\n**Шаг 3: Преобразование в десятичное**")
+    steps.append(f"  `{masked_bits}` (двоичное) = `{decimal_result}` (десятичное)")
+    
+    return encoded_bits, masked_bits, steps
+
+
+
+# ========== ПОЛНЫЙ ПОТОК ДАННЫХ QR (версии 1-10) ==========
+
+# Уровни коррекции ошибок
+QR_LEVELS = ("L", "M", "Q", "H")
+
+# Символы буквенно-цифрового режима QR (значение = индекс)
+ALPHANUMERIC_CHARSET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+ALPHANUMERIC_VALUES = {char: value for value, char in enumerate(ALPHANUMERIC_CHARSET)}
+
+# Индикаторы режимов
+MODE_INDICATORS = {
+    "numeric": "0001",
+    "alphanumeric": "0010",
+}
+
+# Структура блоков: версия → уровень → (EC-кодовых слов на блок,
+# блоков группы 1, данных в блоке группы 1, блоков группы 2, данных в блоке группы 2)
+QR_BLOCKS = {
+    1: {"L": (7, 1, 19, 0, 0), "M": (10, 1, 16, 0, 0), "Q": (13, 1, 13, 0, 0), "H": (17, 1, 9, 0, 0)},
+    2: {"L": (10, 1, 34, 0, 0), "M": (16, 1, 28, 0, 0), "Q": (22, 1, 22, 0, 0), "H": (28, 1, 16, 0, 0)},
+    3: {"L": (15, 1, 55, 0, 0), "M": (26, 1, 44, 0, 0), "Q": (18, 2, 17, 0, 0), "H": (22, 2, 13, 0, 0)},
+    4: {"L": (20, 1, 80, 0, 0), "M": (18, 2, 32, 0, 0), "Q": (26, 2, 24, 0, 0), "H": (16, 4, 9, 0, 0)},
+    5: {"L": (26, 1, 108, 0, 0), "M": (24, 2, 43, 0, 0), "Q": (18, 2, 15, 2, 16), "H": (22, 2, 11, 2, 12)},
+    6: {"L": (18, 2, 68, 0, 0), "M": (16, 4, 27, 0, 0), "Q": (24, 4, 19, 0, 0), "H": (28, 4, 15, 0, 0)},
+    7: {"L": (20, 2, 78, 0, 0), "M": (18, 4, 31, 0, 0), "Q": (18, 2, 14, 4, 15), "H": (26, 4, 13, 1, 14)},
+    8: {"L": (24, 2, 97, 0, 0), "M": (22, 2, 38, 2, 39), "Q": (22, 4, 18, 2, 19), "H": (26, 4, 14, 2, 15)},
+    9: {"L": (30, 2, 116, 0, 0), "M": (22, 3, 36, 2, 37), "Q": (20, 4, 16, 4, 17), "H": (24, 4, 12, 4, 13)},
+    10: {"L": (18, 2, 68, 2, 69), "M": (26, 4, 43, 1, 44), "Q": (24, 6, 19, 2, 20), "H": (28, 6, 15, 2, 16)},
+}
+
+QR_MAX_VERSION = max(QR_BLOCKS)
+
+
+def char_count_bits(mode, version):
+    """Длина поля количества символов для режима и версии"""
+    if mode == "numeric":
+        return 10 if version <= 9 else 12
+    return 9 if version <= 9 else 11
+
+
+def data_codewords(version, level):
+    """Количество кодовых слов данных для версии и уровня коррекции"""
+    _, g1_blocks, g1_data, g2_blocks, g2_data = QR_BLOCKS[version][level]
+    return g1_blocks * g1_data + g2_blocks * g2_data
+
+
+def _numeric_bits_length(count):
+    """Длина потока данных цифрового режима для count цифр"""
+    return 10 * (count // 3) + (0, 4, 7)[count % 3]
+
+
+def _alphanumeric_bits_length(count):
+    """Длина потока данных буквенно-цифрового режима для count символов"""
+    return 11 * (count // 2) + 6 * (count % 2)
+
+
+def _build_capacity_tables():
+    """Максимальное количество символов: (режим, уровень) → кортеж по версиям 1..10"""
+    lengths = {"numeric": _numeric_bits_length, "alphanumeric": _alphanumeric_bits_length}
+    tables = {}
+    for mode, length_of in lengths.items():
+        for level in QR_LEVELS:
+            capacities = []
+            for version in range(1, QR_MAX_VERSION + 1):
+                available = data_codewords(version, level) * 8 - 4 - char_count_bits(mode, version)
+                count = available * 3 // 10 + 2
+                while length_of(count) > available:
+                    count -= 1
+                capacities.append(count)
+            tables[(mode, level)] = tuple(capacities)
+    return tables
+
+
+QR_CAPACITY = _build_capacity_tables()
+
+
+def select_version(mode, level, count):
+    """
+    Минимальная версия QR, вмещающая count символов
+    
+    Args:
+        mode: Режим (numeric или alphanumeric)
+        level: Уровень коррекции (L, M, Q, H)
+        count: Количество символов
+        
+    Returns:
+        int: Номер версии (1-10)
+    """
+    capacities = QR_CAPACITY[(mode, level)]
+    index = bisect_left(capacities, count)
+    if index == len(capacities):
+        raise ValueError(
+            f"Данные не помещаются в QR-код версии {QR_MAX_VERSION} "
+            f"(максимум {capacities[-1]} символов для уровня {level})"
+        )
+    return index + 1
+
+
+# ---------- Арифметика поля GF(256) ----------
+
+def _build_gf_tables():
+    """Таблицы антилогарифмов и логарифмов GF(256) по модулю x^8 + x^4 + x^3 + x^2 + 1"""
+    exp = [0] * 512
+    log = [0] * 256
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x11D
+    # Продолжение таблицы позволяет не брать сумму логарифмов по модулю 255
+    for power in range(255, 512):
+        exp[power] = exp[power - 255]
+    return tuple(exp), tuple(log)
+
+
+GF_EXP, GF_LOG = _build_gf_tables()
+
+
+def _generator_polynomial(degree):
+    """Порождающий многочлен (x - a^0)(x - a^1)...(x - a^(degree-1)), коэффициенты от старшего"""
+    poly = [1]
+    for root in range(degree):
+        result = [0] * (len(poly) + 1)
+        for i, coef in enumerate(poly):
+            result[i] ^= coef
+            if coef:
+                result[i + 1] ^= GF_EXP[GF_LOG[coef] + root]
+        poly = result
+    return tuple(poly)
+
+
+# Логарифмы коэффициентов порождающих многочленов для всех используемых степеней
+GENERATOR_LOGS = {
+    degree: tuple(GF_LOG[coef] for coef in _generator_polynomial(degree))
+    for degree in sorted({blocks[level][0] for blocks in QR_BLOCKS.values() for level in QR_LEVELS})
+}
+
+
+def rs_ec_codewords(data, ec_count):
+    """
+    Кодовые слова коррекции ошибок Рида-Соломона
+    
+    Остаток от деления многочлена данных (умноженного на x^ec_count)
+    на порождающий многочлен.
+    
+    Args:
+        data: Список кодовых слов данных (0-255)
+        ec_count: Количество кодовых слов коррекции
+        
+    Returns:
+        list: Кодовые слова коррекции ошибок
+    """
+    generator = GENERATOR_LOGS[ec_count]
+    remainder = list(data) + [0] * ec_count
+    for i in range(len(data)):
+        coef = remainder[i]
+        if coef:
+            shift = GF_LOG[coef]
+            for j in range(1, ec_count + 1):
+                remainder[i + j] ^= GF_EXP[shift + generator[j]]
+    return remainder[len(data):]
+
+
+# ---------- Сборка потока ----------
+
+def alphanumeric_qr_bits(text):
+    """
+    Данные буквенно-цифрового режима QR: пары символов → 11 бит, последний одиночный → 6 бит
+    
+    Args:
+        text: Текст из символов ALPHANUMERIC_CHARSET
+        
+    Returns:
+        str: Двоичная строка данных
+    """
+    values = [ALPHANUMERIC_VALUES[char] for char in text]
+    parts = [format(45 * values[i] + values[i + 1], '011b') for i in range(0, len(values) - 1, 2)]
+    if len(values) % 2:
+        parts.append(format(values[-1], '06b'))
+    return ''.join(parts)
+
+
+def detect_qr_mode(text):
+    """Определить режим QR для текста: numeric, alphanumeric или ошибка"""
+    if text.isdigit() and text.isascii():
+        return "numeric"
+    if all(char in ALPHANUMERIC_VALUES for char in text):
+        return "alphanumeric"
+    raise ValueError(
+        "Текст можно закодировать только цифрами или символами 0-9, A-Z, пробел и $%*+-./:"
+    )
+
+
+def qr_encode(text, level="M"):
+    """
+    Кодирование данных QR: режим, количество символов, данные, терминатор,
+    дополнение и кодовые слова Рида-Соломона с чередованием блоков
+    
+    Args:
+        text: Цифры или текст буквенно-цифрового режима
+        level: Уровень коррекции ошибок (L, M, Q, H)
+        
+    Returns:
+        tuple: (codewords, version, mode, steps) - итоговые кодовые слова (после чередования),
+            версия, режим и ленивая последовательность шагов
+    """
+    if not text:
+        raise ValueError("Пустые данные")
+    
+    mode = detect_qr_mode(text)
+    version = select_version(mode, level, len(text))
+    
+    if mode == "numeric":
+        payload, _ = numeric_qr_encode(text)
+    else:
+        payload = alphanumeric_qr_bits(text)
+    
+    capacity_bits = data_codewords(version, level) * 8
+    header = MODE_INDICATORS[mode] + format(len(text), f'0{char_count_bits(mode, version)}b')
+    bits = header + payload
+    
+    # Терминатор (до 4 нулей) и выравнивание до целого байта
+    terminator = '0' * min(4, capacity_bits - len(bits))
+    bits += terminator
+    bits += '0' * (-len(bits) % 8)
+    
+    data = list(int(bits, 2).to_bytes(len(bits) // 8, 'big'))
+    pad_count = capacity_bits // 8 - len(data)
+    data += [(0xEC, 0x11)[i % 2] for i in range(pad_count)]
+    
+    # Разбить на блоки и вычислить коды коррекции
+    ec_count, g1_blocks, g1_data, g2_blocks, g2_data = QR_BLOCKS[version][level]
+    blocks = []
+    offset = 0
+    for size in [g1_data] * g1_blocks + [g2_data] * g2_blocks:
+        blocks.append(data[offset:offset + size])
+        offset += size
+    ec_blocks = [rs_ec_codewords(block, ec_count) for block in blocks]
+    
+    # Чередование: сначала данные по столбцам блоков, затем коды коррекции
+    codewords = [block[i] for i in range(max(g1_data, g2_data)) for block in blocks if i < len(block)]
+    codewords += [block[i] for i in range(ec_count) for block in ec_blocks]
+    
+    steps = LazySteps(
+        _qr_encode_steps, text, level, mode, version, header, payload,
+        terminator, pad_count, blocks, ec_blocks
+    )
+    return codewords, version, mode, steps
+
+
+def _qr_encode_steps(text, level, mode, version, header, payload, terminator, pad_count, blocks, ec_blocks):
+    """Генератор шагов сборки потока QR"""
+    mode_names = {"numeric": "цифровой", "alphanumeric": "буквенно-цифровой"}
+    count_bits = char_count_bits(mode, version)
+    
+    yield f"Режим: {mode_names[mode]}, уровень коррекции {level} → версия {version}"
+    yield f"Индикатор режима: {MODE_INDICATORS[mode]}"
+    yield f"Количество символов: {len(text)} → {header[4:]} ({count_bits} бит)"
+    yield f"Данные: {len(payload)} бит"
+    yield f"Терминатор: {terminator or 'не требуется'}"
+    yield f"Байты-заполнители 11101100/00010001: {pad_count} шт."
+    for i, (block, ec_block) in enumerate(zip(blocks, ec_blocks), 1):
+        yield f"Блок {i}: {len(block)} байт данных → EC: {' '.join(str(c) for c in ec_block)}"
+
+
+# ========== РАЗМЕЩЕНИЕ В МАТРИЦЕ И ВЫБОР МАСКИ ==========
+
+# Центры выравнивающих узоров для версий 2-10
+ALIGNMENT_CENTERS = {
+    1: (),
+    2: (6, 18), 3: (6, 22), 4: (6, 26), 5: (6, 30), 6: (6, 34),
+    7: (6, 22, 38), 8: (6, 24, 42), 9: (6, 26, 46), 10: (6, 28, 50),
+}
+
+# Биты уровня коррекции в информации о формате
+FORMAT_LEVEL_BITS = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# Образцы, похожие на поисковый узор (правило 3): 1:1:3:1:1 с 4 светлыми модулями
+_FINDER_LIKE = np.array([
+    [1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1],
+], dtype=bool)
+
+
+def qr_size(version):
+    """Размер стороны QR-кода в модулях"""
+    return 17 + 4 * version
+
+
+def format_bits(level, mask):
+    """15 бит информации о формате (BCH(15,5) с маской 101010000010010)"""
+    data = FORMAT_LEVEL_BITS[level] << 3 | mask
+    remainder = data
+    for _ in range(10):
+        remainder = (remainder << 1) ^ ((remainder >> 9) * 0x537)
+    return (data << 10 | remainder) ^ 0x5412
+
+
+def _version_bits(version):
+    """18 бит информации о версии (BCH(18,6)), используются с версии 7"""
+    remainder = version
+    for _ in range(12):
+        remainder = (remainder << 1) ^ ((remainder >> 11) * 0x1F25)
+    return version << 12 | remainder
+
+
+def _format_positions(size):
+    """Координаты (строки, столбцы) двух копий 15 бит формата, бит i — позиция i"""
+    first = [(i, 8) for i in range(6)] + [(7, 8), (8, 8), (8, 7)] + [(8, 14 - i) for i in range(9, 15)]
+    second = [(8, size - 1 - i) for i in range(8)] + [(size - 15 + i, 8) for i in range(8, 15)]
+    rows, cols = zip(*(first + second))
+    return np.array(rows), np.array(cols)
+
+
+@lru_cache(maxsize=None)
+def _function_layout(version):
+    """
+    Служебные узоры версии
+    
+    Returns:
+        tuple: (modules, reserved, data_rows, data_cols) - матрица служебных модулей,
+            маска служебных областей и координаты информационных модулей в порядке размещения
+    """
+    size = qr_size(version)
+    modules = np.zeros((size, size), dtype=bool)
+    reserved = np.zeros((size, size), dtype=bool)
+    
+    # Синхронизирующие линии
+    modules[6, :] = np.arange(size) % 2 == 0
+    modules[:, 6] = np.arange(size) % 2 == 0
+    reserved[6, :] = True
+    reserved[:, 6] = True
+    
+    # Поисковые узоры с разделителями
+    ring = np.maximum(np.abs(np.arange(-4, 5))[:, None], np.abs(np.arange(-4, 5))[None, :])
+    finder = (ring != 2) & (ring != 4)
+    for row, col in ((3, 3), (3, size - 4), (size - 4, 3)):
+        top, left = row - 4, col - 4
+        r0, c0 = max(top, 0), max(left, 0)
+        r1, c1 = min(top + 9, size), min(left + 9, size)
+        modules[r0:r1, c0:c1] = finder[r0 - top:r1 - top, c0 - left:c1 - left]
+        reserved[r0:r1, c0:c1] = True
+    
+    # Выравнивающие узоры
+    centers = ALIGNMENT_CENTERS[version]
+    alignment = np.maximum(np.abs(np.arange(-2, 3))[:, None], np.abs(np.arange(-2, 3))[None, :]) != 1
+    last = len(centers) - 1
+    for i, row in enumerate(centers):
+        for j, col in enumerate(centers):
+            if (i, j) in ((0, 0), (0, last), (last, 0)):
+                continue
+            modules[row - 2:row + 3, col - 2:col + 3] = alignment
+            reserved[row - 2:row + 3, col - 2:col + 3] = True
+    
+    # Области формата и темный модуль
+    rows, cols = _format_positions(size)
+    reserved[rows, cols] = True
+    modules[size - 8, 8] = True
+    reserved[size - 8, 8] = True
+    
+    # Информация о версии
+    if version >= 7:
+        bits = _version_bits(version)
+        for i in range(18):
+            a, b = size - 11 + i % 3, i // 3
+            modules[b, a] = modules[a, b] = bits >> i & 1
+            reserved[b, a] = reserved[a, b] = True
+    
+    # Порядок размещения данных: пары столбцов справа налево, змейкой
+    order = []
+    right = size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = (right + 1) & 2 == 0
+        for vert in range(size):
+            row = size - 1 - vert if upward else vert
+            for col in (right, right - 1):
+                if not reserved[row, col]:
+                    order.append((row, col))
+        right -= 2
+    data_rows, data_cols = (np.array(axis) for axis in zip(*order))
+    
+    for array in (modules, reserved, data_rows, data_cols):
+        array.setflags(write=False)
+    return modules, reserved, data_rows, data_cols
+
+
+@lru_cache(maxsize=None)
+def _mask_patterns(size):
+    """Все восемь масок QR как булевы массивы (8, size, size)"""
+    i, j = np.indices((size, size))
+    patterns = np.stack([
+        (i + j) % 2 == 0,
+        i % 2 == 0,
+        j % 3 == 0,
+        (i + j) % 3 == 0,
+        (i // 2 + j // 3) % 2 == 0,
+        (i * j) % 2 + (i * j) % 3 == 0,
+        ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+        ((i + j) % 2 + (i * j) % 3) % 2 == 0,
+    ])
+    patterns.setflags(write=False)
+    return patterns
+
+
+def _penalty_runs(matrices):
+    """Правило 1: серии из 5 и более одинаковых модулей в строках (3 + (длина - 5))"""
+    equal = matrices[..., 1:] == matrices[..., :-1]
+    uniform = equal[..., :-3] & equal[..., 1:-2] & equal[..., 2:-1] & equal[..., 3:]
+    starts = uniform.copy()
+    starts[..., 1:] &= ~equal[..., :-4]
+    return uniform.sum(axis=(1, 2)) + 2 * starts.sum(axis=(1, 2))
+
+
+def _penalty_finder_like(matrices):
+    """Правило 3: образцы 1:1:3:1:1 с 4 светлыми модулями в строках"""
+    windows = np.lib.stride_tricks.sliding_window_view(matrices, 11, axis=2)
+    matches = (windows[..., None, :] == _FINDER_LIKE).all(axis=-1)
+    return 40 * matches.sum(axis=(1, 2, 3))
+
+
+def mask_penalties(matrices):
+    """
+    Штрафные баллы по четырем правилам для набора матриц
+    
+    Args:
+        matrices: Булев массив (K, size, size)
+        
+    Returns:
+        numpy.ndarray: Массив (K, 4) - штрафы по правилам 1-4
+    """
+    columns = matrices.transpose(0, 2, 1)
+    
+    n1 = _penalty_runs(matrices) + _penalty_runs(columns)
+    
+    top_left = matrices[:, :-1, :-1]
+    blocks = (
+        (top_left == matrices[:, 1:, :-1])
+        & (top_left == matrices[:, :-1, 1:])
+        & (top_left == matrices[:, 1:, 1:])
+    )
+    n2 = 3 * blocks.sum(axis=(1, 2))
+    
+    n3 = _penalty_finder_like(matrices) + _penalty_finder_like(columns)
+    
+    total = matrices.shape[1] * matrices.shape[2]
+    dark = matrices.sum(axis=(1, 2))
+    n4 = 10 * (np.abs(20 * dark - 10 * total) // total)
+    
+    return np.stack([n1, n2, n3, n4], axis=1)
+
+
+def qr_best_mask(codewords, version, level):
+    """
+    Размещение кодовых слов в матрице и выбор лучшей из восьми масок
+    
+    Все маски накладываются одновременно как булевы массивы NumPy,
+    штрафы по четырем правилам считаются операциями над массивами.
+    
+    Args:
+        codewords: Итоговые кодовые слова (после чередования)
+        version: Версия QR-кода (1-10)
+        level: Уровень коррекции ошибок (L, M, Q, H)
+        
+    Returns:
+        tuple: (best_mask, penalties, matrix) - номер лучшей маски, штрафы (8, 4)
+            и итоговая матрица модулей (True — темный)
+    """
+    modules, reserved, data_rows, data_cols = _function_layout(version)
+    size = qr_size(version)
+    
+    bits = np.unpackbits(np.asarray(codewords, dtype=np.uint8)).astype(bool)
+    base = modules.copy()
+    base[data_rows[:len(bits)], data_cols[:len(bits)]] = bits
+    
+    # Маски действуют только на информационные модули
+    matrices = base ^ (_mask_patterns(size) & ~reserved)
+    
+    # Информация о формате своя для каждой маски
+    rows, cols = _format_positions(size)
+    formats = np.array([format_bits(level, mask) for mask in range(8)])
+    matrices[:, rows, cols] = np.tile((formats[:, None] >> np.arange(15)) & 1, 2).astype(bool)
+    
+    penalties = mask_penalties(matrices)
+    best_mask = int(np.argmin(penalties.sum(axis=1)))
+    return best_mask, penalties, matrices[best_mask]
@@ -1,103 +1,272 @@
-"""Модуль расчета параметров звукового файла"""
-
-
-def calculate_audio_size(frequency, depth, duration, channels):
-    """
-    Расчет объема звукового файла
-    
-    Формула: V = F × (B/8) × T × C
-    
-    Args:
-        frequency: Частота дискретизации (Гц)
-        depth: Глубина кодирования (бит)
-        duration: Длительность звука (секунды)
-        channels: Количество каналов (1-моно, 2-стерео)
-        
-    Returns:
-        tuple: (total_bytes, kb, mb)
-    """
-    bytes_per_sample = depth / 8
-    total_bytes = frequency * bytes_per_sample * duration * channels
-    kb = total_bytes / 1024
-    mb = kb / 1024
-    return int(total_bytes), kb, mb
-
-
-def calculate_frequency(volume, depth, duration, channels):
-    """
-    Расчет частоты дискретизации
-    
-    Формула: F = V / [(B/8) × T × C]
-    
-    Args:
-        volume: Объем файла (байты)
-        depth: Глубина кодирования (бит)
-        duration: Длительность звука (секунды)
-        channels: Количество каналов (1-моно, 2-стерео)
-        
-    Returns:
-        float: Частота дискретизации (Гц)
-    """
-    bytes_per_sample = depth / 8
-    frequency = volume / (bytes_per_sample * duration * channels)
-    return frequency
-
-
-def calculate_depth(volume, frequency, duration, channels):
-    """
-    Расчет глубины кодирования
-    
-    Формула: B = (V × 8) / (F × T × C)
-    
-    Args:
-        volume: Объем файла (байты)
-        frequency: Частота дискретизации (Гц)
-        duration: Длительность звука (секунды)
-        channels: Количество каналов (1-моно, 2-стерео)
-        
-    Returns:
-        float: Глубина кодирования (бит)
-    """
-    depth = (volume * 8) / (frequency * duration * channels)
-    return depth
-
-
-def calculate_duration(volume, frequency, depth, channels):
-    """
-    Расчет длительности звука
-    
-    Формула: T = V / [F × (B/8) × C]
-    
-    Args:
-        volume: Объем файла (байты)
-        frequency: Частота дискретизации (Гц)
-        depth: Глубина кодирования (бит)
-        channels: Количество каналов (1-моно, 2-стерео)
-        
-    Returns:
-        float: Длительность звука (секунды)
-    """
-    bytes_per_sample = depth / 8
-    duration = volume / (frequency * bytes_per_sample * channels)
-    return duration
-
-
-def calculate_channels(volume, frequency, depth, duration):
-    """
-    Расчет количества каналов
-    
-    Формула: C = V / [F × (B/8) × T]
-    
-    Args:
-        volume: Объем файла (байты)
-        frequency: Частота дискретизации (Гц)
-        depth: Глубина кодирования (бит)
-        duration: Длительность звука (секунды)
-        
-    Returns:
-        float: Количество каналов
-    """
-    bytes_per_sample = depth / 8
-    channels = volume / (frequency * bytes_per_sample * duration)
-    return channels
-
+"""Модуль расчета параметров звукового файла"""
+
+import io
+import math
+
+import numpy as np
+
+
+def calculate_audio_size(frequency, depth, duration, channels):
+    """
+    Расчет объема звукового файла
+    
+    Формула: V = F × (B/8) × T × C
+    
+    Args:
+        frequency: Частота дискретизации (Гц)
+        depth: Глубина кодирования (бит)
+        duration: Длительность звука (секунды)
+        channels: Количество каналов (1-моно, 2-стерео)
+        
+    Returns:
+        tuple: (total_bytes, kb, mb)
+    """
+    bytes_per_sample = depth / 8
+    total_bytes = frequency * bytes_per_sample * duration * channels
+    kb = total_bytes / 1024
+    mb = kb / 1024
+    return int(total_bytes), kb, mb
+
+
+def calculate_frequency(volume, depth, duration, channels):
+    """
+    Расчет частоты дискретизации
+    
+    Формула: F = V / [(B/8) × T × C]
+    
+    Args:
+        volume: Объем файла (байты)
+        depth: Глубина кодирования (бит)
+        duration: Длительность звука (секунды)
+        channels: Количество каналов (1-моно, 2-стерео)
+        
+    Returns:
+        float: Частота дискретизации (Гц)
+    """
+    bytes_per_sample = depth / 8
+    frequency = volume / (bytes_per_sample * duration * channels)
+    return frequency
+
+
+def calculate_depth(volume, frequency, duration, channels):
+    """
+    Расчет глубины кодирования
+    
+    Формула: B = (V × 8) / (F × T × C)
+    
+    Args:
+        volume: Объем файла (байты)
+        frequency: Частота дискретизации (Гц)
+        duration: Длительность звука (секунды)
+        channels: Количество каналов (1-моно, 2-стерео)
+        
+    Returns:
+        float: Глубина кодирования (бит)
+    """
+    depth = (volume * 8) / (frequency * duration * channels)
+    return depth
+
+
+def calculate_duration(volume, frequency, depth, channels):
+    """
+    Расчет длительности звука
+    
+    Формула: T = V / [F × (B/8) × C]
+    
+    Args:
+        volume: Объем файла (байты)
+        frequency: Частота дискретизации (Гц)
+        depth: Глубина кодирования (бит)
+        channels: Количество каналов (1-моно, 2-стерео)
+        
+    Returns:
+        float: Длительность звука (секунды)
+    """
+    bytes_per_sample = depth / 8
+    duration = volume / (frequency * bytes_per_sample * channels)
+    return duration
+
+
+def calculate_channels(volume, frequency, depth, duration):
+    """
+    Расчет количества каналов
+    
+    Формула: C = V / [F × (B/8) × T]
+    
+    Args:
+        volume: Объем файла (байты)
+        frequency: Частота дискретизации (Гц)
+        depth: Глубина кодирования (бит)
+        duration: Длительность звука (секунды)
+        
+    Returns:
+        float: Количество каналов
+    """
+    bytes_per_sample = depth / 8
+    channels = volume / (frequency * bytes_per_sample * duration)
+    return channels
+
+
+# ========== ТАБЛИЦЫ ПАРАМЕТРОВ (ПЕРЕБОР ДИАПАЗОНОВ) ==========
+
+# Параметры формулы и их обозначения
+SOUND_PARAMETERS = {
+    "volume": "V",
+    "frequency": "F",
+    "depth": "B",
+    "duration": "T",
+    "channels": "C",
+}
+
+# Максимальное количество строк таблицы
+SWEEP_MAX_ROWS = 100000
+
+
+def _solve(target, volume, frequency, depth, duration, channels):
+    """Вычисление параметра target по формуле V = F × (B/8) × T × C (скаляры или массивы)"""
+    if target == "volume":
+        return frequency * (depth / 8) * duration * channels
+    if target == "frequency":
+        return calculate_frequency(volume, depth, duration, channels)
+    if target == "depth":
+        return calculate_depth(volume, frequency, duration, channels)
+    if target == "duration":
+        return calculate_duration(volume, frequency, depth, channels)
+    return calculate_channels(volume, frequency, depth, duration)
+
+
+def parse_sweep_values(text):
+    """
+    Разбор значений параметра: список через запятую и/или диапазоны
+    
+    Примеры: "44100", "8,16,24", "60-600:60" (от 60 до 600 с шагом 60), "1-5" (шаг 1)
+    
+    Args:
+        text: Строка со значениями
+        
+    Returns:
+        numpy.ndarray: Положительные значения параметра
+    
+    Raises:
+        ValueError: Некорректная запись или больше SWEEP_MAX_ROWS значений
+    """
+    values = []
+    count = 0
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        if '-' in part[1:]:
+            bounds, _, step = part.partition(':')
+            start, _, stop = bounds.partition('-')
+            start, stop, step = float(start), float(stop), float(step or 1)
+            if not step > 0 or not stop >= start:
+                raise ValueError(f"Некорректный диапазон: {part}")
+            # Количество значений проверяется до построения массива
+            span = (stop - start) / step
+            if not span < SWEEP_MAX_ROWS:
+                raise ValueError(f"Слишком много значений в диапазоне {part} (не более {SWEEP_MAX_ROWS})")
+            count += math.floor(span) + 1
+            values.append(np.arange(start, stop + step / 2, step))
+        else:
+            count += 1
+            values.append(np.array([float(part)]))
+        if count > SWEEP_MAX_ROWS:
+            raise ValueError(f"Слишком много значений (не более {SWEEP_MAX_ROWS})")
+    if not values:
+        raise ValueError("Не указаны значения")
+    result = np.concatenate(values)
+    if (result <= 0).any():
+        raise ValueError("Значения должны быть положительными")
+    return result
+
+
+def parse_sweep_spec(text, target):
+    """
+    Разбор описания перебора: по одной строке на параметр вида "F=22050,44100"
+    
+    Args:
+        text: Текст с описанием
+        target: Вычисляемый параметр (ключ SOUND_PARAMETERS)
+        
+    Returns:
+        dict: Параметр -> массив значений для всех параметров, кроме target
+    """
+    letters = {letter: key for key, letter in SOUND_PARAMETERS.items()}
+    spec = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        letter, separator, values = line.partition('=')
+        key = letters.get(letter.strip().upper())
+        if not separator or key is None:
+            raise ValueError(f"Строка должна иметь вид F=44100: {line.strip()}")
+        spec[key] = parse_sweep_values(values)
+    
+    missing = [SOUND_PARAMETERS[key] for key in SOUND_PARAMETERS if key != target and key not in spec]
+    if missing:
+        raise ValueError(f"Не заданы параметры: {', '.join(missing)}")
+    spec.pop(target, None)
+    return spec
+
+
+def audio_sweep(target, **values):
+    """
+    Расчет параметра для всех сочетаний значений остальных параметров
+    
+    Каждый входной параметр занимает свою ось, вся сетка вычисляется одним
+    выражением за счет транслирования (broadcasting) NumPy.
+    
+    Args:
+        target: Вычисляемый параметр (volume, frequency, depth, duration, channels)
+        **values: Массивы значений остальных параметров
+        
+    Returns:
+        tuple: (names, columns, result) - имена входных параметров, их значения
+            по строкам таблицы и вычисленный параметр (одномерные массивы одной длины)
+    """
+    if target not in SOUND_PARAMETERS:
+        raise ValueError(f"Неизвестный параметр: {target}")
+    names = [key for key in SOUND_PARAMETERS if key != target]
+    
+    # Произведение целых Python не переполняется, в отличие от np.prod (int64)
+    rows = math.prod(int(np.size(values[key])) for key in names)
+    if rows > SWEEP_MAX_ROWS:
+        raise ValueError(f"Слишком большая таблица: {rows} строк (не более {SWEEP_MAX_ROWS})")
+    arrays = [np.asarray(values[key], dtype=float).ravel() for key in names]
+    
+    # Параметр i лежит вдоль оси i
+    axes = {
+        key: array.reshape([-1 if axis == i else 1 for axis in range(len(arrays))])
+        for i, (key, array) in enumerate(zip(names, arrays))
+    }
+    axes[target] = None
+    grid = np.asarray(_solve(target, **axes))
+    
+    shape = grid.shape
+    columns = [np.broadcast_to(axes[key], shape).ravel() for key in names]
+    return names, columns, grid.ravel()
+
+
+def sweep_to_csv(target, names, columns, result):
+    """
+    Таблица перебора в формате CSV
+    
+    Args:
+        target: Вычисляемый параметр
+        names: Имена входных параметров
+        columns: Значения входных параметров по строкам
+        result: Вычисленные значения
+        
+    Returns:
+        str: CSV с заголовком (для объема добавляется столбец в мегабайтах)
+    """
+    header = [SOUND_PARAMETERS[key] for key in names] + [SOUND_PARAMETERS[target]]
+    table = columns + [result]
+    if target == "volume":
+        header.append("V_MB")
+        table.append(result / 1024 / 1024)
+    buffer = io.StringIO()
+    np.savetxt(buffer, np.column_stack(table), delimiter=',', fmt='%.10g',
+               header=','.join(header), comments='')
+    return buffer.getvalue()
+
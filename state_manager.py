@@ -1,87 +1,251 @@
-"""Модуль управления состоянием пользователя"""
-
-import time
-from config import SESSION_TIMEOUT
-
-# Хранение состояний пользователей в памяти
-user_states = {}
-
-
-def get_user_state(user_id):
-    """
-    Получить состояние пользователя
-    
-    Args:
-        user_id: ID пользователя
-        
-    Returns:
-        dict: Состояние пользователя
-    """
-    if user_id not in user_states:
-        user_states[user_id] = {
-            "current_menu": "main_menu",
-            "current_method": None,
-            "input_data": {},
-            "last_activity": time.time(),
-            "conversation_step": 0
-        }
-    return user_states[user_id]
-
-
-def update_user_state(user_id, **kwargs):
-    """
-    Обновить состояние пользователя
-    
-    Args:
-        user_id: ID пользователя
-        **kwargs: Поля для обновления
-    """
-    state = get_user_state(user_id)
-    state.update(kwargs)
-    state["last_activity"] = time.time()
-
-
-def clear_user_state(user_id):
-    """
-    Очистить состояние пользователя
-    
-    Args:
-        user_id: ID пользователя
-    """
-    if user_id in user_states:
-        del user_states[user_id]
-
-
-def is_session_expired(user_id):
-    """
-    Проверить, истекла ли сессия пользователя
-    
-    Args:
-        user_id: ID пользователя
-        
-    Returns:
-        bool: True если сессия истекла
-    """
-    if user_id not in user_states:
-        return False
-    
-    state = user_states[user_id]
-    elapsed = time.time() - state["last_activity"]
-    return elapsed > SESSION_TIMEOUT
-
-
-def reset_user_state(user_id):
-    """
-    Сбросить состояние пользователя к начальному
-    
-    Args:
-        user_id: ID пользователя
-    """
-    user_states[user_id] = {
-        "current_menu": "main_menu",
-        "current_method": None,
-        "input_data": {},
-        "last_activity": time.time(),
-        "conversation_step": 0
-    }
-
+"""Модуль управления состоянием пользователя"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+from config import SESSION_TIMEOUT, SESSION_MAX_USERS, SESSION_SWEEP_INTERVAL
+
+
+class UserSession:
+    """
+    Состояние пользователя
+    
+    Поддерживает доступ как к словарю (session["current_method"],
+    session.get("current_method")) для совместимости с обработчиками.
+    
+    Attributes:
+        current_menu: Текущее меню
+        current_method: Выбранный метод расчета
+        input_data: Введенные данные
+        last_activity: Время последней активности (time.monotonic)
+        conversation_step: Шаг диалога
+    """
+    
+    __slots__ = ("current_menu", "current_method", "input_data", "last_activity", "conversation_step")
+    
+    def __init__(self):
+        self.current_menu = "main_menu"
+        self.current_method = None
+        self.input_data = {}
+        self.last_activity = time.monotonic()
+        self.conversation_step = 0
+    
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+    
+    def get(self, name, default=None):
+        return getattr(self, name) if name in self.__slots__ else default
+    
+    def update(self, **kwargs):
+        for name, value in kwargs.items():
+            if name not in self.__slots__:
+                raise KeyError(f"Неизвестное поле состояния: {name}")
+            setattr(self, name, value)
+
+
+class SessionStore:
+    """
+    Хранилище состояний пользователей с ограничением по времени и размеру
+    
+    Сессии хранятся в OrderedDict в порядке последней активности: любое
+    обновление переносит сессию в конец. Так как таймаут одинаков для всех,
+    этот порядок совпадает с порядком истечения сроков, и очередь истечения
+    — это начало словаря: фоновая очистка снимает истекшие сессии с начала
+    за O(1) на сессию, а при превышении max_size с начала же вытесняется
+    самая давно активная сессия (LRU).
+    
+    Идентификаторы удаленных по таймауту пользователей ненадолго запоминаются
+    (не более max_size), чтобы is_session_expired продолжал сообщать об
+    истекшей сессии до ее сброса.
+    """
+    
+    def __init__(self, timeout=SESSION_TIMEOUT, max_size=SESSION_MAX_USERS):
+        """
+        Args:
+            timeout: Время жизни сессии без активности (секунды)
+            max_size: Наибольшее количество хранимых сессий
+        """
+        self.timeout = timeout
+        self.max_size = max_size
+        self._sessions = OrderedDict()
+        self._expired = OrderedDict()
+        self.expired_evictions = 0
+        self.lru_evictions = 0
+    
+    def __len__(self):
+        return len(self._sessions)
+    
+    def __contains__(self, user_id):
+        return user_id in self._sessions
+    
+    def _insert(self, user_id, session):
+        """Добавление сессии в конец очереди с вытеснением по размеру"""
+        self._expired.pop(user_id, None)
+        self._sessions[user_id] = session
+        self._sessions.move_to_end(user_id)
+        while len(self._sessions) > self.max_size:
+            self._sessions.popitem(last=False)
+            self.lru_evictions += 1
+        return session
+    
+    def get(self, user_id):
+        """Сессия пользователя (создается при отсутствии)"""
+        session = self._sessions.get(user_id)
+        if session is None:
+            session = self._insert(user_id, UserSession())
+        return session
+    
+    def touch(self, user_id, **kwargs):
+        """Обновление полей сессии и времени активности"""
+        session = self._sessions.get(user_id) or UserSession()
+        session.update(**kwargs)
+        session.last_activity = time.monotonic()
+        self._insert(user_id, session)
+    
+    def reset(self, user_id):
+        """Замена сессии на новую"""
+        self._insert(user_id, UserSession())
+    
+    def remove(self, user_id):
+        """Удаление сессии"""
+        self._sessions.pop(user_id, None)
+        self._expired.pop(user_id, None)
+    
+    def is_expired(self, user_id):
+        """Истекла ли сессия (в том числе уже удаленная очисткой)"""
+        session = self._sessions.get(user_id)
+        if session is None:
+            return user_id in self._expired
+        return time.monotonic() - session.last_activity > self.timeout
+    
+    def sweep(self, now=None, limit=None):
+        """
+        Удаление истекших сессий с начала очереди
+        
+        Args:
+            now: Текущее время time.monotonic (по умолчанию — сейчас)
+            limit: Наибольшее количество удаляемых за вызов сессий
+        
+        Returns:
+            int: Количество удаленных сессий
+        """
+        now = time.monotonic() if now is None else now
+        deadline = now - self.timeout
+        sessions = self._sessions
+        removed = 0
+        while sessions and (limit is None or removed < limit):
+            user_id = next(iter(sessions))
+            if sessions[user_id].last_activity >= deadline:
+                break
+            sessions.popitem(last=False)
+            self._expired[user_id] = None
+            removed += 1
+        while len(self._expired) > self.max_size:
+            self._expired.popitem(last=False)
+        self.expired_evictions += removed
+        return removed
+    
+    async def run_sweeper(self, interval=SESSION_SWEEP_INTERVAL, batch=1000):
+        """Фоновая задача периодической очистки (порциями, не блокируя цикл событий)"""
+        while True:
+            await asyncio.sleep(interval)
+            while self.sweep(limit=batch) == batch:
+                await asyncio.sleep(0)
+    
+    def gauges(self):
+        """
+        Показатели хранилища
+        
+        Returns:
+            dict: size, expired_evictions, lru_evictions, expired_remembered
+        """
+        return {
+            "size": len(self._sessions),
+            "expired_evictions": self.expired_evictions,
+            "lru_evictions": self.lru_evictions,
+            "expired_remembered": len(self._expired),
+        }
+
+
+# Хранилище состояний пользователей в памяти
+session_store = SessionStore()
+
+
+def get_user_state(user_id):
+    """
+    Получить состояние пользователя
+    
+    Args:
+        user_id: ID пользователя
+    
+    Returns:
+        UserSession: Состояние пользователя
+    """
+    return session_store.get(user_id)
+
+
+def update_user_state(user_id, **kwargs):
+    """
+    Обновить состояние пользователя
+    
+    Args:
+        user_id: ID пользователя
+        **kwargs: Поля для обновления
+    """
+    session_store.touch(user_id, **kwargs)
+
+
+def clear_user_state(user_id):
+    """
+    Очистить состояние пользователя
+    
+    Args:
+        user_id: ID пользователя
+    """
+    session_store.remove(user_id)
+
+
+def is_session_expired(user_id):
+    """
+    Проверить, истекла ли сессия пользователя
+    
+    Args:
+        user_id: ID пользователя
+    
+    Returns:
+        bool: True если сессия истекла
+    """
+    return session_store.is_expired(user_id)
+
+
+def reset_user_state(user_id):
+    """
+    Сбросить состояние пользователя к начальному
+    
+    Args:
+        user_id: ID пользователя
+    """
+    session_store.reset(user_id)
+
+
+def start_session_sweeper():
+    """
+    Запуск фоновой очистки истекших сессий в текущем цикле событий
+    
+    Returns:
+        asyncio.Task: Задача очистки (отменяется при остановке бота)
+    """
+    return asyncio.get_running_loop().create_task(session_store.run_sweeper())
+
+
+def session_gauges():
+    """
+    Показатели хранилища сессий
+    
+    Returns:
+        dict: Размер и количество вытеснений
+    """
+    return session_store.gauges()
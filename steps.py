@@ -0,0 +1,44 @@
+"""Модуль ленивых пошаговых решений"""
+
+from itertools import islice
+
+
+class LazySteps:
+    """
+    Ленивая последовательность шагов решения
+    
+    Шаги не хранятся, а генерируются заново при каждом проходе, поэтому
+    результат вычисления доступен сразу, а время и память на шаги тратятся
+    только на ту часть, которая действительно выводится.
+    """
+    
+    __slots__ = ("_factory", "_args", "total")
+    
+    def __init__(self, factory, *args, total=None):
+        """
+        Args:
+            factory: Функция-генератор шагов
+            *args: Аргументы для factory
+            total: Общее количество шагов, если его можно узнать без генерации
+        """
+        self._factory = factory
+        self._args = args
+        self.total = total
+    
+    def __iter__(self):
+        return iter(self._factory(*self._args))
+    
+    def take(self, limit):
+        """
+        Получить первые limit шагов
+        
+        Args:
+            limit: Максимальное количество шагов
+            
+        Returns:
+            tuple: (head, has_more) - список первых шагов, есть ли шаги дальше
+        """
+        iterator = iter(self)
+        head = list(islice(iterator, limit))
+        has_more = next(iterator, None) is not None
+        return head, has_more
@@ -0,0 +1,252 @@
+"""Хранилище FSM на SQLite с кэшем в памяти и отложенной записью"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from config import (
+    FSM_STORAGE, FSM_SQLITE_PATH, FSM_FLUSH_INTERVAL, FSM_FLUSH_BATCH, FSM_CACHE_SIZE, FSM_CACHE_TTL
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fsm (
+    key TEXT PRIMARY KEY,
+    state TEXT,
+    data TEXT NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+
+def _json_default(value):
+    """Сериализация значений, неизвестных json: состояние FSM записывается по имени"""
+    if isinstance(value, State):
+        return value.state
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _key_text(key):
+    """Строковый ключ записи из StorageKey"""
+    return (f"{key.bot_id}:{key.chat_id}:{key.user_id}:{key.thread_id or ''}:"
+            f"{key.business_connection_id or ''}:{key.destiny}")
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    Хранилище состояний FSM в базе SQLite (режим WAL)
+
+    Чтение обслуживается LRU-кэшем в памяти процесса, обращение к базе
+    выполняется только при промахе. Запись сначала попадает в кэш и буфер
+    изменений, а в базу уходит пакетом в одной транзакции: по таймеру,
+    при накоплении flush_batch изменений и при закрытии хранилища.
+    Транзакция выполняется в отдельном потоке через собственное соединение,
+    поэтому ожидание блокировки базы не останавливает цикл событий. Записи
+    покидают буфер только после успешной фиксации; при ошибке запись
+    повторяется по таймеру. Данные, которые не сериализуются в JSON,
+    журналируются и в базу не попадают, не задерживая остальные записи.
+
+    Несколько процессов на одном хосте могут работать с одним файлом базы.
+    Если запросы одного пользователя попадают в разные процессы, cache_ttl
+    ограничивает время, в течение которого запись из кэша считается свежей.
+    """
+
+    def __init__(self, path=FSM_SQLITE_PATH, flush_interval=FSM_FLUSH_INTERVAL,
+                 flush_batch=FSM_FLUSH_BATCH, cache_size=FSM_CACHE_SIZE, cache_ttl=FSM_CACHE_TTL):
+        """
+        Args:
+            path: Путь к файлу базы данных
+            flush_interval: Период записи буфера в базу (секунды)
+            flush_batch: Размер буфера, при котором запись выполняется сразу
+            cache_size: Наибольшее количество записей в кэше
+            cache_ttl: Время жизни записи кэша в секундах (None — без ограничения,
+                только для единственного процесса)
+        """
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+        # Соединение цикла событий (чтение) и соединение потока записи
+        self._connection = self._connect(path)
+        self._connection.execute(_SCHEMA)
+        self._writer = self._connect(path)
+
+        # Кэш: ключ -> [state, data, время загрузки]
+        self._cache = OrderedDict()
+        # Буфер изменений: ключ -> (state, data)
+        self._dirty = {}
+        self._flush_timer = None
+        self._flush_task = None
+        self.flush_errors = 0
+        self.skipped_writes = 0
+        self.flushes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def _connect(path):
+        """Соединение с базой в режиме WAL"""
+        connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    def _load(self, key):
+        """Запись из буфера изменений или базы с помещением в кэш"""
+        if key in self._dirty:
+            state, data = self._dirty[key]
+        else:
+            self.cache_misses += 1
+            row = self._connection.execute("SELECT state, data FROM fsm WHERE key = ?", (key,)).fetchone()
+            state, data = (row[0], json.loads(row[1])) if row else (None, {})
+
+        entry = [state, data, time.monotonic()]
+        self._cache[key] = entry
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def _entry(self, key):
+        """Запись кэша с обновлением порядка LRU"""
+        entry = self._cache.get(key)
+        if entry is None or (self.cache_ttl is not None and key not in self._dirty
+                             and time.monotonic() - entry[2] > self.cache_ttl):
+            return self._load(key)
+        self.cache_hits += 1
+        self._cache.move_to_end(key)
+        return entry
+
+    def _write(self, key, state, data):
+        """Изменение записи в кэше и постановка в буфер записи"""
+        entry = self._entry(key)
+        entry[0], entry[1] = state, data
+        self._dirty[key] = (state, data)
+
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Запуск записи сразу (буфер заполнен) или по таймеру"""
+        if self._flush_task is not None or not self._dirty:
+            return
+        if len(self._dirty) >= self.flush_batch:
+            self._start_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.flush_interval, self._start_flush)
+
+    def _start_flush(self):
+        """Запуск фоновой записи буфера (не более одной одновременно)"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._flush_task is None and self._dirty:
+            self._flush_task = asyncio.get_running_loop().create_task(self._background_flush())
+
+    async def _background_flush(self):
+        """Фоновая запись: ошибка журналируется, буфер сохраняется до следующей попытки"""
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Не удалось записать состояния FSM, повтор через %s с", self.flush_interval)
+            self._flush_task = None
+            self._flush_timer = asyncio.get_running_loop().call_later(self.flush_interval, self._start_flush)
+            return
+        self._flush_task = None
+        self._schedule_flush()
+
+    def _commit(self, rows, deleted):
+        """Запись пакета одной транзакцией (выполняется в потоке)"""
+        with self._writer:
+            self._writer.execute("BEGIN")
+            self._writer.executemany("INSERT OR REPLACE INTO fsm VALUES (?, ?, ?, ?)", rows)
+            self._writer.executemany("DELETE FROM fsm WHERE key = ?", deleted)
+
+    async def flush(self):
+        """
+        Запись накопленных изменений в базу одной транзакцией
+
+        Raises:
+            sqlite3.Error: Транзакция не выполнена (изменения остаются в буфере)
+        """
+        batch = dict(self._dirty)
+        if not batch:
+            return
+
+        now = time.time()
+        rows = []
+        deleted = []
+        for key, (state, data) in batch.items():
+            if state is None and not data:
+                deleted.append((key,))
+                continue
+            try:
+                text = json.dumps(data, ensure_ascii=False, default=_json_default)
+            except (TypeError, ValueError):
+                # Повтор не поможет: запись остается только в кэше
+                logger.exception("Данные FSM для %s не сериализуются в JSON, запись пропущена", key)
+                self.skipped_writes += 1
+                del self._dirty[key]
+                continue
+            rows.append((key, state, text, now))
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._commit, rows, deleted)
+        except Exception:
+            self.flush_errors += 1
+            raise
+        # Из буфера удаляются только записанные версии; изменения, сделанные
+        # во время записи, остаются до следующего сброса
+        for key, value in batch.items():
+            if self._dirty.get(key) is value:
+                del self._dirty[key]
+        self.flushes += 1
+
+    async def set_state(self, key, state=None):
+        state = state.state if isinstance(state, State) else state
+        key = _key_text(key)
+        self._write(key, state, self._entry(key)[1])
+
+    async def get_state(self, key):
+        return self._entry(_key_text(key))[0]
+
+    async def set_data(self, key, data):
+        key = _key_text(key)
+        self._write(key, self._entry(key)[0], data.copy())
+
+    async def get_data(self, key):
+        return self._entry(_key_text(key))[1].copy()
+
+    async def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        try:
+            await self.flush()
+        finally:
+            self._connection.close()
+            self._writer.close()
+
+
+def create_storage():
+    """
+    Создание хранилища FSM по настройке FSM_STORAGE
+
+    Returns:
+        BaseStorage: MemoryStorage ("memory") или SQLiteStorage ("sqlite")
+    """
+    if FSM_STORAGE == "sqlite":
+        return SQLiteStorage()
+    if FSM_STORAGE == "memory":
+        return MemoryStorage()
+    raise ValueError(f"Неизвестный тип хранилища FSM: {FSM_STORAGE}")
@@ -1,1410 +1,1875 @@
-"""Обработчики модуля систем счисления и кодировок"""
-
-from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.fsm.context import FSMContext
-from aiogram.filters import StateFilter
-
-from handlers.states import SystemsConversionStates, NumberCodingStates, SoundCodingStates, QRStates, BarcodeStates
-from utils.state_manager import update_user_state, is_session_expired
-from utils.validators import validate_binary, validate_number, validate_float, validate_digits
-from utils.formatters import format_number_code_result, format_audio_result, format_qr_numeric_result, format_ean13_result
-from calculators.systems_converter import convert_base
-from calculators.koi8_encoder import koi8_encode, koi8_decode, block_parity_encode
-from calculators.number_converter import reverse_code, additional_code
-from calculators.sound_calculator import (
-    calculate_audio_size, calculate_frequency, calculate_depth,
-    calculate_duration, calculate_channels
-)
-from calculators.qr_encoder import numeric_qr_encode, numeric_qr_encode_with_mask
-from calculators.barcode_calculator import ean13_checksum
-from config import ERROR_MESSAGES
-
-router = Router()
-
-
-@router.callback_query(F.data == "systems_conversion")
-async def handle_systems_conversion(callback: CallbackQuery):
-    """Обработчик выбора раздела 'Системы счисления'"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Перевод систем счисления", callback_data="base_conversion")],
-        [InlineKeyboardButton(text="🔄 Обратный код", callback_data="number_reverse")],
-        [InlineKeyboardButton(text="➕ Дополнительный код", callback_data="number_additional")],
-        [InlineKeyboardButton(text="🔊 Кодирование звука", callback_data="sound_coding")],
-        [InlineKeyboardButton(text="🔲 QR-кодирование", callback_data="qr_coding")],
-        [InlineKeyboardButton(text="🔤 Кодировка КОИ-8", callback_data="koi8_coding")],
-        [InlineKeyboardButton(text="📊 Штрих-кодирование", callback_data="barcode")],
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="back"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    message = """
-🔄 **СИСТЕМЫ СЧИСЛЕНИЯ И КОДИРОВКА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Выберите операцию:
-"""
-    
-    await callback.message.edit_text(
-        text=message,
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data.in_(["number_reverse", "number_additional"]))
-async def handle_integer_code(callback: CallbackQuery, state: FSMContext):
-    """Обработчик для обратного и дополнительного кода"""
-    user_id = callback.from_user.id
-    method_map = {
-        "number_reverse": "reverse",
-        "number_additional": "additional"
-    }
-    method = method_map[callback.data]
-    update_user_state(user_id, current_method=method)
-    await state.update_data(method=method)
-    await state.set_state(NumberCodingStates.number)
-    
-    method_names = {
-        "reverse": "Обратный код",
-        "additional": "Дополнительный код"
-    }
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        f"""🔢 **{method_names[method].upper()}**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Введите число для кодирования.
-
-💡 **Примеры:**
-• `10` - положительное число
-• `-5` - отрицательное число
-• `127` - большое число
-
-Введите число:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.message(StateFilter(NumberCodingStates.number))
-async def get_number_for_coding(message: Message, state: FSMContext):
-    """Получение числа и выполнение кодирования"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    data = await state.get_data()
-    method = data.get("method")
-    
-    # Проверяем, что это кодирование чисел, а не другие операции
-    if method not in ["reverse", "additional"]:
-        return
-    
-    is_valid, msg = validate_number(message.text)
-    if not is_valid:
-        error_msg = f"""
-❌ **Ошибка ввода: Целое число**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`10` или `-5`
-
-Пожалуйста, введите целое число:
-"""
-        await message.answer(error_msg)
-        return
-    
-    number = int(message.text)
-    bits = 8  # По умолчанию 8 бит
-    
-    if method == "reverse":
-        code = reverse_code(number, bits)
-        code_type = "reverse"
-    elif method == "additional":
-        code = additional_code(number, bits)
-        code_type = "additional"
-    else:
-        await message.answer(ERROR_MESSAGES["invalid_choice"])
-        await state.clear()
-        return
-    
-    formatted = format_number_code_result(number, code, code_type)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=formatted,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-@router.callback_query(F.data == "base_conversion")
-async def handle_base_conversion(callback: CallbackQuery, state: FSMContext):
-    """Обработчик перевода систем счисления"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="base_conversion")
-    await state.set_state(SystemsConversionStates.number)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """🔄 **ПЕРЕВОД СИСТЕМ СЧИСЛЕНИЯ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**Шаг 1 из 3:** Введите число
-
-Введите число в исходной системе счисления.
-
-💡 **Примеры:**
-• `1010` - двоичное число
-• `FF` - шестнадцатеричное
-• `123` - десятичное
-
-Введите число:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "koi8_coding")
-async def handle_koi8_coding(callback: CallbackQuery):
-    """Обработчик выбора раздела 'Кодировка КОИ-8'"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔤 Кодировка КОИ-8 (текст → двоичный)", callback_data="koi8_encode")],
-        [InlineKeyboardButton(text="📝 Декодировка КОИ-8 (двоичный → текст)", callback_data="koi8_decode")],
-        [InlineKeyboardButton(text="📦 Блочное кодирование с контролем четности", callback_data="block_parity")],
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    message = """
-🔤 **КОДИРОВКА КОИ-8**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Выберите операцию:
-"""
-    
-    await callback.message.edit_text(
-        text=message,
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "koi8_encode")
-async def handle_koi8_encode(callback: CallbackQuery, state: FSMContext):
-    """Обработчик кодирования КОИ-8"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="koi8_encode")
-    await state.set_state(SystemsConversionStates.text)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """🔤 **КОДИРОВАНИЕ КОИ-8**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Введите текст для кодирования в КОИ-8.
-
-💡 **Примеры:**
-• `Привет` - русский текст
-• `АБВ` - русские буквы
-• `Hello` - латинский текст (также поддерживается)
-
-Введите текст:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "koi8_decode")
-async def handle_koi8_decode(callback: CallbackQuery, state: FSMContext):
-    """Обработчик декодирования КОИ-8"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="koi8_decode")
-    await state.set_state(SystemsConversionStates.binary)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """📝 **ДЕКОДИРОВАНИЕ КОИ-8**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Введите двоичную последовательность для декодирования.
-
-💡 **Важно:** Длина должна быть кратна 8 (каждый символ = 8 бит)
-
-💡 **Примеры:**
-• `1100000111000010` - 16 бит (2 символа)
-• `11000001` - 8 бит (1 символ)
-• `110000011100001011000011` - 24 бита (3 символа)
-
-Введите последовательность:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "block_parity")
-async def handle_block_parity(callback: CallbackQuery, state: FSMContext):
-    """Обработчик блочного кодирования"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="block_parity")
-    await state.set_state(SystemsConversionStates.binary)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """📦 **БЛОЧНОЕ КОДИРОВАНИЕ С КОНТРОЛЕМ ЧЕТНОСТИ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**Шаг 1 из 2:** Введите двоичную последовательность
-
-Введите двоичную последовательность для разбиения на блоки.
-
-💡 **Примеры:**
-• `10101100` - 8 бит
-• `110011001100` - 12 бит
-• `1010` - 4 бита
-
-Введите последовательность:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.message(StateFilter(SystemsConversionStates.number))
-async def get_number_for_conversion(message: Message, state: FSMContext):
-    """Получение числа для преобразования"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    number = message.text.strip()
-    await state.update_data(number=number)
-    await state.set_state(SystemsConversionStates.from_base)
-    
-    await message.answer(
-        "Введите исходную систему счисления (2-36):"
-    )
-
-
-@router.message(StateFilter(SystemsConversionStates.from_base))
-async def get_from_base(message: Message, state: FSMContext):
-    """Получение исходной системы счисления"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    is_valid, msg = validate_number(message.text, min_val=2, max_val=36)
-    if not is_valid:
-        error_msg = f"""
-❌ **Ошибка ввода: Исходная система счисления**
-
-{msg}
-
-💡 **Допустимый диапазон:** 2-36
-
-💡 **Примеры:**
-• `2` - двоичная
-• `8` - восьмеричная
-• `16` - шестнадцатеричная
-• `10` - десятичная
-
-Пожалуйста, введите систему счисления (2-36):
-"""
-        await message.answer(error_msg)
-        return
-    
-    from_base = int(message.text)
-    await state.update_data(from_base=from_base)
-    await state.set_state(SystemsConversionStates.to_base)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        f"""**Шаг 2 из 3:** Целевая система счисления
-
-Введите целевую систему счисления (куда преобразовать).
-
-💡 **Допустимый диапазон:** 2-36
-
-💡 **Примеры:**
-• `2` - в двоичную
-• `8` - в восьмеричную
-• `16` - в шестнадцатеричную
-• `10` - в десятичную
-
-Введите систему счисления:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.message(StateFilter(SystemsConversionStates.to_base))
-async def get_to_base(message: Message, state: FSMContext):
-    """Получение целевой системы счисления и выполнение преобразования"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    is_valid, msg = validate_number(message.text, min_val=2, max_val=36)
-    if not is_valid:
-        error_msg = f"""
-❌ **Ошибка ввода: Целевая система счисления**
-
-{msg}
-
-💡 **Допустимый диапазон:** 2-36
-
-💡 **Примеры:**
-• `2` - двоичная
-• `8` - восьмеричная
-• `16` - шестнадцатеричная
-• `10` - десятичная
-
-Пожалуйста, введите систему счисления (2-36):
-"""
-        await message.answer(error_msg)
-        return
-    
-    to_base = int(message.text)
-    data = await state.get_data()
-    number = data.get("number")
-    from_base = data.get("from_base")
-    
-    try:
-        result, steps = convert_base(number, from_base, to_base)
-        steps_text = "\n".join(steps)
-        
-        formatted_result = f"""
-🔄 **ПЕРЕВОД СИСТЕМ СЧИСЛЕНИЯ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходное число:** {number} ({from_base}-я система)
-
-{steps_text}
-
-**Результат:** `{result}` ({to_base}-я система)
-"""
-        
-    except Exception as e:
-        await message.answer(f"❌ Ошибка при преобразовании: {str(e)}")
-        await state.clear()
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="base_conversion")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=formatted_result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-@router.message(StateFilter(SystemsConversionStates.text))
-async def get_text_for_koi8(message: Message, state: FSMContext):
-    """Получение текста для кодирования КОИ-8"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    text = message.text
-    encoded_binary, steps = koi8_encode(text)
-    
-    steps_text = "\n".join([f"• {step}" for step in steps])
-    
-    result = f"""
-🔤 **КОДИРОВАНИЕ КОИ-8**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходный текст:** {text}
-
-**Шаги кодирования:**
-{steps_text}
-
-**Результат:** `{encoded_binary}`
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="koi8_coding")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-@router.message(StateFilter(SystemsConversionStates.binary))
-async def get_binary_for_operations(message: Message, state: FSMContext):
-    """Получение двоичной последовательности для различных операций"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    # Определить метод из состояния пользователя
-    from utils.state_manager import get_user_state
-    user_state = get_user_state(user_id)
-    method = user_state.get("current_method")
-    
-    is_valid, msg = validate_binary(message.text)
-    if not is_valid:
-        await message.answer(f"❌ {msg}\n\nВведите двоичную последовательность:")
-        return
-    
-    binary_string = message.text
-    
-    if method == "koi8_decode":
-        if len(binary_string) % 8 != 0:
-            await message.answer(
-                "❌ Длина двоичной последовательности должна быть кратна 8.\n"
-                "Введите двоичную последовательность:"
-            )
-            return
-        
-        decoded_text, steps = koi8_decode(binary_string)
-        
-        steps_text = "\n".join([f"• {step}" for step in steps])
-        
-        result = f"""
-📝 **ДЕКОДИРОВАНИЕ КОИ-8**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходная последовательность:** `{binary_string}`
-
-**Шаги декодирования:**
-{steps_text}
-
-**Результат:** {decoded_text}
-"""
-        
-        keyboard = [
-            [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="koi8_decode")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        await message.answer(
-            text=result,
-            reply_markup=reply_markup
-        )
-        
-        await state.clear()
-        
-    elif method == "block_parity":
-        await state.update_data(binary=binary_string)
-        await state.set_state(SystemsConversionStates.block_size)
-        keyboard = [
-            [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        await message.answer(
-            """**Шаг 2 из 2:** Размер блока
-
-Введите размер блока для разбиения последовательности.
-
-💡 **Примеры:**
-• `8` - стандартный размер (1 байт)
-• `4` - для 4-битных блоков
-• `16` - для 16-битных блоков
-
-💡 **По умолчанию:** 8 (можно оставить пустым)
-
-Введите размер блока:""",
-            reply_markup=reply_markup
-        )
-
-
-@router.message(StateFilter(SystemsConversionStates.block_size))
-async def get_block_size(message: Message, state: FSMContext):
-    """Получение размера блока и выполнение блочного кодирования"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    if message.text.strip() == "":
-        block_size = 8
-    else:
-        is_valid, msg = validate_number(message.text, min_val=1)
-        if not is_valid:
-            error_msg = f"""
-❌ **Ошибка ввода: Размер блока**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`8` или `4`
-
-Пожалуйста, введите размер блока (целое число, не меньше 1):
-"""
-            await message.answer(error_msg)
-            return
-        block_size = int(message.text)
-    
-    data = await state.get_data()
-    binary_string = data.get("binary")
-    
-    results = block_parity_encode(binary_string, block_size)
-    
-    blocks_text = []
-    for i, (block, ones_count, parity_bit, encoded_block) in enumerate(results, 1):
-        blocks_text.append(
-            f"**Блок {i}:**\n"
-            f"  Исходный: `{block}`\n"
-            f"  Количество единиц: {ones_count}\n"
-            f"  Бит четности: `{parity_bit}`\n"
-            f"  Результат: `{encoded_block}`"
-        )
-    
-    result = f"""
-📦 **БЛОЧНОЕ КОДИРОВАНИЕ С КОНТРОЛЕМ ЧЕТНОСТИ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходная последовательность:** `{binary_string}`
-**Размер блока:** {block_size}
-
-{chr(10).join(blocks_text)}
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="block_parity")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-# ========== КОДИРОВАНИЕ ЗВУКА ==========
-
-@router.callback_query(F.data == "sound_coding")
-async def handle_sound_coding(callback: CallbackQuery, state: FSMContext):
-    """Обработчик выбора раздела 'Кодирование звука'"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="[V] 📁 Объём файла", callback_data="calc_volume")],
-        [InlineKeyboardButton(text="[F] 🔊 Частота дискретизации", callback_data="calc_frequency")],
-        [InlineKeyboardButton(text="[B] 💾 Глубина кодирования", callback_data="calc_depth")],
-        [InlineKeyboardButton(text="[T] ⏱️ Длительность", callback_data="calc_duration")],
-        [InlineKeyboardButton(text="[C] 🎧 Каналы", callback_data="calc_channels")],
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    message = """
-🔊 **КОДИРОВАНИЕ ЗВУКА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**📐 ОСНОВНАЯ ФОРМУЛА:**
-
-`V = F * (B/8) * T * C`
-
-Где:
-• V - объём (байты)
-• F - частота дискретизации (Гц)
-• B - глубина кодирования (биты)
-• T - время (секунды)
-• C - количество каналов (1-моно, 2-стерео)
-
-**🔊 ЧТО ВЫЧИСЛЯЕМ?**
-
-Выберите параметр для вычисления:
-"""
-    
-    await callback.message.edit_text(
-        text=message,
-        reply_markup=reply_markup
-    )
-
-
-# Обработчики выбора параметра для вычисления
-@router.callback_query(F.data.startswith("calc_"))
-async def handle_calc_param(callback: CallbackQuery, state: FSMContext):
-    """Обработчик выбора параметра для вычисления"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    param_map = {
-        "calc_volume": ("volume", "📁 Объём файла (V)", "V = F * (B/8) * T * C"),
-        "calc_frequency": ("frequency", "🔊 Частота дискретизации (F)", "F = V / [(B/8) * T * C]"),
-        "calc_depth": ("depth", "💾 Глубина кодирования (B)", "B = (V * 8) / (F * T * C)"),
-        "calc_duration": ("duration", "⏱️ Длительность (T)", "T = V / [F * (B/8) * C]"),
-        "calc_channels": ("channels", "🎧 Каналы (C)", "C = V / [F * (B/8) * T]")
-    }
-    
-    param_key, param_name, formula = param_map[callback.data]
-    update_user_state(user_id, current_method=param_key)
-    
-    # Инициализация параметров
-    await state.update_data(
-        target_param=param_key,
-        formula=formula,
-        volume=None,
-        frequency=None,
-        depth=None,
-        duration=None,
-        channels=None
-    )
-    
-    # Определить порядок ввода параметров
-    param_order = []
-    if param_key != "volume":
-        param_order.append(("volume", "📁 Объём (V)", "байты", SoundCodingStates.input_volume))
-    if param_key != "frequency":
-        param_order.append(("frequency", "🔊 Частота (F)", "Гц", SoundCodingStates.input_frequency))
-    if param_key != "depth":
-        param_order.append(("depth", "💾 Глубина (B)", "биты", SoundCodingStates.input_depth))
-    if param_key != "duration":
-        param_order.append(("duration", "⏱️ Длительность (T)", "секунды", SoundCodingStates.input_duration))
-    if param_key != "channels":
-        param_order.append(("channels", "🎧 Каналы (C)", "1 или 2", SoundCodingStates.input_channels))
-    
-    await state.update_data(param_order=param_order, current_param_idx=0)
-    
-    # Начать ввод первого параметра
-    if param_order:
-        first_param = param_order[0]
-        await state.set_state(first_param[3])
-        
-        keyboard = [
-            [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_coding"),
-             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        message = f"""
-🔊 **ВЫЧИСЛЯЕМ: {param_name.upper()}**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**Формула:** `{formula}`
-
-**Шаг 1 из {len(param_order)}:** {first_param[1]}
-
-Введите значение {first_param[1]} ({first_param[2]}).
-
-💡 Введите положительное число (не 0)
-
-Введите значение:
-"""
-        
-        await callback.message.edit_text(
-            text=message,
-            reply_markup=reply_markup
-        )
-
-
-# Универсальный обработчик для ввода параметров звука
-async def handle_audio_param_input(message: Message, state: FSMContext, param_key: str, param_name: str, param_unit: str):
-    """Универсальный обработчик ввода параметра звука"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    # Валидация ввода
-    try:
-        value = float(message.text.strip())
-        if value < 0:
-            await message.answer(f"❌ Ошибка: значение не может быть отрицательным. Введите положительное число:")
-            return
-        if value == 0:
-            await message.answer(f"❌ Ошибка: значение не может быть равно 0. Пожалуйста, введите положительное число:")
-            return
-    except ValueError:
-        await message.answer(f"❌ Ошибка: введите число:")
-        return
-    
-    # Сохранить значение параметра (включая 0)
-    data = await state.get_data()
-    await state.update_data(**{param_key: value})
-    
-    # Получить порядок параметров
-    param_order = data.get("param_order", [])
-    current_idx = data.get("current_param_idx", 0)
-    
-    # Перейти к следующему параметру
-    current_idx += 1
-    
-    if current_idx < len(param_order):
-        # Есть еще параметры для ввода
-        next_param = param_order[current_idx]
-        await state.update_data(current_param_idx=current_idx)
-        await state.set_state(next_param[3])
-        
-        keyboard = [
-            [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_coding"),
-             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        await message.answer(
-            f"✅ {param_name}: {value}\n\n"
-            f"**Шаг {current_idx + 1} из {len(param_order)}:** {next_param[1]}\n\n"
-            f"Введите значение {next_param[1]} ({next_param[2]}).\n\n"
-            f"💡 Введите положительное число (не 0)",
-            reply_markup=reply_markup
-        )
-    else:
-        # Все параметры введены, выполнить расчет
-        await message.answer(f"✅ {param_name}: {value}\n\nВыполняю расчет...")
-        await calculate_audio_result(message, state)
-
-
-@router.message(StateFilter(SoundCodingStates.input_volume))
-async def get_input_volume(message: Message, state: FSMContext):
-    """Ввод объёма"""
-    await handle_audio_param_input(message, state, "volume", "📁 Объём (V)", "байты")
-
-
-@router.message(StateFilter(SoundCodingStates.input_frequency))
-async def get_input_frequency(message: Message, state: FSMContext):
-    """Ввод частоты"""
-    await handle_audio_param_input(message, state, "frequency", "🔊 Частота (F)", "Гц")
-
-
-@router.message(StateFilter(SoundCodingStates.input_depth))
-async def get_input_depth(message: Message, state: FSMContext):
-    """Ввод глубины"""
-    await handle_audio_param_input(message, state, "depth", "💾 Глубина (B)", "биты")
-
-
-@router.message(StateFilter(SoundCodingStates.input_duration))
-async def get_input_duration(message: Message, state: FSMContext):
-    """Ввод длительности"""
-    await handle_audio_param_input(message, state, "duration", "⏱️ Длительность (T)", "секунды")
-
-
-@router.message(StateFilter(SoundCodingStates.input_channels))
-async def get_input_channels(message: Message, state: FSMContext):
-    """Ввод каналов"""
-    await handle_audio_param_input(message, state, "channels", "🎧 Каналы (C)", "1 или 2")
-
-
-async def calculate_audio_result(message: Message, state: FSMContext):
-    """Выполнение расчета после ввода всех параметров"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    data = await state.get_data()
-    target_param = data.get("target_param")
-    
-    # Получить все параметры
-    params = {
-        'volume': data.get('volume'),
-        'frequency': data.get('frequency'),
-        'depth': data.get('depth'),
-        'duration': data.get('duration'),
-        'channels': data.get('channels')
-    }
-    
-    # Проверить, что все необходимые параметры введены
-    required = {'volume', 'frequency', 'depth', 'duration', 'channels'} - {target_param}
-    missing = [k for k in required if params[k] is None]
-    
-    if missing:
-        missing_names = {
-            'volume': 'V (объём)',
-            'frequency': 'F (частота)',
-            'depth': 'B (глубина)',
-            'duration': 'T (длительность)',
-            'channels': 'C (каналы)'
-        }
-        missing_list = ', '.join([missing_names[m] for m in missing])
-        await message.answer(
-            f"❌ **Не хватает параметров:** {missing_list}\n\n"
-            f"Пожалуйста, введите все необходимые параметры."
-        )
-        return
-    
-    # Выполнение расчета
-    try:
-        if target_param == "volume":
-            result_value = calculate_audio_size(
-                params['frequency'], params['depth'],
-                params['duration'], params['channels']
-            )
-            total_bytes, kb, mb = result_value
-            result_text = f"""
-📁 **РАСЧЕТ ОБЪЁМА ФАЙЛА**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Входные данные:**
-• Частота: {params['frequency']} Гц
-• Глубина: {params['depth']} бит
-• Длительность: {params['duration']} сек
-• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
-
-**Расчет:**
-V = {params['frequency']} * ({params['depth']}/8) * {params['duration']} * {params['channels']}
-V = {params['frequency']} * {params['depth']/8} * {params['duration']} * {params['channels']}
-V = {total_bytes} байт
-
-**Результат:**
-• {total_bytes} байт
-• {kb:.2f} КБ
-• {mb:.2f} МБ
-"""
-        elif target_param == "frequency":
-            result_value = calculate_frequency(
-                params['volume'], params['depth'],
-                params['duration'], params['channels']
-            )
-            result_text = f"""
-🔊 **РАСЧЕТ ЧАСТОТЫ ДИСКРЕТИЗАЦИИ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Входные данные:**
-• Объём: {params['volume']} байт
-• Глубина: {params['depth']} бит
-• Длительность: {params['duration']} сек
-• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
-
-**Расчет:**
-F = {params['volume']} / [({params['depth']}/8) * {params['duration']} * {params['channels']}]
-F = {params['volume']} / [{params['depth']/8} * {params['duration']} * {params['channels']}]
-F = {result_value:.2f} Гц
-
-**Результат:** {result_value:.2f} Гц
-"""
-        elif target_param == "depth":
-            result_value = calculate_depth(
-                params['volume'], params['frequency'],
-                params['duration'], params['channels']
-            )
-            result_text = f"""
-💾 **РАСЧЕТ ГЛУБИНЫ КОДИРОВАНИЯ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Входные данные:**
-• Объём: {params['volume']} байт
-• Частота: {params['frequency']} Гц
-• Длительность: {params['duration']} сек
-• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
-
-**Расчет:**
-B = ({params['volume']} * 8) / ({params['frequency']} * {params['duration']} * {params['channels']})
-B = {params['volume']*8} / ({params['frequency']} * {params['duration']} * {params['channels']})
-B = {result_value:.2f} бит
-
-**Результат:** {result_value:.2f} бит
-"""
-        elif target_param == "duration":
-            result_value = calculate_duration(
-                params['volume'], params['frequency'],
-                params['depth'], params['channels']
-            )
-            result_text = f"""
-⏱️ **РАСЧЕТ ДЛИТЕЛЬНОСТИ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Входные данные:**
-• Объём: {params['volume']} байт
-• Частота: {params['frequency']} Гц
-• Глубина: {params['depth']} бит
-• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
-
-**Расчет:**
-T = {params['volume']} / [{params['frequency']} * ({params['depth']}/8) * {params['channels']}]
-T = {params['volume']} / [{params['frequency']} * {params['depth']/8} * {params['channels']}]
-T = {result_value:.2f} сек
-
-**Результат:** {result_value:.2f} сек ({result_value/60:.2f} мин)
-"""
-        elif target_param == "channels":
-            result_value = calculate_channels(
-                params['volume'], params['frequency'],
-                params['depth'], params['duration']
-            )
-            result_text = f"""
-🎧 **РАСЧЕТ КОЛИЧЕСТВА КАНАЛОВ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Входные данные:**
-• Объём: {params['volume']} байт
-• Частота: {params['frequency']} Гц
-• Глубина: {params['depth']} бит
-• Длительность: {params['duration']} сек
-
-**Расчет:**
-C = {params['volume']} / [{params['frequency']} * ({params['depth']}/8) * {params['duration']}]
-C = {params['volume']} / [{params['frequency']} * {params['depth']/8} * {params['duration']}]
-C = {result_value:.2f}
-
-**Результат:** {result_value:.2f} ({'стерео' if abs(result_value - 2) < 0.1 else 'моно' if abs(result_value - 1) < 0.1 else 'нестандартное значение'})
-"""
-        else:
-            await message.answer(ERROR_MESSAGES["invalid_choice"])
-            await state.clear()
-            return
-        
-        keyboard = [
-            [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="sound_coding")],
-            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        await message.answer(
-            text=result_text,
-            reply_markup=reply_markup
-        )
-        
-        await state.clear()
-        
-    except ZeroDivisionError:
-        await message.answer("❌ Ошибка: деление на ноль. Проверьте введенные значения.")
-        await state.clear()
-    except Exception as e:
-        await message.answer(f"❌ Ошибка при расчете: {str(e)}")
-        await state.clear()
-
-
-# ========== QR-КОДИРОВАНИЕ ==========
-
-@router.callback_query(F.data == "qr_coding")
-async def handle_qr_coding(callback: CallbackQuery):
-    """Обработчик выбора раздела 'QR-кодирование'"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔢 Цифровое кодирование", callback_data="qr_numeric")],
-        [InlineKeyboardButton(text="🎭 Цифровое с маской", callback_data="qr_numeric_mask")],
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    message = """
-🔲 **QR-КОДИРОВАНИЕ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Выберите тип кодирования:
-"""
-    
-    await callback.message.edit_text(
-        text=message,
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "qr_numeric")
-async def handle_qr_numeric(callback: CallbackQuery, state: FSMContext):
-    """Обработчик цифрового QR-кодирования"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="qr_numeric")
-    await state.update_data(method="qr_numeric")
-    await state.set_state(QRStates.input)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """🔢 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Введите цифры для кодирования.
-
-💡 **Примеры:**
-• `123456789` - длинное число
-• `42` - короткое число
-• `100` - три цифры
-
-Введите значение:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.callback_query(F.data == "qr_numeric_mask")
-async def handle_qr_numeric_mask(callback: CallbackQuery, state: FSMContext):
-    """Обработчик цифрового QR-кодирования с маской"""
-    user_id = callback.from_user.id
-    update_user_state(user_id, current_method="qr_numeric_mask")
-    await state.update_data(method="qr_numeric_mask")
-    await state.set_state(QRStates.input)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await callback.message.edit_text(
-        """🎭 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ С МАСКОЙ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-**Шаг 1 из 2:** Введите число для кодирования
-
-💡 **Примеры:**
-• `123456789`
-• `42`
-• `100`
-
-Введите число:""",
-        reply_markup=reply_markup
-    )
-
-
-@router.message(StateFilter(QRStates.input))
-async def get_qr_input(message: Message, state: FSMContext):
-    """Получение входных данных и выполнение QR-кодирования"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    data = await state.get_data()
-    method = data.get("method")
-    input_text = message.text
-    
-    if method == "qr_numeric":
-        is_valid, msg = validate_digits(input_text)
-        if not is_valid:
-            error_msg = f"""
-❌ **Ошибка ввода: Цифры**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`123456789` или `42`
-
-Пожалуйста, введите только цифры:
-"""
-            await message.answer(error_msg)
-            return
-        
-        encoded_bits, steps = numeric_qr_encode(input_text)
-        result = format_qr_numeric_result(input_text, encoded_bits, steps)
-        
-    elif method == "qr_numeric_mask":
-        is_valid, msg = validate_digits(input_text)
-        if not is_valid:
-            error_msg = f"""
-❌ **Ошибка ввода: Число**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`123456789` или `42`
-
-Пожалуйста, введите число:
-"""
-            await message.answer(error_msg)
-            return
-        
-        # Сохранить число и запросить маску
-        await state.update_data(digits=input_text)
-        await state.set_state(QRStates.mask)
-        
-        keyboard = [
-            [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
-             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-        
-        await message.answer(
-            """**Шаг 2 из 2:** Введите маску
-
-Введите двоичную последовательность (маску) для наложения.
-
-💡 **Примеры:**
-• `1010` - простая маска
-• `11110000` - маска из 8 бит
-• `1` - единичная маска
-
-Введите маску:""",
-            reply_markup=reply_markup
-        )
-        return
-        
-    else:
-        await message.answer(ERROR_MESSAGES["invalid_choice"])
-        await state.clear()
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-@router.message(StateFilter(QRStates.mask))
-async def get_qr_mask(message: Message, state: FSMContext):
-    """Получение маски и выполнение QR-кодирования с маской"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    is_valid, msg = validate_binary(message.text)
-    if not is_valid:
-        error_msg = f"""
-❌ **Ошибка ввода: Маска**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`1010` или `11110000`
-
-Пожалуйста, введите двоичную последовательность (только 0 и 1):
-"""
-        await message.answer(error_msg)
-        return
-    
-    mask = message.text
-    data = await state.get_data()
-    digits = data.get("digits")
-    
-    # Выполнить кодирование с маской
-    encoded_bits, masked_bits, steps = numeric_qr_encode_with_mask(digits, mask)
-    
-    steps_text = "\n".join(steps)
-    
-    result = f"""
-🎭 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ С МАСКОЙ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-**Исходные данные:**
-• Число: {digits}
-• Маска: `{mask}`
-
-{steps_text}
-
-**Итоговый результат:**
-• Двоичный: `{masked_bits}`
-• Десятичный: `{int(masked_bits, 2)}`
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
-
-
-# ========== ШТРИХ-КОДИРОВАНИЕ ==========
-
-@router.callback_query(F.data == "barcode")
-async def handle_barcode(callback: CallbackQuery, state: FSMContext):
-    """Обработчик выбора раздела 'Штрих-кодирование'"""
-    user_id = callback.from_user.id
-    
-    if is_session_expired(user_id):
-        await callback.answer(ERROR_MESSAGES["timeout"], show_alert=True)
-        return
-    
-    update_user_state(user_id, current_method="ean13")
-    await state.set_state(BarcodeStates.digits)
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
-         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    message = """
-📊 **ШТРИХ-КОДИРОВАНИЕ**
-
-⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
-
-Введите первые 12 цифр для расчета EAN-13 (например, 460123456789):
-"""
-    
-    await callback.message.edit_text(
-        text=message,
-        reply_markup=reply_markup
-    )
-
-
-@router.message(StateFilter(BarcodeStates.digits))
-async def get_ean13_digits(message: Message, state: FSMContext):
-    """Получение цифр и расчет EAN-13"""
-    user_id = message.from_user.id
-    
-    if is_session_expired(user_id):
-        await message.answer(ERROR_MESSAGES["timeout"])
-        await state.clear()
-        return
-    
-    is_valid, msg = validate_digits(message.text)
-    if not is_valid:
-        error_msg = f"""
-❌ **Ошибка ввода: Цифры**
-
-{msg}
-
-💡 **Пример корректного ввода:**
-`460123456789` (ровно 12 цифр)
-
-Пожалуйста, введите 12 цифр:
-"""
-        await message.answer(error_msg)
-        return
-    
-    if len(message.text) != 12:
-        error_msg = f"""
-❌ **Ошибка ввода: Длина**
-
-Введено {len(message.text)} цифр, требуется ровно 12.
-
-💡 **Пример корректного ввода:**
-`460123456789` (ровно 12 цифр)
-
-Пожалуйста, введите ровно 12 цифр:
-"""
-        await message.answer(error_msg)
-        return
-    
-    first_12 = message.text
-    
-    try:
-        checksum, even_sum, odd_sum, total = ean13_checksum(first_12)
-        full_code = first_12 + str(checksum)
-        
-        result = format_ean13_result(first_12, even_sum, odd_sum, total, checksum, full_code)
-        
-    except Exception as e:
-        await message.answer(f"❌ Ошибка при расчете: {str(e)}")
-        return
-    
-    keyboard = [
-        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="barcode")],
-        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
-    ]
-    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-    
-    await message.answer(
-        text=result,
-        reply_markup=reply_markup
-    )
-    
-    await state.clear()
+"""Обработчики модуля систем счисления и кодировок"""
+
+from aiogram import Router, F
+from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, BufferedInputFile
+from aiogram.fsm.context import FSMContext
+from aiogram.filters import StateFilter
+
+from handlers.states import SystemsConversionStates, NumberCodingStates, SoundCodingStates, QRStates, BarcodeStates
+from utils.middlewares import SessionContext
+from utils.executor import run_calculation, CalculationTimeout
+from utils.validators import validate_binary, validate_number, validate_float, validate_digits
+from utils.formatters import (
+    format_number_code_result, format_number_codes_batch_result, format_audio_result,
+    format_ieee754_result, format_ieee754_batch_result, format_base_table_result, format_qr_numeric_result,
+    format_qr_full_result, format_ean13_result, format_barcode_batch_result, format_steps,
+    format_block_parity_2d_result, format_block_parity_2d_decode_result, format_audio_sweep_result,
+    printable_text
+)
+from calculators.systems_converter import convert_base, convert_to_bases
+from calculators.koi8_encoder import (
+    koi8_encode, koi8_decode, block_parity_encode, block_parity_2d_encode, block_parity_2d_decode,
+    block_parity_2d_data, blocks_to_bits
+)
+from calculators.number_converter import (
+    encode_batch, code_strings, code_range, minimal_code_bits, parse_code_values,
+    CODE_KINDS, STANDARD_CODE_BITS, MIN_CODE_BITS, MAX_CODE_BITS, CODE_BATCH_MAX,
+    ieee754_encode, ieee754_batch, ieee754_bits_text, parse_float_values, IEEE754_FORMATS
+)
+from calculators.sound_calculator import (
+    calculate_audio_size, calculate_frequency, calculate_depth,
+    calculate_duration, calculate_channels, audio_sweep, parse_sweep_spec, sweep_to_csv, SOUND_PARAMETERS
+)
+from calculators.qr_encoder import (
+    numeric_qr_encode, numeric_qr_encode_with_mask, qr_encode, qr_best_mask, QR_LEVELS
+)
+from calculators.barcode_calculator import (
+    ean13_checksum, check_barcode_batch, barcode_batch_summary, BARCODE_SYMBOLOGIES
+)
+from config import ERROR_MESSAGES, BASE_FRACTION_PRECISION
+
+router = Router()
+
+
+@router.callback_query(F.data == "systems_conversion")
+async def handle_systems_conversion(callback: CallbackQuery):
+    """Обработчик выбора раздела 'Системы счисления'"""
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Перевод систем счисления", callback_data="base_conversion")],
+        [InlineKeyboardButton(text="➡️ Прямой код", callback_data="number_direct")],
+        [InlineKeyboardButton(text="🔄 Обратный код", callback_data="number_reverse")],
+        [InlineKeyboardButton(text="➕ Дополнительный код", callback_data="number_additional")],
+        [InlineKeyboardButton(text="🧮 Вещественные числа IEEE 754", callback_data="ieee754")],
+        [InlineKeyboardButton(text="🔊 Кодирование звука", callback_data="sound_coding")],
+        [InlineKeyboardButton(text="🔲 QR-кодирование", callback_data="qr_coding")],
+        [InlineKeyboardButton(text="🔤 Кодировка КОИ-8", callback_data="koi8_coding")],
+        [InlineKeyboardButton(text="📊 Штрих-кодирование", callback_data="barcode")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="back"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+🔄 **СИСТЕМЫ СЧИСЛЕНИЯ И КОДИРОВКА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите операцию:
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.in_(["number_direct", "number_reverse", "number_additional"]))
+async def handle_integer_code(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик для прямого, обратного и дополнительного кода"""
+    method_map = {
+        "number_direct": "direct",
+        "number_reverse": "reverse",
+        "number_additional": "additional"
+    }
+    method = method_map[callback.data]
+    session.user.current_method = method
+    await state.update_data(method=method)
+    await state.set_state(NumberCodingStates.number)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        f"""🔢 **{CODE_KINDS[method].upper()}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите число, несколько чисел или диапазон.
+
+💡 **Примеры:**
+• `10` - положительное число
+• `-5` - отрицательное число
+• `-200, 5, 127` - несколько чисел
+• `-8..7` - диапазон (до {CODE_BATCH_MAX} чисел)
+
+Введите число:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(NumberCodingStates.number))
+async def get_number_for_coding(message: Message, state: FSMContext):
+    """Получение чисел и выбор разрядности"""
+    data = await state.get_data()
+    method = data.get("method")
+    
+    # Проверяем, что это кодирование чисел, а не другие операции
+    if method not in CODE_KINDS:
+        return
+    
+    try:
+        values = parse_code_values(message.text or "")
+    except ValueError as e:
+        error_msg = f"""
+❌ **Ошибка ввода: Целые числа**
+
+{e}
+
+💡 **Пример корректного ввода:**
+`10`, `-5, 7, 12` или `-8..7`
+
+Пожалуйста, введите целые числа:
+"""
+        await message.answer(error_msg)
+        return
+    
+    await state.update_data(values_text=message.text)
+    await state.set_state(NumberCodingStates.bits)
+    
+    auto_bits = minimal_code_bits(min(values), max(values), method)
+    keyboard = [
+        [InlineKeyboardButton(text=f"{bits} бит", callback_data=f"code_bits_{bits}")
+         for bits in STANDARD_CODE_BITS],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    if auto_bits:
+        keyboard.insert(0, [InlineKeyboardButton(text=f"⚙️ Авто ({auto_bits} бит)",
+                                                 callback_data=f"code_bits_{auto_bits}")])
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        f"""🔢 **РАЗРЯДНОСТЬ КОДА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите разрядность или введите число от {MIN_CODE_BITS} до {MAX_CODE_BITS}.
+Числа, не помещающиеся в выбранную разрядность, будут отмечены как переполнение.""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.startswith("code_bits_"))
+async def handle_code_bits(callback: CallbackQuery, state: FSMContext):
+    """Выбор разрядности кнопкой"""
+    bits = callback.data.replace("code_bits_", "")
+    if not bits.isdigit() or await state.get_state() != NumberCodingStates.bits.state:
+        await callback.answer(ERROR_MESSAGES["invalid_choice"], show_alert=True)
+        return
+    
+    await callback.answer()
+    await calculate_number_codes(callback.message, state, int(bits))
+
+
+@router.message(StateFilter(NumberCodingStates.bits))
+async def get_code_bits(message: Message, state: FSMContext):
+    """Ввод разрядности вручную"""
+    text = (message.text or "").strip()
+    if text.isdigit():
+        is_valid, msg = validate_number(text, MIN_CODE_BITS, MAX_CODE_BITS)
+    else:
+        is_valid, msg = False, "Разрядность должна быть целым числом"
+    if not is_valid:
+        await message.answer(f"❌ {msg}\n\nВведите разрядность от {MIN_CODE_BITS} до {MAX_CODE_BITS}:")
+        return
+    
+    await calculate_number_codes(message, state, int(text))
+
+
+async def calculate_number_codes(message: Message, state: FSMContext, bits: int):
+    """Кодирование введенных чисел с выбранной разрядностью"""
+    data = await state.get_data()
+    method = data.get("method")
+    if method not in CODE_KINDS or not data.get("values_text"):
+        await message.answer(ERROR_MESSAGES["invalid_choice"])
+        await state.clear()
+        return
+    
+    values = parse_code_values(data["values_text"])
+    codes, overflow = await run_calculation(encode_batch, values, bits, method)
+    
+    if len(values) == 1:
+        formatted = format_number_code_result(
+            values[0], code_strings(codes, bits, overflow)[0], method, bits, code_range(bits, method)
+        )
+    else:
+        limit = 20
+        formatted = format_number_codes_batch_result(
+            method, bits, code_range(bits, method), values[:limit],
+            code_strings(codes[:limit], bits, overflow[:limit]), overflow, limit
+        )
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=formatted,
+        reply_markup=reply_markup
+    )
+    
+    if len(values) > 20:
+        rows = (f"{value};{code}\n" for value, code in zip(values, code_strings(codes, bits, overflow)))
+        await message.answer_document(
+            BufferedInputFile(("value;code\n" + ''.join(rows)).encode("utf-8"),
+                              filename=f"{method}_{bits}.csv")
+        )
+    
+    await state.clear()
+
+
+@router.callback_query(F.data == "ieee754")
+async def handle_ieee754(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик выбора формата IEEE 754"""
+    
+    session.user.current_method = "ieee754"
+    
+    keyboard = [
+        [InlineKeyboardButton(text=fmt, callback_data=f"ieee754_{fmt}") for fmt in IEEE754_FORMATS],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """🧮 **ВЕЩЕСТВЕННЫЕ ЧИСЛА IEEE 754**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+• **float16** - 1 + 5 + 10 бит
+• **float32** - 1 + 8 + 23 бит
+• **float64** - 1 + 11 + 52 бит
+
+Выберите формат:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.startswith("ieee754_"))
+async def handle_ieee754_format(callback: CallbackQuery, state: FSMContext):
+    """Выбор формата IEEE 754"""
+    fmt = callback.data.replace("ieee754_", "")
+    if fmt not in IEEE754_FORMATS:
+        await callback.answer(ERROR_MESSAGES["invalid_choice"], show_alert=True)
+        return
+    
+    await state.update_data(ieee754_format=fmt)
+    await state.set_state(NumberCodingStates.ieee754)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="ieee754"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        f"""🧮 **IEEE 754 ({fmt})**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите число или несколько чисел через пробел.
+
+💡 **Примеры:**
+• `0.1` - одно число с пошаговым решением
+• `-2,5` - десятичная запятая допускается
+• `1 0.5 1e-40 inf` - пакетное кодирование
+
+Введите число:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(NumberCodingStates.ieee754))
+async def get_ieee754_numbers(message: Message, state: FSMContext):
+    """Получение чисел и кодирование в IEEE 754"""
+    data = await state.get_data()
+    fmt = data.get("ieee754_format", "float32")
+    
+    try:
+        values = parse_float_values(message.text or "")
+    except ValueError:
+        await message.answer("""
+❌ **Ошибка ввода: Вещественные числа**
+
+💡 **Пример корректного ввода:**
+`0.1` или `1 -2.5 3e10`
+
+Пожалуйста, введите числа:
+""")
+        return
+    
+    limit = 20
+    if len(values) == 1:
+        sign, exponent, mantissa, stored, steps = ieee754_encode(values[0], fmt)
+        formatted = format_ieee754_result(
+            values[0], fmt, ieee754_bits_text(sign, exponent, mantissa, fmt), stored, steps
+        )
+    else:
+        fields = await run_calculation(ieee754_batch, values, fmt)
+        bits_texts = [ieee754_bits_text(*field, fmt) for field in zip(*(f[:limit] for f in fields))]
+        formatted = format_ieee754_batch_result(fmt, values, bits_texts, len(values), limit)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="ieee754")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=formatted,
+        reply_markup=reply_markup
+    )
+    
+    if len(values) > limit:
+        rows = (f"{value!r};{ieee754_bits_text(*field, fmt)}\n" for value, field in zip(values, zip(*fields)))
+        await message.answer_document(
+            BufferedInputFile(("value;bits\n" + ''.join(rows)).encode("utf-8"), filename=f"ieee754_{fmt}.csv")
+        )
+    
+    await state.clear()
+
+
+@router.callback_query(F.data == "base_conversion")
+async def handle_base_conversion(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик перевода систем счисления"""
+    session.user.current_method = "base_conversion"
+    await state.set_state(SystemsConversionStates.number)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """🔄 **ПЕРЕВОД СИСТЕМ СЧИСЛЕНИЯ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**Шаг 1 из 3:** Введите число
+
+Введите число в исходной системе счисления.
+
+💡 **Примеры:**
+• `1010` - двоичное число
+• `FF` - шестнадцатеричное
+• `123` - десятичное
+• `-1A.F` или `101.011` - со знаком и дробной частью
+
+Введите число:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "koi8_coding")
+async def handle_koi8_coding(callback: CallbackQuery):
+    """Обработчик выбора раздела 'Кодировка КОИ-8'"""
+    keyboard = [
+        [InlineKeyboardButton(text="🔤 Кодировка КОИ-8 (текст → двоичный)", callback_data="koi8_encode")],
+        [InlineKeyboardButton(text="📝 Декодировка КОИ-8 (двоичный → текст)", callback_data="koi8_decode")],
+        [InlineKeyboardButton(text="📦 Блочное кодирование с контролем четности", callback_data="block_parity")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+🔤 **КОДИРОВКА КОИ-8**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите операцию:
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "koi8_encode")
+async def handle_koi8_encode(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик кодирования КОИ-8"""
+    session.user.current_method = "koi8_encode"
+    await state.set_state(SystemsConversionStates.text)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """🔤 **КОДИРОВАНИЕ КОИ-8**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите текст для кодирования в КОИ-8.
+
+💡 **Примеры:**
+• `Привет` - русский текст
+• `АБВ` - русские буквы
+• `Hello` - латинский текст (также поддерживается)
+
+Введите текст:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "koi8_decode")
+async def handle_koi8_decode(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик декодирования КОИ-8"""
+    session.user.current_method = "koi8_decode"
+    await state.set_state(SystemsConversionStates.binary)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """📝 **ДЕКОДИРОВАНИЕ КОИ-8**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите двоичную последовательность для декодирования.
+
+💡 **Важно:** Длина должна быть кратна 8 (каждый символ = 8 бит)
+
+💡 **Примеры:**
+• `1100000111000010` - 16 бит (2 символа)
+• `11000001` - 8 бит (1 символ)
+• `110000011100001011000011` - 24 бита (3 символа)
+
+Введите последовательность:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.in_(["block_parity", "block_parity_2d", "block_parity_2d_decode"]))
+async def handle_block_parity(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик блочного кодирования (одномерного и двумерного)"""
+    method = callback.data
+    session.user.current_method = method
+    await state.set_state(SystemsConversionStates.binary)
+    
+    mode_names = {
+        "block_parity": "бит четности для каждого блока",
+        "block_parity_2d": "двумерный контроль (строки и столбцы)",
+        "block_parity_2d_decode": "проверка и исправление двумерного кода"
+    }
+    
+    keyboard = [
+        [InlineKeyboardButton(text="📦 Одномерный", callback_data="block_parity"),
+         InlineKeyboardButton(text="🔲 Двумерный", callback_data="block_parity_2d")],
+        [InlineKeyboardButton(text="🛠️ Проверка двумерного кода", callback_data="block_parity_2d_decode")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="koi8_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        f"""📦 **БЛОЧНОЕ КОДИРОВАНИЕ С КОНТРОЛЕМ ЧЕТНОСТИ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**Режим:** {mode_names[method]}
+
+**Шаг 1 из 2:** Введите двоичную последовательность
+
+Введите двоичную последовательность для разбиения на блоки.
+
+💡 **Примеры:**
+• `10101100` - 8 бит
+• `110011001100` - 12 бит
+• `1010` - 4 бита
+
+Введите последовательность:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(SystemsConversionStates.number))
+async def get_number_for_conversion(message: Message, state: FSMContext):
+    """Получение числа для преобразования"""
+    number = message.text.strip()
+    await state.update_data(number=number)
+    await state.set_state(SystemsConversionStates.from_base)
+    
+    await message.answer(
+        "Введите исходную систему счисления (2-36):"
+    )
+
+
+@router.message(StateFilter(SystemsConversionStates.from_base))
+async def get_from_base(message: Message, state: FSMContext):
+    """Получение исходной системы счисления"""
+    is_valid, msg = validate_number(message.text, min_val=2, max_val=36)
+    if not is_valid:
+        error_msg = f"""
+❌ **Ошибка ввода: Исходная система счисления**
+
+{msg}
+
+💡 **Допустимый диапазон:** 2-36
+
+💡 **Примеры:**
+• `2` - двоичная
+• `8` - восьмеричная
+• `16` - шестнадцатеричная
+• `10` - десятичная
+
+Пожалуйста, введите систему счисления (2-36):
+"""
+        await message.answer(error_msg)
+        return
+    
+    from_base = int(message.text)
+    await state.update_data(from_base=from_base)
+    await state.set_state(SystemsConversionStates.to_base)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="📊 Во все системы (2-36)", callback_data="base_all")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        f"""**Шаг 2 из 3:** Целевая система счисления
+
+Введите целевую систему счисления (куда преобразовать).
+
+💡 **Допустимый диапазон:** 2-36
+
+💡 **Примеры:**
+• `2` - в двоичную
+• `8` - в восьмеричную
+• `16` - в шестнадцатеричную
+• `10` - в десятичную
+• `2 8 16` - сразу в несколько систем одной таблицей
+
+Введите систему счисления:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(SystemsConversionStates.to_base))
+async def get_to_base(message: Message, state: FSMContext):
+    """Получение целевой системы счисления и выполнение преобразования"""
+    parts = (message.text or "").replace(',', ' ').split()
+    if len(parts) > 1:
+        if all(part.isdigit() and 2 <= int(part) <= 36 for part in parts):
+            await send_base_table(message, state, list(dict.fromkeys(map(int, parts))))
+            return
+        is_valid, msg = False, "Каждая система счисления должна быть целым числом от 2 до 36"
+    else:
+        is_valid, msg = validate_number(message.text, min_val=2, max_val=36)
+    if not is_valid:
+        error_msg = f"""
+❌ **Ошибка ввода: Целевая система счисления**
+
+{msg}
+
+💡 **Допустимый диапазон:** 2-36
+
+💡 **Примеры:**
+• `2` - двоичная
+• `8` - восьмеричная
+• `16` - шестнадцатеричная
+• `10` - десятичная
+
+Пожалуйста, введите систему счисления (2-36):
+"""
+        await message.answer(error_msg)
+        return
+    
+    to_base = int(message.text)
+    data = await state.get_data()
+    number = data.get("number")
+    from_base = data.get("from_base")
+    
+    try:
+        result, steps = await run_calculation(
+            convert_base, number, from_base, to_base, precision=BASE_FRACTION_PRECISION
+        )
+        steps_text = format_steps(steps)
+        
+        formatted_result = f"""
+🔄 **ПЕРЕВОД СИСТЕМ СЧИСЛЕНИЯ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходное число:** {number} ({from_base}-я система)
+
+{steps_text}
+
+**Результат:** `{result}` ({to_base}-я система)
+"""
+        
+    except ValueError as e:
+        await message.answer(f"""
+❌ **Ошибка ввода: Число `{number}`**
+
+{e}
+
+💡 **Пример корректного ввода:**
+`-1A.F` (16-я система) или `101.011` (2-я система)
+""")
+        await state.clear()
+        return
+    except CalculationTimeout:
+        raise  # Сообщение о превышении времени отправляет SessionMiddleware
+    except Exception as e:
+        await message.answer(f"❌ Ошибка при преобразовании: {str(e)}")
+        await state.clear()
+        return
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="base_conversion")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=formatted_result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+@router.callback_query(F.data == "base_all")
+async def handle_base_all(callback: CallbackQuery, state: FSMContext):
+    """Перевод введенного числа во все системы счисления 2-36"""
+    if await state.get_state() != SystemsConversionStates.to_base.state:
+        await callback.answer(ERROR_MESSAGES["invalid_choice"], show_alert=True)
+        return
+    
+    await callback.answer()
+    await send_base_table(callback.message, state, list(range(2, 37)))
+
+
+async def send_base_table(message: Message, state: FSMContext, bases: list):
+    """Перевод числа в несколько систем счисления и вывод одной таблицей"""
+    data = await state.get_data()
+    number = data.get("number")
+    from_base = data.get("from_base")
+    
+    try:
+        rows = await run_calculation(convert_to_bases, number, from_base, bases, precision=BASE_FRACTION_PRECISION)
+    except ValueError as e:
+        await message.answer(f"""
+❌ **Ошибка ввода: Число `{number}`**
+
+{e}
+
+💡 **Пример корректного ввода:**
+`-1A.F` (16-я система) или `101.011` (2-я система)
+""")
+        await state.clear()
+        return
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="base_conversion")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=format_base_table_result(number, from_base, rows),
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+@router.message(StateFilter(SystemsConversionStates.text))
+async def get_text_for_koi8(message: Message, state: FSMContext):
+    """Получение текста для кодирования КОИ-8"""
+    text = message.text
+    encoded_binary, steps = koi8_encode(text)
+    
+    steps_text = format_steps(steps, prefix="• ")
+    
+    result = f"""
+🔤 **КОДИРОВАНИЕ КОИ-8**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходный текст:** {text}
+
+**Шаги кодирования:**
+{steps_text}
+
+**Результат:** `{encoded_binary}`
+"""
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="koi8_coding")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+@router.message(StateFilter(SystemsConversionStates.binary))
+async def get_binary_for_operations(message: Message, state: FSMContext, session: SessionContext):
+    """Получение двоичной последовательности для различных операций"""
+    # Определить метод из состояния пользователя
+    method = session.user.current_method
+    
+    is_valid, msg = validate_binary(message.text)
+    if not is_valid:
+        await message.answer(f"❌ {msg}\n\nВведите двоичную последовательность:")
+        return
+    
+    binary_string = message.text
+    
+    if method == "koi8_decode":
+        if len(binary_string) % 8 != 0:
+            await message.answer(
+                "❌ Длина двоичной последовательности должна быть кратна 8.\n"
+                "Введите двоичную последовательность:"
+            )
+            return
+        
+        decoded_text, steps = koi8_decode(binary_string)
+        
+        steps_text = format_steps(steps, prefix="• ")
+        
+        result = f"""
+📝 **ДЕКОДИРОВАНИЕ КОИ-8**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходная последовательность:** `{binary_string}`
+
+**Шаги декодирования:**
+{steps_text}
+
+**Результат:** {printable_text(decoded_text)}
+"""
+        
+        keyboard = [
+            [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="koi8_decode")],
+            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        await message.answer(
+            text=result,
+            reply_markup=reply_markup
+        )
+        
+        await state.clear()
+        
+    elif method in ("block_parity", "block_parity_2d", "block_parity_2d_decode"):
+        await state.update_data(binary=binary_string, parity_mode=method)
+        await state.set_state(SystemsConversionStates.block_size)
+        keyboard = [
+            [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        await message.answer(
+            """**Шаг 2 из 2:** Размер блока
+
+Введите размер блока для разбиения последовательности.
+
+💡 **Примеры:**
+• `8` - стандартный размер (1 байт)
+• `4` - для 4-битных блоков
+• `16` - для 16-битных блоков
+
+💡 **По умолчанию:** 8 (можно оставить пустым)
+
+Введите размер блока:""",
+            reply_markup=reply_markup
+        )
+
+
+@router.message(StateFilter(SystemsConversionStates.block_size))
+async def get_block_size(message: Message, state: FSMContext):
+    """Получение размера блока и выполнение блочного кодирования"""
+    if message.text.strip() == "":
+        block_size = 8
+    else:
+        is_valid, msg = validate_number(message.text, min_val=1)
+        if not is_valid:
+            error_msg = f"""
+❌ **Ошибка ввода: Размер блока**
+
+{msg}
+
+💡 **Пример корректного ввода:**
+`8` или `4`
+
+Пожалуйста, введите размер блока (целое число, не меньше 1):
+"""
+            await message.answer(error_msg)
+            return
+        block_size = int(message.text)
+    
+    data = await state.get_data()
+    binary_string = data.get("binary")
+    parity_mode = data.get("parity_mode", "block_parity")
+    
+    if parity_mode == "block_parity_2d":
+        try:
+            blocks, padding = await run_calculation(block_parity_2d_encode, binary_string, block_size)
+        except ValueError as e:
+            await message.answer(f"❌ {str(e)}\n\nВведите размер блока:")
+            return
+        result = format_block_parity_2d_result(
+            len(binary_string), block_size, blocks, padding, blocks_to_bits(blocks)
+        )
+    elif parity_mode == "block_parity_2d_decode":
+        try:
+            corrected, error_rows, error_cols, status = await run_calculation(
+                block_parity_2d_decode, binary_string, block_size
+            )
+        except ValueError as e:
+            await message.answer(f"❌ {str(e)}\n\nВведите размер блока:")
+            return
+        result = format_block_parity_2d_decode_result(
+            block_size, error_rows, error_cols, status, block_parity_2d_data(corrected)
+        )
+    else:
+        results = block_parity_encode(binary_string, block_size)
+        
+        # Подробно выводятся только первые блоки, для остальных — сводка
+        preview_limit = 10
+        blocks_text = []
+        for i, (block, ones_count, parity_bit, encoded_block) in enumerate(results[:preview_limit], 1):
+            blocks_text.append(
+                f"**Блок {i}:**\n"
+                f"  Исходный: `{block}`\n"
+                f"  Количество единиц: {ones_count}\n"
+                f"  Бит четности: `{parity_bit}`\n"
+                f"  Результат: `{encoded_block}`"
+            )
+        if len(results) > preview_limit:
+            odd_blocks = sum(parity_bit.value for _, _, parity_bit, _ in results)
+            blocks_text.append(
+                f"... (еще блоков: {len(results) - preview_limit})\n"
+                f"**Всего блоков:** {len(results)}, с битом четности 1: {odd_blocks}"
+            )
+        
+        result = f"""
+📦 **БЛОЧНОЕ КОДИРОВАНИЕ С КОНТРОЛЕМ ЧЕТНОСТИ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходная последовательность:** `{binary_string}`
+**Размер блока:** {block_size}
+
+{chr(10).join(blocks_text)}
+"""
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="block_parity")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+# ========== КОДИРОВАНИЕ ЗВУКА ==========
+
+@router.callback_query(F.data == "sound_coding")
+async def handle_sound_coding(callback: CallbackQuery, state: FSMContext):
+    """Обработчик выбора раздела 'Кодирование звука'"""
+    keyboard = [
+        [InlineKeyboardButton(text="[V] 📁 Объём файла", callback_data="calc_volume")],
+        [InlineKeyboardButton(text="[F] 🔊 Частота дискретизации", callback_data="calc_frequency")],
+        [InlineKeyboardButton(text="[B] 💾 Глубина кодирования", callback_data="calc_depth")],
+        [InlineKeyboardButton(text="[T] ⏱️ Длительность", callback_data="calc_duration")],
+        [InlineKeyboardButton(text="[C] 🎧 Каналы", callback_data="calc_channels")],
+        [InlineKeyboardButton(text="📊 Таблица по диапазонам", callback_data="sound_sweep")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+🔊 **КОДИРОВАНИЕ ЗВУКА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**📐 ОСНОВНАЯ ФОРМУЛА:**
+
+`V = F * (B/8) * T * C`
+
+Где:
+• V - объём (байты)
+• F - частота дискретизации (Гц)
+• B - глубина кодирования (биты)
+• T - время (секунды)
+• C - количество каналов (1-моно, 2-стерео)
+
+**🔊 ЧТО ВЫЧИСЛЯЕМ?**
+
+Выберите параметр для вычисления:
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+# Обработчики выбора параметра для вычисления
+@router.callback_query(F.data.startswith("calc_"))
+async def handle_calc_param(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик выбора параметра для вычисления"""
+    
+    param_map = {
+        "calc_volume": ("volume", "📁 Объём файла (V)", "V = F * (B/8) * T * C"),
+        "calc_frequency": ("frequency", "🔊 Частота дискретизации (F)", "F = V / [(B/8) * T * C]"),
+        "calc_depth": ("depth", "💾 Глубина кодирования (B)", "B = (V * 8) / (F * T * C)"),
+        "calc_duration": ("duration", "⏱️ Длительность (T)", "T = V / [F * (B/8) * C]"),
+        "calc_channels": ("channels", "🎧 Каналы (C)", "C = V / [F * (B/8) * T]")
+    }
+    
+    param_key, param_name, formula = param_map[callback.data]
+    session.user.current_method = param_key
+    
+    # Инициализация параметров
+    await state.update_data(
+        target_param=param_key,
+        formula=formula,
+        volume=None,
+        frequency=None,
+        depth=None,
+        duration=None,
+        channels=None
+    )
+    
+    # Определить порядок ввода параметров (состояния хранятся по имени,
+    # чтобы данные FSM сериализовались в JSON)
+    param_order = []
+    if param_key != "volume":
+        param_order.append(("volume", "📁 Объём (V)", "байты", SoundCodingStates.input_volume.state))
+    if param_key != "frequency":
+        param_order.append(("frequency", "🔊 Частота (F)", "Гц", SoundCodingStates.input_frequency.state))
+    if param_key != "depth":
+        param_order.append(("depth", "💾 Глубина (B)", "биты", SoundCodingStates.input_depth.state))
+    if param_key != "duration":
+        param_order.append(("duration", "⏱️ Длительность (T)", "секунды", SoundCodingStates.input_duration.state))
+    if param_key != "channels":
+        param_order.append(("channels", "🎧 Каналы (C)", "1 или 2", SoundCodingStates.input_channels.state))
+    
+    await state.update_data(param_order=param_order, current_param_idx=0)
+    
+    # Начать ввод первого параметра
+    if param_order:
+        first_param = param_order[0]
+        await state.set_state(first_param[3])
+        
+        keyboard = [
+            [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_coding"),
+             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        message = f"""
+🔊 **ВЫЧИСЛЯЕМ: {param_name.upper()}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**Формула:** `{formula}`
+
+**Шаг 1 из {len(param_order)}:** {first_param[1]}
+
+Введите значение {first_param[1]} ({first_param[2]}).
+
+💡 Введите положительное число (не 0)
+
+Введите значение:
+"""
+        
+        await callback.message.edit_text(
+            text=message,
+            reply_markup=reply_markup
+        )
+
+
+@router.callback_query(F.data == "sound_sweep")
+async def handle_sound_sweep(callback: CallbackQuery, state: FSMContext):
+    """Обработчик выбора вычисляемого параметра для таблицы"""
+    keyboard = [
+        [InlineKeyboardButton(text=letter, callback_data=f"sweep_{key}") for key, letter in SOUND_PARAMETERS.items()],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        text="""
+📊 **ТАБЛИЦА ПО ДИАПАЗОНАМ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Бот вычислит параметр для всех сочетаний значений остальных параметров.
+
+Выберите вычисляемый параметр:
+""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.startswith("sweep_"))
+async def handle_sweep_target(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик выбора параметра и запрос диапазонов"""
+    
+    target = callback.data[len("sweep_"):]
+    if target not in SOUND_PARAMETERS:
+        await callback.answer(ERROR_MESSAGES["invalid_input"], show_alert=True)
+        return
+    
+    session.user.current_method = "sound_sweep"
+    await state.update_data(sweep_target=target)
+    await state.set_state(SoundCodingStates.sweep)
+    
+    example = {
+        "volume": "F=22050,44100,48000\nB=8,16,24\nC=1,2\nT=60-3600:60",
+        "frequency": "V=1000000,5000000\nB=8,16\nT=10-60:10\nC=1,2",
+        "depth": "V=1000000,5000000\nF=22050,44100\nT=10-60:10\nC=1,2",
+        "duration": "V=1000000-10000000:1000000\nF=44100,48000\nB=16,24\nC=1,2",
+        "channels": "V=5292000\nF=22050,44100\nB=8,16\nT=60,120",
+    }[target]
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_sweep"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        text=f"""
+📊 **ВЫЧИСЛЯЕМ: {SOUND_PARAMETERS[target]}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Отправьте одним сообщением значения остальных параметров, по строке на параметр:
+• список: `B=8,16,24`
+• диапазон: `T=60-3600:60` (от 60 до 3600 с шагом 60)
+
+Единицы: V - байты, F - Гц, B - биты, T - секунды, C - каналы.
+
+💡 **Пример:**
+`{example}`
+""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(SoundCodingStates.sweep))
+async def get_sweep_spec(message: Message, state: FSMContext):
+    """Получение диапазонов и расчет таблицы"""
+    data = await state.get_data()
+    target = data.get("sweep_target", "volume")
+    
+    try:
+        spec = await run_calculation(parse_sweep_spec, message.text or "", target)
+        names, columns, result = await run_calculation(audio_sweep, target, **spec)
+    except ValueError as e:
+        await message.answer(f"❌ {str(e)}\n\nВведите диапазоны параметров:")
+        return
+    
+    text = format_audio_sweep_result(target, names, columns, result)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новая таблица", callback_data="sound_sweep")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=text,
+        reply_markup=reply_markup
+    )
+    
+    if len(result) > 30:
+        csv_text = await run_calculation(sweep_to_csv, target, names, columns, result)
+        await message.answer_document(
+            BufferedInputFile(csv_text.encode("utf-8"), filename=f"sound_{SOUND_PARAMETERS[target]}.csv")
+        )
+    
+    await state.clear()
+
+
+# Универсальный обработчик для ввода параметров звука
+async def handle_audio_param_input(message: Message, state: FSMContext, param_key: str, param_name: str, param_unit: str):
+    """Универсальный обработчик ввода параметра звука"""
+    # Валидация ввода
+    try:
+        value = float(message.text.strip())
+        if value < 0:
+            await message.answer(f"❌ Ошибка: значение не может быть отрицательным. Введите положительное число:")
+            return
+        if value == 0:
+            await message.answer(f"❌ Ошибка: значение не может быть равно 0. Пожалуйста, введите положительное число:")
+            return
+    except ValueError:
+        await message.answer(f"❌ Ошибка: введите число:")
+        return
+    
+    # Сохранить значение параметра (включая 0)
+    data = await state.get_data()
+    await state.update_data(**{param_key: value})
+    
+    # Получить порядок параметров
+    param_order = data.get("param_order", [])
+    current_idx = data.get("current_param_idx", 0)
+    
+    # Перейти к следующему параметру
+    current_idx += 1
+    
+    if current_idx < len(param_order):
+        # Есть еще параметры для ввода
+        next_param = param_order[current_idx]
+        await state.update_data(current_param_idx=current_idx)
+        await state.set_state(next_param[3])
+        
+        keyboard = [
+            [InlineKeyboardButton(text="🔙 Назад", callback_data="sound_coding"),
+             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        await message.answer(
+            f"✅ {param_name}: {value}\n\n"
+            f"**Шаг {current_idx + 1} из {len(param_order)}:** {next_param[1]}\n\n"
+            f"Введите значение {next_param[1]} ({next_param[2]}).\n\n"
+            f"💡 Введите положительное число (не 0)",
+            reply_markup=reply_markup
+        )
+    else:
+        # Все параметры введены, выполнить расчет
+        await message.answer(f"✅ {param_name}: {value}\n\nВыполняю расчет...")
+        await calculate_audio_result(message, state)
+
+
+@router.message(StateFilter(SoundCodingStates.input_volume))
+async def get_input_volume(message: Message, state: FSMContext):
+    """Ввод объёма"""
+    await handle_audio_param_input(message, state, "volume", "📁 Объём (V)", "байты")
+
+
+@router.message(StateFilter(SoundCodingStates.input_frequency))
+async def get_input_frequency(message: Message, state: FSMContext):
+    """Ввод частоты"""
+    await handle_audio_param_input(message, state, "frequency", "🔊 Частота (F)", "Гц")
+
+
+@router.message(StateFilter(SoundCodingStates.input_depth))
+async def get_input_depth(message: Message, state: FSMContext):
+    """Ввод глубины"""
+    await handle_audio_param_input(message, state, "depth", "💾 Глубина (B)", "биты")
+
+
+@router.message(StateFilter(SoundCodingStates.input_duration))
+async def get_input_duration(message: Message, state: FSMContext):
+    """Ввод длительности"""
+    await handle_audio_param_input(message, state, "duration", "⏱️ Длительность (T)", "секунды")
+
+
+@router.message(StateFilter(SoundCodingStates.input_channels))
+async def get_input_channels(message: Message, state: FSMContext):
+    """Ввод каналов"""
+    await handle_audio_param_input(message, state, "channels", "🎧 Каналы (C)", "1 или 2")
+
+
+async def calculate_audio_result(message: Message, state: FSMContext):
+    """Выполнение расчета после ввода всех параметров"""
+    data = await state.get_data()
+    target_param = data.get("target_param")
+    
+    # Получить все параметры
+    params = {
+        'volume': data.get('volume'),
+        'frequency': data.get('frequency'),
+        'depth': data.get('depth'),
+        'duration': data.get('duration'),
+        'channels': data.get('channels')
+    }
+    
+    # Проверить, что все необходимые параметры введены
+    required = {'volume', 'frequency', 'depth', 'duration', 'channels'} - {target_param}
+    missing = [k for k in required if params[k] is None]
+    
+    if missing:
+        missing_names = {
+            'volume': 'V (объём)',
+            'frequency': 'F (частота)',
+            'depth': 'B (глубина)',
+            'duration': 'T (длительность)',
+            'channels': 'C (каналы)'
+        }
+        missing_list = ', '.join([missing_names[m] for m in missing])
+        await message.answer(
+            f"❌ **Не хватает параметров:** {missing_list}\n\n"
+            f"Пожалуйста, введите все необходимые параметры."
+        )
+        return
+    
+    # Выполнение расчета
+    try:
+        if target_param == "volume":
+            result_value = calculate_audio_size(
+                params['frequency'], params['depth'],
+                params['duration'], params['channels']
+            )
+            total_bytes, kb, mb = result_value
+            result_text = f"""
+📁 **РАСЧЕТ ОБЪЁМА ФАЙЛА**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Входные данные:**
+• Частота: {params['frequency']} Гц
+• Глубина: {params['depth']} бит
+• Длительность: {params['duration']} сек
+• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
+
+**Расчет:**
+V = {params['frequency']} * ({params['depth']}/8) * {params['duration']} * {params['channels']}
+V = {params['frequency']} * {params['depth']/8} * {params['duration']} * {params['channels']}
+V = {total_bytes} байт
+
+**Результат:**
+• {total_bytes} байт
+• {kb:.2f} КБ
+• {mb:.2f} МБ
+"""
+        elif target_param == "frequency":
+            result_value = calculate_frequency(
+                params['volume'], params['depth'],
+                params['duration'], params['channels']
+            )
+            result_text = f"""
+🔊 **РАСЧЕТ ЧАСТОТЫ ДИСКРЕТИЗАЦИИ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Входные данные:**
+• Объём: {params['volume']} байт
+• Глубина: {params['depth']} бит
+• Длительность: {params['duration']} сек
+• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
+
+**Расчет:**
+F = {params['volume']} / [({params['depth']}/8) * {params['duration']} * {params['channels']}]
+F = {params['volume']} / [{params['depth']/8} * {params['duration']} * {params['channels']}]
+F = {result_value:.2f} Гц
+
+**Результат:** {result_value:.2f} Гц
+"""
+        elif target_param == "depth":
+            result_value = calculate_depth(
+                params['volume'], params['frequency'],
+                params['duration'], params['channels']
+            )
+            result_text = f"""
+💾 **РАСЧЕТ ГЛУБИНЫ КОДИРОВАНИЯ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Входные данные:**
+• Объём: {params['volume']} байт
+• Частота: {params['frequency']} Гц
+• Длительность: {params['duration']} сек
+• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
+
+**Расчет:**
+B = ({params['volume']} * 8) / ({params['frequency']} * {params['duration']} * {params['channels']})
+B = {params['volume']*8} / ({params['frequency']} * {params['duration']} * {params['channels']})
+B = {result_value:.2f} бит
+
+**Результат:** {result_value:.2f} бит
+"""
+        elif target_param == "duration":
+            result_value = calculate_duration(
+                params['volume'], params['frequency'],
+                params['depth'], params['channels']
+            )
+            result_text = f"""
+⏱️ **РАСЧЕТ ДЛИТЕЛЬНОСТИ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Входные данные:**
+• Объём: {params['volume']} байт
+• Частота: {params['frequency']} Гц
+• Глубина: {params['depth']} бит
+• Каналы: {params['channels']} ({'стерео' if params['channels'] == 2 else 'моно'})
+
+**Расчет:**
+T = {params['volume']} / [{params['frequency']} * ({params['depth']}/8) * {params['channels']}]
+T = {params['volume']} / [{params['frequency']} * {params['depth']/8} * {params['channels']}]
+T = {result_value:.2f} сек
+
+**Результат:** {result_value:.2f} сек ({result_value/60:.2f} мин)
+"""
+        elif target_param == "channels":
+            result_value = calculate_channels(
+                params['volume'], params['frequency'],
+                params['depth'], params['duration']
+            )
+            result_text = f"""
+🎧 **РАСЧЕТ КОЛИЧЕСТВА КАНАЛОВ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Входные данные:**
+• Объём: {params['volume']} байт
+• Частота: {params['frequency']} Гц
+• Глубина: {params['depth']} бит
+• Длительность: {params['duration']} сек
+
+**Расчет:**
+C = {params['volume']} / [{params['frequency']} * ({params['depth']}/8) * {params['duration']}]
+C = {params['volume']} / [{params['frequency']} * {params['depth']/8} * {params['duration']}]
+C = {result_value:.2f}
+
+**Результат:** {result_value:.2f} ({'стерео' if abs(result_value - 2) < 0.1 else 'моно' if abs(result_value - 1) < 0.1 else 'нестандартное значение'})
+"""
+        else:
+            await message.answer(ERROR_MESSAGES["invalid_choice"])
+            await state.clear()
+            return
+        
+        keyboard = [
+            [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="sound_coding")],
+            [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        await message.answer(
+            text=result_text,
+            reply_markup=reply_markup
+        )
+        
+        await state.clear()
+        
+    except ZeroDivisionError:
+        await message.answer("❌ Ошибка: деление на ноль. Проверьте введенные значения.")
+        await state.clear()
+    except Exception as e:
+        await message.answer(f"❌ Ошибка при расчете: {str(e)}")
+        await state.clear()
+
+
+# ========== QR-КОДИРОВАНИЕ ==========
+
+@router.callback_query(F.data == "qr_coding")
+async def handle_qr_coding(callback: CallbackQuery):
+    """Обработчик выбора раздела 'QR-кодирование'"""
+    keyboard = [
+        [InlineKeyboardButton(text="🔢 Цифровое кодирование", callback_data="qr_numeric")],
+        [InlineKeyboardButton(text="🎭 Цифровое с маской", callback_data="qr_numeric_mask")],
+        [InlineKeyboardButton(text="🧩 Полный поток QR (с коррекцией ошибок)", callback_data="qr_full")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+🔲 **QR-КОДИРОВАНИЕ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите тип кодирования:
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "qr_numeric")
+async def handle_qr_numeric(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик цифрового QR-кодирования"""
+    session.user.current_method = "qr_numeric"
+    await state.update_data(method="qr_numeric")
+    await state.set_state(QRStates.input)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """🔢 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите цифры для кодирования.
+
+💡 **Примеры:**
+• `123456789` - длинное число
+• `42` - короткое число
+• `100` - три цифры
+
+Введите значение:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "qr_numeric_mask")
+async def handle_qr_numeric_mask(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик цифрового QR-кодирования с маской"""
+    session.user.current_method = "qr_numeric_mask"
+    await state.update_data(method="qr_numeric_mask")
+    await state.set_state(QRStates.input)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        """🎭 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ С МАСКОЙ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+**Шаг 1 из 2:** Введите число для кодирования
+
+💡 **Примеры:**
+• `123456789`
+• `42`
+• `100`
+
+Введите число:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data == "qr_full")
+async def handle_qr_full(callback: CallbackQuery):
+    """Обработчик выбора уровня коррекции для полного потока QR"""
+    keyboard = [
+        [InlineKeyboardButton(text=f"{level}", callback_data=f"qr_full_{level}") for level in QR_LEVELS],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+🧩 **ПОЛНЫЙ ПОТОК ДАННЫХ QR**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите уровень коррекции ошибок:
+• **L** - восстанавливается ~7% данных
+• **M** - ~15%
+• **Q** - ~25%
+• **H** - ~30%
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.in_([f"qr_full_{level}" for level in QR_LEVELS]))
+async def handle_qr_full_level(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик полного кодирования QR с выбранным уровнем коррекции"""
+    level = callback.data.rsplit("_", 1)[1]
+    session.user.current_method = "qr_full"
+    await state.update_data(method="qr_full", level=level)
+    await state.set_state(QRStates.input)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_full"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await callback.message.edit_text(
+        f"""🧩 **ПОЛНЫЙ ПОТОК ДАННЫХ QR (уровень {level})**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите цифры или текст из символов 0-9, A-Z, пробела и $%*+-./:
+
+💡 **Примеры:**
+• `01234567` - цифровой режим
+• `HELLO WORLD` - буквенно-цифровой режим
+
+Введите данные:""",
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(QRStates.input))
+async def get_qr_input(message: Message, state: FSMContext):
+    """Получение входных данных и выполнение QR-кодирования"""
+    data = await state.get_data()
+    method = data.get("method")
+    input_text = message.text
+    
+    if method == "qr_numeric":
+        is_valid, msg = validate_digits(input_text)
+        if not is_valid:
+            error_msg = f"""
+❌ **Ошибка ввода: Цифры**
+
+{msg}
+
+💡 **Пример корректного ввода:**
+`123456789` или `42`
+
+Пожалуйста, введите только цифры:
+"""
+            await message.answer(error_msg)
+            return
+        
+        encoded_bits, steps = numeric_qr_encode(input_text)
+        result = format_qr_numeric_result(input_text, encoded_bits, steps)
+        
+    elif method == "qr_full":
+        level = data.get("level", "M")
+        try:
+            codewords, version, mode, steps = qr_encode(input_text, level)
+        except ValueError as e:
+            await message.answer(f"❌ {str(e)}\n\nВведите данные:")
+            return
+        best_mask, penalties, _ = qr_best_mask(codewords, version, level)
+        result = format_qr_full_result(
+            input_text, level, version, mode, codewords, steps, best_mask, penalties
+        )
+        
+    elif method == "qr_numeric_mask":
+        is_valid, msg = validate_digits(input_text)
+        if not is_valid:
+            error_msg = f"""
+❌ **Ошибка ввода: Число**
+
+{msg}
+
+💡 **Пример корректного ввода:**
+`123456789` или `42`
+
+Пожалуйста, введите число:
+"""
+            await message.answer(error_msg)
+            return
+        
+        # Сохранить число и запросить маску
+        await state.update_data(digits=input_text)
+        await state.set_state(QRStates.mask)
+        
+        keyboard = [
+            [InlineKeyboardButton(text="🔙 Назад", callback_data="qr_coding"),
+             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+        ]
+        reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+        
+        await message.answer(
+            """**Шаг 2 из 2:** Введите маску
+
+Введите двоичную последовательность (маску) для наложения.
+
+💡 **Примеры:**
+• `1010` - простая маска
+• `11110000` - маска из 8 бит
+• `1` - единичная маска
+
+Введите маску:""",
+            reply_markup=reply_markup
+        )
+        return
+        
+    else:
+        await message.answer(ERROR_MESSAGES["invalid_choice"])
+        await state.clear()
+        return
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+@router.message(StateFilter(QRStates.mask))
+async def get_qr_mask(message: Message, state: FSMContext):
+    """Получение маски и выполнение QR-кодирования с маской"""
+    is_valid, msg = validate_binary(message.text)
+    if not is_valid:
+        error_msg = f"""
+❌ **Ошибка ввода: Маска**
+
+{msg}
+
+💡 **Пример корректного ввода:**
+`1010` или `11110000`
+
+Пожалуйста, введите двоичную последовательность (только 0 и 1):
+"""
+        await message.answer(error_msg)
+        return
+    
+    mask = message.text
+    data = await state.get_data()
+    digits = data.get("digits")
+    
+    # Выполнить кодирование с маской
+    encoded_bits, masked_bits, steps = numeric_qr_encode_with_mask(digits, mask)
+    
+    steps_text = "\n".join(steps)
+    
+    result = f"""
+🎭 **ЦИФРОВОЕ QR-КОДИРОВАНИЕ С МАСКОЙ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+**Исходные данные:**
+• Число: {digits}
+• Маска: `{mask}`
+
+{steps_text}
+
+**Итоговый результат:**
+• Двоичный: `{masked_bits}`
+• Десятичный: `{int(masked_bits)}`
+"""
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="systems_conversion")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+# ========== ШТРИХ-КОДИРОВАНИЕ ==========
+
+@router.callback_query(F.data == "barcode")
+async def handle_barcode(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик выбора раздела 'Штрих-кодирование'"""
+    
+    session.user.current_method = "ean13"
+    await state.set_state(BarcodeStates.digits)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="📦 Пакетная проверка кодов", callback_data="barcode_batch")],
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="systems_conversion"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+📊 **ШТРИХ-КОДИРОВАНИЕ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Введите первые 12 цифр для расчета EAN-13 (например, 460123456789):
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(BarcodeStates.digits))
+async def get_ean13_digits(message: Message, state: FSMContext):
+    """Получение цифр и расчет EAN-13"""
+    is_valid, msg = validate_digits(message.text)
+    if not is_valid:
+        error_msg = f"""
+❌ **Ошибка ввода: Цифры**
+
+{msg}
+
+💡 **Пример корректного ввода:**
+`460123456789` (ровно 12 цифр)
+
+Пожалуйста, введите 12 цифр:
+"""
+        await message.answer(error_msg)
+        return
+    
+    if len(message.text) != 12:
+        error_msg = f"""
+❌ **Ошибка ввода: Длина**
+
+Введено {len(message.text)} цифр, требуется ровно 12.
+
+💡 **Пример корректного ввода:**
+`460123456789` (ровно 12 цифр)
+
+Пожалуйста, введите ровно 12 цифр:
+"""
+        await message.answer(error_msg)
+        return
+    
+    first_12 = message.text
+    
+    try:
+        checksum, even_sum, odd_sum, total = ean13_checksum(first_12)
+        full_code = first_12 + str(checksum)
+        
+        result = format_ean13_result(first_12, even_sum, odd_sum, total, checksum, full_code)
+        
+    except Exception as e:
+        await message.answer(f"❌ Ошибка при расчете: {str(e)}")
+        return
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый расчет", callback_data="barcode")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
+
+
+@router.callback_query(F.data == "barcode_batch")
+async def handle_barcode_batch(callback: CallbackQuery, state: FSMContext):
+    """Обработчик выбора символики для пакетной проверки"""
+    await state.clear()
+    
+    keyboard = [
+        [InlineKeyboardButton(text=f"✅ {name}", callback_data=f"barcode_batch_check_{name}"),
+         InlineKeyboardButton(text=f"➕ {name}", callback_data=f"barcode_batch_complete_{name}")]
+        for name in BARCODE_SYMBOLOGIES
+    ]
+    keyboard.append([
+        InlineKeyboardButton(text="🔙 Назад", callback_data="barcode"),
+        InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
+    ])
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = """
+📦 **ПАКЕТНАЯ ПРОВЕРКА ШТРИХ-КОДОВ**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Выберите символику и действие:
+• ✅ - проверить полные коды
+• ➕ - рассчитать контрольные цифры для кодов без них
+
+GTIN принимает коды длиной 8, 12, 13 и 14 цифр.
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.callback_query(F.data.startswith("barcode_batch_"))
+async def handle_barcode_batch_mode(callback: CallbackQuery, state: FSMContext, session: SessionContext):
+    """Обработчик выбора символики и действия для пакета"""
+    
+    action, symbology = callback.data[len("barcode_batch_"):].split("_", 1)
+    if symbology not in BARCODE_SYMBOLOGIES:
+        await callback.answer(ERROR_MESSAGES["invalid_input"], show_alert=True)
+        return
+    complete = action == "complete"
+    
+    session.user.current_method = "barcode_batch"
+    await state.update_data(symbology=symbology, complete=complete)
+    await state.set_state(BarcodeStates.batch)
+    
+    lengths = ', '.join(str(length - complete) for length in BARCODE_SYMBOLOGIES[symbology])
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="barcode_batch"),
+         InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    message = f"""
+📦 **{'РАСЧЕТ КОНТРОЛЬНЫХ ЦИФР' if complete else 'ПРОВЕРКА КОДОВ'} {symbology}**
+
+⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
+
+Отправьте коды по одному в строке или текстовый файл.
+Длина кода: {lengths} цифр.
+"""
+    
+    await callback.message.edit_text(
+        text=message,
+        reply_markup=reply_markup
+    )
+
+
+@router.message(StateFilter(BarcodeStates.batch))
+async def get_barcode_batch(message: Message, state: FSMContext):
+    """Получение списка кодов (сообщение или файл) и пакетная проверка"""
+    data = await state.get_data()
+    symbology = data.get("symbology", "EAN-13")
+    complete = data.get("complete", False)
+    
+    if message.document:
+        source = await message.bot.download(message.document)
+    elif message.text:
+        source = message.text
+    else:
+        await message.answer("❌ Отправьте коды текстом или текстовым файлом:")
+        return
+    
+    preview, check_digits, status = await run_calculation(check_barcode_batch, source, symbology, complete)
+    summary = barcode_batch_summary(status)
+    
+    result = format_barcode_batch_result(symbology, complete, preview, check_digits, status, summary)
+    
+    keyboard = [
+        [InlineKeyboardButton(text="🔄 Новый пакет", callback_data="barcode_batch")],
+        [InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")]
+    ]
+    reply_markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    
+    await message.answer(
+        text=result,
+        reply_markup=reply_markup
+    )
+    
+    await state.clear()
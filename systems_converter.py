@@ -1,57 +1,485 @@
-"""Модуль преобразования систем счисления"""
-
-
-def convert_base(number, from_base, to_base):
-    """
-    Перевод числа из одной системы счисления в другую
-    
-    Args:
-        number: Число для преобразования (строка)
-        from_base: Исходная система счисления (2-36)
-        to_base: Целевая система счисления (2-36)
-        
-    Returns:
-        tuple: (result, steps) - результат и список шагов
-    """
-    steps = []
-    
-    # Преобразовать в десятичную систему
-    if from_base != 10:
-        decimal_value = 0
-        steps.append(f"Преобразование из {from_base}-й системы в 10-ю:")
-        for i, digit in enumerate(reversed(str(number))):
-            digit_value = int(digit, from_base)
-            power = from_base ** i
-            decimal_value += digit_value * power
-            steps.append(f"  {digit} × {from_base}^{i} = {digit_value} × {power} = {digit_value * power}")
-        steps.append(f"  Итого: {decimal_value}")
-    else:
-        decimal_value = int(number)
-        steps.append(f"Исходное число в 10-й системе: {decimal_value}")
-    
-    # Преобразовать из десятичной в целевую систему
-    if to_base == 10:
-        return str(decimal_value), steps
-    
-    steps.append(f"\nПреобразование из 10-й системы в {to_base}-ю:")
-    result = ""
-    n = decimal_value
-    
-    if n == 0:
-        return "0", steps
-    
-    step_num = 0
-    while n > 0:
-        remainder = n % to_base
-        if remainder < 10:
-            digit = str(remainder)
-        else:
-            digit = chr(55 + remainder)  # A-Z для 10-35
-        result = digit + result
-        steps.append(f"  {n} ÷ {to_base} = {n // to_base} (остаток {remainder} → '{digit}')")
-        n //= to_base
-        step_num += 1
-    
-    steps.append(f"  Результат: {result}")
-    return result, steps
-
+"""Модуль преобразования систем счисления"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+from calculators.steps import LazySteps
+
+# Алфавит цифр для систем счисления 2-36
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Начиная с этой длины числа используется быстрый алгоритм «разделяй и властвуй»,
+# а список шагов заменяется сводкой
+LARGE_NUMBER_DIGITS = 64
+
+# Наибольшее количество дробных разрядов при поиске периода (ограничивает память)
+FRACTION_DIGITS_LIMIT = 1024
+
+# Количество дробных разрядов результата convert_base по умолчанию
+FRACTION_PRECISION = 20
+
+# Размер «листа» рекурсии: части короче 2^_LEAF_LEVEL цифр обрабатываются напрямую
+_LEAF_LEVEL = 5
+
+
+def _check_digits(digits, base):
+    """Проверка, что строка состоит из допустимых цифр системы счисления"""
+    if not set(digits.upper()) <= set(DIGITS[:base]):
+        raise ValueError(f"Недопустимая цифра для {base}-й системы счисления")
+
+
+def split_number(number, base):
+    """
+    Разбор записи числа на знак, целую и дробную части с проверкой цифр
+    
+    Args:
+        number: Запись числа ("-1A.F", "101.011", "+7")
+        base: Система счисления (2-36)
+        
+    Returns:
+        tuple: (negative, integer_part, fraction_part) - знак и строки цифр частей
+    """
+    number = str(number).strip()
+    negative = number.startswith('-')
+    digits = number[1:] if number[:1] in '+-' else number
+    integer_part, _, fraction_part = digits.replace(',', '.').partition('.')
+    if not integer_part and not fraction_part:
+        raise ValueError("Число не содержит цифр")
+    _check_digits(integer_part + fraction_part, base)
+    return negative, integer_part, fraction_part
+
+
+def convert_base(number, from_base, to_base, precision=FRACTION_PRECISION, with_steps=True):
+    """
+    Перевод числа из одной системы счисления в другую
+    
+    Поддерживаются знак и дробная часть ("-1A.F", "101.011"). Целая часть
+    переводится встроенным int(s, base), дробная — точно через рациональное
+    число: не более precision разрядов, период выделяется скобками.
+    
+    Args:
+        number: Число для преобразования (строка)
+        from_base: Исходная система счисления (2-36)
+        to_base: Целевая система счисления (2-36)
+        precision: Наибольшее количество дробных разрядов результата
+        with_steps: Формировать пошаговое решение
+        
+    Returns:
+        tuple: (result, steps) - результат и ленивая последовательность шагов (LazySteps или None)
+    """
+    negative, integer_part, fraction_part = split_number(number, from_base)
+    
+    if len(integer_part) > LARGE_NUMBER_DIGITS:
+        result, integer_steps = _convert_base_large(integer_part, from_base, to_base)
+    else:
+        result, integer_steps = _convert_integer(integer_part or "0", from_base, to_base)
+    
+    fraction = None
+    if fraction_part:
+        fraction = Fraction(parse_digits(fraction_part, from_base), from_base ** len(fraction_part))
+        _, _, preperiod, period, truncated = fraction_expansion(fraction, to_base, precision)
+        if preperiod or period:
+            result += '.' + preperiod + (f"({period})" if period else "") + ('…' if truncated else '')
+    
+    if negative and result.strip('0.'):
+        result = '-' + result
+    
+    if not with_steps:
+        return result, None
+    if not negative and fraction is None:
+        return result, integer_steps
+    
+    total = None
+    if integer_steps.total is not None and fraction is None:
+        total = integer_steps.total + 1
+    steps = LazySteps(_signed_fraction_steps, negative, integer_steps, fraction_part, fraction,
+                      from_base, to_base, precision, result, total=total)
+    return result, steps
+
+
+def _signed_fraction_steps(negative, integer_steps, fraction_part, fraction, from_base, to_base, precision, result):
+    """Генератор шагов перевода числа со знаком и дробной частью"""
+    if negative:
+        yield "Знак '-' переводится отдельно и переносится в результат"
+    if fraction is not None:
+        yield "Целая часть:"
+    yield from integer_steps
+    if fraction is None:
+        return
+    
+    yield f"\nДробная часть: 0.{_abbreviate(fraction_part)} ({from_base}-я система) = {_ratio_text(fraction.numerator, fraction.denominator)}"
+    yield f"Умножение остатка на {to_base} (не более {precision} разрядов):"
+    yield from _fraction_digit_steps(fraction.numerator, fraction.denominator, to_base, precision)
+    yield f"  Результат: {result}"
+
+
+def _convert_integer(number, from_base, to_base):
+    """Перевод целого неотрицательного числа через десятичную систему"""
+    decimal_value = int(number, from_base)
+    
+    # Преобразовать из десятичной в целевую систему
+    if to_base == 10:
+        result = str(decimal_value)
+    elif decimal_value == 0:
+        result = "0"
+    else:
+        result = _small_to_digits(decimal_value, to_base)
+    
+    total = len(number) + 2 if from_base != 10 else 1
+    if to_base != 10:
+        total += 1 if decimal_value == 0 else len(result) + 2
+    
+    steps = LazySteps(_convert_base_steps, number, from_base, to_base, decimal_value, result, total=total)
+    return result, steps
+
+
+def _convert_base_steps(number, from_base, to_base, decimal_value, result):
+    """Генератор шагов перевода числа через десятичную систему"""
+    if from_base != 10:
+        accumulated = 0
+        yield f"Преобразование из {from_base}-й системы в 10-ю:"
+        power = 1
+        for i, digit in enumerate(reversed(number)):
+            digit_value = int(digit, from_base)
+            accumulated += digit_value * power
+            yield f"  {digit} × {from_base}^{i} = {digit_value} × {power} = {digit_value * power}"
+            power *= from_base
+        yield f"  Итого: {accumulated}"
+    else:
+        yield f"Исходное число в 10-й системе: {decimal_value}"
+    
+    if to_base == 10:
+        return
+    
+    yield f"\nПреобразование из 10-й системы в {to_base}-ю:"
+    if decimal_value == 0:
+        return
+    
+    n = decimal_value
+    while n > 0:
+        n, remainder = divmod(n, to_base)
+        yield f"  {n * to_base + remainder} ÷ {to_base} = {n} (остаток {remainder} → '{DIGITS[remainder]}')"
+    
+    yield f"  Результат: {result}"
+
+
+# ========== БЫСТРЫЙ ПЕРЕВОД БОЛЬШИХ ЧИСЕЛ ==========
+
+
+@lru_cache(maxsize=256)
+def _base_power(base, level):
+    """Степень base^(2^level), вычисляется возведением в квадрат и кэшируется"""
+    if level == 0:
+        return base
+    return _base_power(base, level - 1) ** 2
+
+
+def parse_digits(digits, base):
+    """
+    Перевод строки цифр в целое число методом «разделяй и властвуй»
+    
+    Строка делится на старшую и младшую части, младшая часть имеет длину 2^k,
+    и результат собирается как high × base^(2^k) + low.
+    
+    Args:
+        digits: Строка цифр (без знака)
+        base: Система счисления (2-36)
+        
+    Returns:
+        int: Значение числа
+    """
+    length = len(digits)
+    if length <= 1 << _LEAF_LEVEL:
+        return int(digits, base)
+    
+    level = (length - 1).bit_length() - 1
+    split = 1 << level
+    high = parse_digits(digits[:-split], base)
+    low = parse_digits(digits[-split:], base)
+    return high * _base_power(base, level) + low
+
+
+def _small_to_digits(value, base):
+    """Перевод небольшого неотрицательного числа в строку цифр"""
+    if value == 0:
+        return ""
+    chars = []
+    while value:
+        value, remainder = divmod(value, base)
+        chars.append(DIGITS[remainder])
+    return ''.join(reversed(chars))
+
+
+def _to_digits(value, base, level, width):
+    """Перевод числа value < base^(2^(level+1)) с дополнением нулями до width"""
+    if level < _LEAF_LEVEL:
+        text = _small_to_digits(value, base)
+        return text.zfill(width) if width else text
+    
+    half = 1 << level
+    high, low = divmod(value, _base_power(base, level))
+    if high == 0 and not width:
+        return _to_digits(low, base, level - 1, 0)
+    high_text = _to_digits(high, base, level - 1, max(width - half, 0))
+    return high_text + _to_digits(low, base, level - 1, half)
+
+
+def format_digits(value, base):
+    """
+    Перевод неотрицательного целого числа в строку цифр методом «разделяй и властвуй»
+    
+    Args:
+        value: Неотрицательное целое число
+        base: Целевая система счисления (2-36)
+        
+    Returns:
+        str: Запись числа в системе base
+    """
+    if value == 0:
+        return "0"
+    
+    level = 0
+    while _base_power(base, level + 1) <= value:
+        level += 1
+    return _to_digits(value, base, level, 0)
+
+
+def _abbreviate(text, keep=20):
+    """Сократить длинную запись числа до начала и конца"""
+    if len(text) <= 2 * keep:
+        return text
+    return f"{text[:keep]}…{text[-keep:]} ({len(text)} цифр)"
+
+
+def _ratio_text(numerator, denominator):
+    """Запись дроби numerator/denominator с сокращением длинных чисел"""
+    numerator_text = _abbreviate(integer_digits(numerator, 10))
+    if denominator == 1:
+        return numerator_text
+    return f"{numerator_text}/{_abbreviate(integer_digits(denominator, 10))}"
+
+
+def _convert_base_large(number, from_base, to_base):
+    """Перевод длинного числа со сводкой вместо пошаговой записи"""
+    decimal_value = parse_digits(number, from_base)
+    if from_base == to_base == 10:
+        result = number.lstrip('0') or '0'
+    else:
+        result = format_digits(decimal_value, to_base)
+    
+    total = (4 if from_base != 10 else 1) + (0 if to_base == 10 else 3)
+    steps = LazySteps(_convert_base_large_steps, number, from_base, to_base, decimal_value, result, total=total)
+    return result, steps
+
+
+def _convert_base_large_steps(number, from_base, to_base, decimal_value, result):
+    """Генератор сводки шагов для длинного числа"""
+    if from_base == 10:
+        decimal_text = number.lstrip('0') or '0'
+    elif to_base == 10:
+        decimal_text = result
+    else:
+        decimal_text = format_digits(decimal_value, 10)
+    
+    if from_base != 10:
+        yield f"Преобразование из {from_base}-й системы в 10-ю:"
+        yield f"  Число содержит {len(number)} цифр — пошаговая запись сокращена"
+        yield f"  Сумма цифр × {from_base}^i вычисляется по частям: старшая часть × {from_base}^(2^k) + младшая часть"
+        yield f"  Итого: {_abbreviate(decimal_text)}"
+    else:
+        yield f"Исходное число в 10-й системе: {_abbreviate(decimal_text)}"
+    
+    if to_base == 10:
+        return
+    
+    yield f"\nПреобразование из 10-й системы в {to_base}-ю:"
+    yield f"  Последовательное деление на {to_base} заменено делением на степени {to_base}^(2^k)"
+    yield f"  Результат: {_abbreviate(result)}"
+
+
+# ========== ТОЧНОЕ РАЗЛОЖЕНИЕ ДРОБЕЙ ==========
+
+
+def to_fraction(number):
+    """
+    Точное рациональное значение числа
+    
+    Строки ("0.3", "-12.375", "1/3") и float разбираются как десятичная запись,
+    поэтому 0.1 остается ровно 1/10, а не двоичным приближением float.
+    
+    Args:
+        number: Строка, int, float или Fraction
+        
+    Returns:
+        Fraction: Точное значение
+    """
+    if isinstance(number, float):
+        number = repr(number)
+    if isinstance(number, str):
+        number = number.strip().replace(',', '.')
+    return Fraction(number)
+
+
+def fraction_expansion(number, base=2, limit=FRACTION_DIGITS_LIMIT):
+    """
+    Точная запись дроби в системе счисления с выделением периода
+    
+    Дробная часть переводится умножением остатка на base; каждый остаток
+    запоминается вместе с позицией цифры, и повторный остаток сразу дает
+    начало и длину периода. Время и память пропорциональны длине
+    предпериода и периода, но не больше limit разрядов.
+    
+    Args:
+        number: Число (строка, int, float или Fraction)
+        base: Система счисления (2-36)
+        limit: Наибольшее количество дробных разрядов
+        
+    Returns:
+        tuple: (negative, integer_digits, preperiod, period, truncated) - знак, целая часть,
+            непериодическая и периодическая части дроби, признак обрыва по limit
+    """
+    value = to_fraction(number)
+    negative = value < 0
+    numerator, denominator = abs(value.numerator), value.denominator
+    integer, remainder = divmod(numerator, denominator)
+    
+    positions = {}
+    digits = []
+    while remainder and remainder not in positions and len(digits) < limit:
+        positions[remainder] = len(digits)
+        digit, remainder = divmod(remainder * base, denominator)
+        digits.append(DIGITS[digit])
+    
+    fraction_digits = ''.join(digits)
+    if remainder in positions:
+        start = positions[remainder]
+        return negative, format_digits(integer, base), fraction_digits[:start], fraction_digits[start:], False
+    return negative, format_digits(integer, base), fraction_digits, "", bool(remainder)
+
+
+def expansion_text(expansion):
+    """
+    Запись разложения: период в скобках, оборванная запись с многоточием
+    
+    Args:
+        expansion: Результат fraction_expansion
+        
+    Returns:
+        str: Например "0.0(0011)", "-1100.011" или "0.0101…"
+    """
+    negative, integer_digits, preperiod, period, truncated = expansion
+    text = ('-' if negative else '') + integer_digits
+    if preperiod or period:
+        text += '.' + preperiod + (f"({period})" if period else "")
+    return text + ('…' if truncated else '')
+
+
+def fraction_expansion_steps(number, base=2, limit=FRACTION_DIGITS_LIMIT):
+    """
+    Ленивые шаги перевода дробной части с отслеживанием остатков
+    
+    Args:
+        number: Число (строка, int, float или Fraction)
+        base: Система счисления (2-36)
+        limit: Наибольшее количество дробных разрядов
+        
+    Returns:
+        LazySteps: Шаги вида "r/q × base = digit + r'/q"
+    """
+    return LazySteps(_fraction_expansion_steps, to_fraction(number), base, limit)
+
+
+def _fraction_expansion_steps(value, base, limit):
+    """Генератор шагов точного перевода дробной части"""
+    numerator, denominator = abs(value.numerator), value.denominator
+    integer, remainder = divmod(numerator, denominator)
+    integer_text = _abbreviate(integer_digits(integer, 10))
+    yield f"Точное значение: {'-' if value < 0 else ''}{integer_text} + {_ratio_text(remainder, denominator)}"
+    yield f"Целая часть: {integer_text} → {_abbreviate(format_digits(integer, base))}"
+    if remainder:
+        yield from _fraction_digit_steps(remainder, denominator, base, limit)
+
+
+def _fraction_digit_steps(remainder, denominator, base, limit):
+    """Генератор шагов получения дробных разрядов с поиском повторного остатка"""
+    positions = {}
+    position = 0
+    while remainder and position < limit:
+        if remainder in positions:
+            yield (f"  Остаток {_ratio_text(remainder, denominator)} уже встречался перед разрядом {positions[remainder] + 1} "
+                   f"→ период длины {position - positions[remainder]}")
+            return
+        positions[remainder] = position
+        digit, next_remainder = divmod(remainder * base, denominator)
+        position += 1
+        yield (f"  Разряд {position}: {_ratio_text(remainder, denominator)} × {base} = {digit} + "
+               f"{_ratio_text(next_remainder, denominator)} → '{DIGITS[digit]}'")
+        remainder = next_remainder
+    
+    if remainder:
+        yield f"  Достигнут предел {limit} разрядов — запись оборвана"
+    else:
+        yield "  Остаток равен нулю — дробь конечна"
+
+
+# ========== ПЕРЕВОД В НЕСКОЛЬКО СИСТЕМ ==========
+
+# Наибольшая битовая длина, для которой str(int) не упирается в ограничение
+# Python 3.11+ на 4300 десятичных цифр (2^14000 < 10^4300)
+_STR_SAFE_BITS = 14000
+
+
+def integer_digits(value, base):
+    """
+    Запись неотрицательного целого числа в системе base
+    
+    Для 2, 8 и 16 используется встроенное форматирование, для 10 — str
+    (если число не превышает ограничение Python на длину записи), для остальных
+    систем — format_digits с кэшированными степенями base^(2^k).
+    
+    Args:
+        value: Неотрицательное целое число
+        base: Система счисления (2-36)
+        
+    Returns:
+        str: Запись числа
+    """
+    if base == 10 and value.bit_length() <= _STR_SAFE_BITS:
+        return str(value)
+    if base in (2, 8, 16):
+        return format(value, {2: 'b', 8: 'o', 16: 'X'}[base])
+    return format_digits(value, base)
+
+
+def convert_to_bases(number, from_base, to_bases=None, precision=FRACTION_PRECISION):
+    """
+    Перевод одного числа сразу в несколько систем счисления
+    
+    Запись разбирается один раз, все результаты строятся из общего целого
+    значения и общей дроби; степени каждой целевой системы кэшируются
+    между вызовами.
+    
+    Args:
+        number: Число для преобразования (строка, допускаются знак и дробная часть)
+        from_base: Исходная система счисления (2-36)
+        to_bases: Целевые системы (по умолчанию все от 2 до 36)
+        precision: Наибольшее количество дробных разрядов результата
+        
+    Returns:
+        list: Пары (base, result) в порядке to_bases
+    """
+    negative, integer_part, fraction_part = split_number(number, from_base)
+    value = parse_digits(integer_part, from_base) if integer_part else 0
+    fraction = None
+    if fraction_part.strip('0'):
+        fraction = Fraction(parse_digits(fraction_part, from_base), from_base ** len(fraction_part))
+    sign = '-' if negative and (value or fraction) else ''
+    
+    results = []
+    for base in to_bases or range(2, 37):
+        result = sign + integer_digits(value, base)
+        if fraction is not None:
+            _, _, preperiod, period, truncated = fraction_expansion(fraction, base, precision)
+            result += '.' + preperiod + (f"({period})" if period else "") + ('…' if truncated else '')
+        results.append((base, result))
+    return results
@@ -0,0 +1,156 @@
+"""Запуск бота в режиме webhook на веб-сервере aiohttp"""
+
+import asyncio
+
+from aiohttp import web
+from aiogram.loggers import event as event_logger
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+
+from config import (
+    WEBHOOK_HOST, WEBHOOK_PORT, WEBHOOK_PATH, WEBHOOK_URL, WEBHOOK_SECRET, WEBHOOK_MAX_CONCURRENCY
+)
+
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+
+class BoundedRequestHandler(SimpleRequestHandler):
+    """
+    Обработчик запросов Telegram с ограничением одновременной обработки
+
+    Заголовок X-Telegram-Bot-Api-Secret-Token сверяется с secret_token
+    (при несовпадении — ответ 401). Обновление передается диспетчеру в
+    фоновой задаче, и Telegram сразу получает ответ 200. Одновременно
+    обрабатывается не более max_concurrency обновлений: при заполнении
+    пула ответ на запрос задерживается до освобождения места, и Telegram
+    сам снижает темп отправки.
+    """
+
+    def __init__(self, dispatcher, bot, secret_token=WEBHOOK_SECRET,
+                 max_concurrency=WEBHOOK_MAX_CONCURRENCY, **data):
+        """
+        Args:
+            dispatcher: Диспетчер aiogram
+            bot: Экземпляр бота
+            secret_token: Секретный токен webhook (пустой — без проверки, только для локальной отладки)
+            max_concurrency: Наибольшее количество одновременно обрабатываемых обновлений
+        """
+        super().__init__(dispatcher, bot, handle_in_background=True,
+                         secret_token=secret_token or None, **data)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.received = 0
+        self.rejected = 0
+        self.failed = 0
+
+    async def handle(self, request):
+        response = await super().handle(request)
+        if response.status == 401:
+            self.rejected += 1
+        return response
+
+    async def _handle_request_background(self, bot, request):
+        try:
+            update = await request.json(loads=bot.session.json_loads)
+        except ValueError:
+            return web.Response(body="Bad Request", status=400)
+
+        await self._semaphore.acquire()
+        self.received += 1
+        task = asyncio.create_task(self._background_feed_update(bot=bot, update=update))
+        self._background_feed_update_tasks.add(task)
+        task.add_done_callback(self._release)
+        return web.json_response({}, dumps=bot.session.json_dumps)
+
+    def _release(self, task):
+        """Освобождение места в пуле после обработки обновления"""
+        self._background_feed_update_tasks.discard(task)
+        self._semaphore.release()
+        if not task.cancelled() and task.exception() is not None:
+            self.failed += 1
+            event_logger.error("Ошибка обработки обновления", exc_info=task.exception())
+
+    async def close(self):
+        """Ожидание обрабатываемых обновлений и закрытие сессии бота"""
+        if self._background_feed_update_tasks:
+            await asyncio.gather(*self._background_feed_update_tasks, return_exceptions=True)
+        await super().close()
+
+    def gauges(self):
+        """
+        Показатели обработки обновлений
+
+        Returns:
+            dict: in_flight, max_concurrency, received, rejected, failed
+        """
+        return {
+            "in_flight": len(self._background_feed_update_tasks),
+            "max_concurrency": self.max_concurrency,
+            "received": self.received,
+            "rejected": self.rejected,
+            "failed": self.failed,
+        }
+
+
+def create_app(dp, bot, url=WEBHOOK_URL, secret=WEBHOOK_SECRET):
+    """
+    Создание веб-приложения aiohttp с маршрутом webhook
+
+    Запуск и остановка приложения вызывают события startup/shutdown
+    диспетчера (в том числе закрытие хранилища FSM). Если задан url,
+    при запуске webhook регистрируется в Telegram, и секретный токен
+    обязателен. Без url сервер принимает обновления только локально
+    (например, записанные JSON через curl), и секрет можно не задавать.
+
+    Args:
+        dp: Диспетчер aiogram
+        bot: Экземпляр бота
+        url: Внешний адрес сервера (WEBHOOK_URL)
+        secret: Секретный токен webhook (WEBHOOK_SECRET)
+
+    Returns:
+        web.Application: Приложение aiohttp
+
+    Raises:
+        ValueError: Задан url, но не задан secret
+    """
+    if url and not secret:
+        raise ValueError(
+            "WEBHOOK_SECRET обязателен при заданном WEBHOOK_URL: без него любой может "
+            "отправлять боту поддельные обновления"
+        )
+
+    app = web.Application()
+    handler = BoundedRequestHandler(dp, bot, secret_token=secret)
+    handler.register(app, path=WEBHOOK_PATH)
+    app["webhook_handler"] = handler
+
+    if url:
+        async def on_startup(bot):
+            await bot.set_webhook(
+                url.rstrip("/") + WEBHOOK_PATH,
+                secret_token=secret,
+                allowed_updates=ALLOWED_UPDATES,
+            )
+        dp.startup.register(on_startup)
+
+    setup_application(app, dp, bot=bot)
+    return app
+
+
+async def run_webhook(dp, bot):
+    """
+    Запуск веб-сервера webhook на WEBHOOK_HOST:WEBHOOK_PORT до отмены задачи
+
+    Args:
+        dp: Диспетчер aiogram
+        bot: Экземпляр бота
+    """
+    runner = web.AppRunner(create_app(dp, bot))
+    await runner.setup()
+    site = web.TCPSite(runner, WEBHOOK_HOST, WEBHOOK_PORT)
+    await site.start()
+    print(f"Webhook принимает обновления на http://{WEBHOOK_HOST}:{WEBHOOK_PORT}{WEBHOOK_PATH}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()